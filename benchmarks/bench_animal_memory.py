@@ -0,0 +1,69 @@
+"""
+Benchmark: memory per animal for a large population.
+
+Allocates N animals of the four species with the slotted classes and with
+a dict-based reference layout (the previous representation: a per-instance
+__dict__ that also stores width and height), and reports bytes per animal
+for each, measured with tracemalloc.
+
+    python benchmarks/bench_animal_memory.py
+    python benchmarks/bench_animal_memory.py --animals 100000
+"""
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+_root = Path(__file__).resolve().parent.parent
+if _root not in sys.path and (_root / "src").exists():
+    sys.path.insert(0, str(_root / "src"))
+
+from aquarium import moly, ocypode, scalar, shrimp
+
+
+def _dict_based(cls):
+    """Subclass without __slots__ that keeps width/height per instance, like the old layout."""
+    def __init__(self, *args):
+        cls.__init__(self, *args)
+        self.width = cls.width
+        self.height = cls.height
+    return type(f"Dict{cls.__name__}", (cls,), {"__init__": __init__})
+
+
+def _make(species, count: int) -> list:
+    out = []
+    for i in range(count):
+        cls = species[i % 4]
+        if i % 4 < 2:
+            out.append(cls(f"f{i}", 1, i % 500, 5, i % 2, 0))
+        else:
+            out.append(cls(f"c{i}", 1, i % 500, 20, i % 2))
+    return out
+
+
+def bytes_per_animal(species, count: int) -> float:
+    """Average allocated bytes per animal (names and the holding list included)."""
+    gc.collect()
+    tracemalloc.start()
+    animals = _make(species, count)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del animals
+    return used / count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--animals", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    slotted = (scalar.Scalar, moly.Moly, ocypode.Ocypode, shrimp.Shrimp)
+    layouts = (("dict-based", tuple(_dict_based(cls) for cls in slotted)), ("slotted", slotted))
+    print(f"{'layout':>10}  {'animals':>9}  {'bytes/animal':>12}")
+    for label, species in layouts:
+        print(f"{label:>10}  {args.animals:>9}  {bytes_per_animal(species, args.animals):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
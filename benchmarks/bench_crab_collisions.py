@@ -0,0 +1,65 @@
+"""
+Benchmark: per-turn time of Aqua.next_turn as the crab count grows.
+
+Crabs are packed along the floor of a wide tank with a one-column gap and
+alternating directions, so most of them bump into a neighbour every few
+turns and is_collision is exercised on every move.
+
+    python benchmarks/bench_crab_collisions.py
+    python benchmarks/bench_crab_collisions.py --max-crabs 10000 --turns 20
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+_root = Path(__file__).resolve().parent.parent
+if _root not in sys.path and (_root / "src").exists():
+    sys.path.insert(0, str(_root / "src"))
+
+from aquarium import Aqua
+from aquarium.config import MAX_CRAB_WIDTH, MIN_TANK_HEIGHT
+from aquarium.events import EventBus
+
+_SLOT = MAX_CRAB_WIDTH + 1
+
+
+def build_tank(crabs: int, vectorized: bool = False) -> Aqua:
+    aq = Aqua(crabs * _SLOT + 2 + _SLOT, MIN_TANK_HEIGHT, vectorized=vectorized, events=EventBus())
+    aq.add_many({"type": ["oc" if i % 2 else "sh" for i in range(crabs)],
+                 "name": [f"c{i}" for i in range(crabs)],
+                 "x": [1 + i * _SLOT for i in range(crabs)],
+                 "directionH": [i % 2 for i in range(crabs)]})
+    for a in aq.get_all_animal():
+        a.food = 10 ** 9
+    return aq
+
+
+def time_turns(aq: Aqua, turns: int) -> float:
+    """Seconds per turn, averaged over ``turns`` turns."""
+    start = time.perf_counter()
+    for _ in range(turns):
+        aq.next_turn()
+    aq.get_board()
+    elapsed = time.perf_counter() - start
+    return elapsed / turns
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-crabs", type=int, default=100_000)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--vectorized", action="store_true", help="use the NumPy engine")
+    args = parser.parse_args(argv)
+
+    print(f"{'crabs':>8}  {'tank width':>10}  {'ms/turn':>10}  {'us/crab':>8}")
+    crabs = 10
+    while crabs <= args.max_crabs:
+        aq = build_tank(crabs, args.vectorized)
+        per_turn = time_turns(aq, args.turns)
+        print(f"{crabs:>8}  {aq.aqua_width:>10}  {per_turn * 1e3:>10.3f}  {per_turn / crabs * 1e6:>8.2f}")
+        crabs *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+pytest-benchmark suite for the simulation hot paths (not part of the default test run).
+
+    pytest benchmarks --benchmark-autosave              # store a baseline under .benchmarks/
+    pytest benchmarks --benchmark-compare               # compare with the latest baseline and fail
+                                                        # if a mean regresses by more than the threshold
+    pytest benchmarks --benchmark-compare --regression-threshold 5
+
+The threshold (percent) defaults to AQUARIUM_BENCH_THRESHOLD or 10. An explicit
+--benchmark-compare-fail takes precedence.
+"""
+import os
+import sys
+from pathlib import Path
+
+_root = Path(__file__).resolve().parent.parent
+if _root not in sys.path and (_root / "src").exists():
+    sys.path.insert(0, str(_root / "src"))
+
+try:
+    from pytest_benchmark.utils import parse_compare_fail
+except ImportError:  # pytest-benchmark is a dev extra; without it there is nothing to run
+    parse_compare_fail = None
+    collect_ignore_glob = ["test_*.py"]
+
+DEFAULT_THRESHOLD = float(os.environ.get("AQUARIUM_BENCH_THRESHOLD", "10"))
+
+
+def pytest_addoption(parser):
+    parser.addoption("--regression-threshold", type=float, default=DEFAULT_THRESHOLD, metavar="PCT",
+                     help="with --benchmark-compare, fail when a benchmark's mean is PCT%% slower than the baseline")
+
+
+def pytest_configure(config):
+    if parse_compare_fail is None or not getattr(config.option, "benchmark_compare", None):
+        return
+    if not config.option.benchmark_compare_fail:
+        threshold = config.getoption("--regression-threshold")
+        config.option.benchmark_compare_fail = [parse_compare_fail(f"mean:{threshold:g}%")]
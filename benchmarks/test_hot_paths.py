@@ -0,0 +1,78 @@
+"""Benchmarks of next_turn, placement checks, rendering, seeding and feeding (see conftest.py)."""
+import os
+from contextlib import redirect_stdout
+
+import pytest
+
+from aquarium import Aqua
+from aquarium.events import EventBus
+
+# Turns per benchmark round are few and food is plentiful, so nobody dies while measuring.
+_ROUNDS = 30
+
+MIXES = {
+    "mixed": ("sc", "mo", "oc", "sh"),
+    "fish-only": ("sc", "mo"),
+    "crab-heavy": ("oc", "sh", "oc", "sh", "sc"),
+}
+
+
+def build_tank(width: int, height: int, animals: int, mix: str = "mixed") -> Aqua:
+    codes = MIXES[mix]
+    aq = Aqua(width, height, events=EventBus())
+    aq.add_many({"type": [codes[i % len(codes)] for i in range(animals)],
+                 "directionH": [i % 2 for i in range(animals)],
+                 "directionV": [i // 2 % 2 for i in range(animals)]})
+    for a in aq.get_all_animal():
+        a.food = 10 ** 9
+    return aq
+
+
+@pytest.mark.parametrize("width,height,animals", [(60, 30, 20), (200, 40, 200), (1000, 60, 2000)])
+def test_next_turn(benchmark, width, height, animals):
+    aq = build_tank(width, height, animals)
+    benchmark.pedantic(aq.next_turn, rounds=_ROUNDS, warmup_rounds=2)
+
+
+@pytest.mark.parametrize("mix", ["fish-only", "crab-heavy"])
+def test_next_turn_mix(benchmark, mix):
+    aq = build_tank(1000, 40, 1000, mix)
+    benchmark.pedantic(aq.next_turn, rounds=_ROUNDS, warmup_rounds=2)
+
+
+def test_check_if_free(benchmark):
+    aq = build_tank(400, 40, 400)
+    spots = [(x, y) for y in range(3, 30, 3) for x in range(1, 390, 7)]
+
+    def probe():
+        for x, y in spots:
+            aq.check_if_free(x, y)
+    benchmark(probe)
+
+
+def test_get_display_lines(benchmark):
+    aq = build_tank(400, 40, 400)
+    benchmark(aq.get_display_lines)
+
+
+def test_print_board(benchmark):
+    aq = build_tank(400, 40, 400)
+    with open(os.devnull, "w") as null, redirect_stdout(null):
+        benchmark(aq.print_board)
+
+
+def test_add_animal_seeding(benchmark):
+    def seed():
+        aq = Aqua(400, 40, events=EventBus())
+        for i in range(300):
+            aq.add_animal(f"a{i}", 1, 1 + (i * 13) % 380, 3 + (i * 7) % 25, i % 2, i % 2, MIXES["mixed"][i % 4])
+    benchmark.pedantic(seed, rounds=5)
+
+
+def test_add_many_seeding(benchmark):
+    benchmark.pedantic(build_tank, args=(400, 40, 300), rounds=5)
+
+
+def test_feed_all(benchmark):
+    aq = build_tank(1000, 60, 2000)
+    benchmark(aq.feed_all)
@@ -1,6 +1,7 @@
+import argparse
+import json
 import random
 import sys
-import time
 from pathlib import Path
 
 # Allow running from repo root without pip install
@@ -9,11 +10,12 @@ if _root not in sys.path and (_root / "src").exists():
     sys.path.insert(0, str(_root / "src"))
 
 from aquarium import Aqua, WATERLINE
+from aquarium.batch import parse_population, run_batch
 from aquarium.config import (
-    ANIMAL_TYPES,
     DEMO_FEED_INTERVAL,
     DEMO_SLEEP_SECONDS,
     DEMO_TOTAL_STEPS,
+    DISPLAY_FPS,
     FEED_AMOUNT,
     MAX_AGE_INPUT,
     MIN_AGE_INPUT,
@@ -24,7 +26,12 @@ from aquarium.config import (
     WATERLINE,
     fish_lowest_y,
 )
+from aquarium.events import CONSOLE_KINDS, RingBufferSink, format_event
+from aquarium.live import run_live
 from aquarium.placement import run_placement
+from aquarium.replay import ReplayLog
+from aquarium.runner import SWEEPABLE, TankConfig, run_tanks, seeded, sweep
+from aquarium.species import SPECIES, load_entry_points
 from aquarium.terminal_io import (
     KEY_DOWN,
     KEY_ENTER,
@@ -34,9 +41,9 @@ from aquarium.terminal_io import (
     clear_screen,
     flush_stdin,
     get_key,
-    try_get_key,
 )
 from aquarium.utils import valid_num_check
+from aquarium.viewport import Viewport
 
 # Random demo: name pool and count range
 _DEMO_NAMES = (
@@ -45,7 +52,11 @@ _DEMO_NAMES = (
 )
 _DEMO_MIN_ANIMALS = 2
 _DEMO_MAX_ANIMALS = 6
-_DEMO_PLACEMENT_ATTEMPTS = 15
+# Simulation messages (aging, deaths) kept under the board while animating.
+_FRAME_MESSAGE_LINES = 3
+# Footer lines under the board: a blank line, the messages, a blank line and the status line.
+_FRAME_FOOTER_LINES = _FRAME_MESSAGE_LINES + 3
+_VIEW_KEYS_HINT = "Arrows scroll, F follows the next animal, -/+ zoom, C colours."
 
 
 def _parse_horizontal(s: str) -> int | None:
@@ -165,7 +176,7 @@ def _random_demo_animals(myaqua):
     """Generate random animals and add them to the aquarium."""
     aq_w, aq_h = myaqua.aqua_width, myaqua.aqua_height
     fish_bottom = fish_lowest_y(aq_h)
-    codes = ["sc", "mo", "oc", "sh"]
+    codes = list(SPECIES)
     # Valid x for all (crab/fish width up to 8)
     x_min, x_max = 1, max(1, aq_w - 8 - 1)
     names_used = set()
@@ -183,80 +194,105 @@ def _random_demo_animals(myaqua):
         return f"Animal{random.randint(1, 999)}"
 
     n = random.randint(_DEMO_MIN_ANIMALS, _DEMO_MAX_ANIMALS)
-    added = 0
-    for _ in range(n * 3):  # allow retries
-        if added >= n:
-            break
+    columns = {"type": [], "name": [], "age": [], "x": [], "y": [], "directionH": [], "directionV": []}
+    for _ in range(n):
         code = random.choice(codes)
-        name = pick_name()
-        age = random.randint(1, 20)
-        dir_h = random.randint(0, 1)
-        dir_v = random.randint(0, 1) if code in ("sc", "mo") else 0
-        x = random.randint(x_min, x_max) if x_max >= x_min else x_min
-        if code in ("sc", "mo"):
+        is_fish = SPECIES[code].is_fish
+        columns["type"].append(code)
+        columns["name"].append(pick_name())
+        columns["age"].append(random.randint(1, 20))
+        columns["directionH"].append(random.randint(0, 1))
+        columns["directionV"].append(random.randint(0, 1) if is_fish else 0)
+        columns["x"].append(random.randint(x_min, x_max) if x_max >= x_min else x_min)
+        if is_fish:
             y_min = WATERLINE
             y_max = max(y_min, fish_bottom - 5)
-            y = random.randint(y_min, y_max) if y_max >= y_min else y_min
+            columns["y"].append(random.randint(y_min, y_max) if y_max >= y_min else y_min)
         else:
-            y = myaqua.aqua_height - 4
-        if myaqua.add_animal(name, age, x, y, dir_h, dir_v, code):
-            added += 1
+            columns["y"].append(myaqua.aqua_height - 4)
+    # Animals whose random spot is taken are moved to a free one rather than retried.
+    myaqua.add_many(columns, relocate=True)
+
+
+def _frame(myaqua, viewport: Viewport, status: str, messages) -> list[str]:
+    """
+    Display lines of the last published frame, as far as the viewport shows it, plus a
+    fixed-height footer (status line and recent messages). Called from the render thread
+    while turns are played, so it reads only the published frame, not the tank.
+    """
+    viewport.fit_terminal(_FRAME_FOOTER_LINES)
+    lines = myaqua.read_frame(lambda frame: frame.view_lines(viewport))
+    recent = []
+    for event in list(messages.events):
+        recent.extend((format_event(event) or "").splitlines())
+    recent = recent[-_FRAME_MESSAGE_LINES:]
+    recent += [""] * (_FRAME_MESSAGE_LINES - len(recent))
+    return lines + [""] + recent + ["", status]
+
+
+def _run_live(myaqua, viewport: Viewport, steps, step, frame, steps_per_second, fps) -> bool:
+    """
+    run_live with the tank publishing a frame after every turn for the render thread,
+    and the view keys moving ``viewport``. The view is kept on the followed animal from the
+    loop thread, between turns, since the render thread must not read the live tank.
+    """
+    def tracked_step(i):
+        step(i)
+        viewport.track(myaqua)
+
+    def on_key(key):
+        used = viewport.handle_key(key, myaqua)
+        viewport.track(myaqua)
+        return used
+
+    myaqua.publish_frames()
+    viewport.track(myaqua)
+    try:
+        return run_live(steps, tracked_step, frame, steps_per_second, fps, on_key=on_key)
+    finally:
+        myaqua.publish_frames(False)
 
 
-def demo(myaqua):
+def _step_quietly(myaqua, messages: RingBufferSink) -> None:
+    """Advance one turn, collecting its messages in ``messages`` instead of printing them."""
+    with myaqua.events.redirect(messages):
+        myaqua.next_turn()
+
+
+def demo(myaqua, steps_per_second: float = 1 / DEMO_SLEEP_SECONDS, fps: float = DISPLAY_FPS):
     myaqua.reset()
     _random_demo_animals(myaqua)
-    clear_screen()
-    myaqua.print_board()
-    print("\nDemo running. Press P to pause, Q to quit demo.\n")
-
-    for i in range(DEMO_TOTAL_STEPS):
-        key = try_get_key()
-        if key == "q":
-            print("Demo stopped.")
-            flush_stdin()
-            return
-        if key == "p":
-            flush_stdin()
-            print("  [Paused. Press P to resume.]")
-            while True:
-                time.sleep(0.1)
-                k = try_get_key()
-                if k == "p":
-                    flush_stdin()
-                    break
-                if k == "q":
-                    flush_stdin()
-                    print("Demo stopped.")
-                    return
-            clear_screen()
-            myaqua.print_board()
-            print("\nDemo running. Press P to pause, Q to quit demo.\n")
+    status = f"Demo running. Press P to pause, Q to quit demo. {_VIEW_KEYS_HINT}"
+    messages = RingBufferSink(_FRAME_MESSAGE_LINES, kinds=CONSOLE_KINDS)
+    viewport = Viewport.for_terminal(_FRAME_FOOTER_LINES)
 
+    def step(i):
         if i % DEMO_FEED_INTERVAL == 0:
             myaqua.feed_all()
-        myaqua.next_turn()
-        if i != DEMO_TOTAL_STEPS - 1:
-            clear_screen()
-            myaqua.print_board()
-            print("\nDemo running. Press P to pause, Q to quit demo.\n")
-        time.sleep(DEMO_SLEEP_SECONDS)
+        _step_quietly(myaqua, messages)
+
+    def frame(done, paused):
+        return _frame(myaqua, viewport, "[Paused. Press P to resume.]" if paused else status, messages)
+
+    if not _run_live(myaqua, viewport, DEMO_TOTAL_STEPS, step, frame, steps_per_second, fps):
+        print("Demo stopped.")
 
 
 def add_animal(myaqua):
     valid_int = False
     while not valid_int:
         print("\nPlease select:")
-        for idx, info in enumerate(ANIMAL_TYPES, start=1):
-            print(f"{idx}. {info.label}")
+        kinds = list(SPECIES.values())
+        for idx, kind in enumerate(kinds, start=1):
+            print(f"{idx}. {kind.label}")
         choice = input("What animal do you want to put in the aquarium?")
         choice = valid_num_check(choice)
-        if choice not in range(1, len(ANIMAL_TYPES) + 1):
+        if choice not in range(1, len(kinds) + 1):
             if choice:
                 print("\nPlease enter a valid number.\n")
             continue
         valid_int = True
-        selected = ANIMAL_TYPES[choice - 1]
+        selected = kinds[choice - 1]
 
     valid_name = False
     while not valid_name:
@@ -297,7 +333,7 @@ def add_animal(myaqua):
     return None
 
 
-def do_several_steps(myaqua):
+def do_several_steps(myaqua, steps_per_second: float = 1 / STEP_DELAY_SECONDS, fps: float = DISPLAY_FPS):
     """Run N steps and show each one (movement, collisions, feeding) with a short delay."""
     valid_input = False
     while not valid_input:
@@ -307,31 +343,20 @@ def do_several_steps(myaqua):
             continue
         valid_input = True
 
-    for i in range(num_of_steps):
-        key = try_get_key()
-        if key == "q":
-            print("Stopped early.")
-            flush_stdin()
-            return
-        if key == "p":
-            flush_stdin()
-            print("  [Paused. Press P to resume, Q to quit.]")
-            while True:
-                time.sleep(0.1)
-                k = try_get_key()
-                if k == "p":
-                    flush_stdin()
-                    break
-                if k == "q":
-                    flush_stdin()
-                    print("Stopped.")
-                    return
+    messages = RingBufferSink(_FRAME_MESSAGE_LINES, kinds=CONSOLE_KINDS)
+    viewport = Viewport.for_terminal(_FRAME_FOOTER_LINES)
 
-        myaqua.next_turn()
-        clear_screen()
-        myaqua.print_board()
-        print(f"\nStep {i + 1} of {num_of_steps}. P=pause, Q=quit\n")
-        time.sleep(STEP_DELAY_SECONDS)
+    def frame(done, paused):
+        if paused:
+            return _frame(myaqua, viewport, "[Paused. Press P to resume, Q to quit.]", messages)
+        return _frame(myaqua, viewport, f"Step {done} of {num_of_steps}. P=pause, Q=quit. {_VIEW_KEYS_HINT}",
+                      messages)
+
+    def step(i):
+        _step_quietly(myaqua, messages)
+
+    if not _run_live(myaqua, viewport, num_of_steps, step, frame, steps_per_second, fps):
+        print("Stopped early.")
 
 
 def main():
@@ -405,5 +430,104 @@ def main():
             print()
 
 
+def _parse_turn_list(s: str) -> list[int]:
+    """Parse '10,250,900' into [10, 250, 900]."""
+    return [int(t) for t in s.split(",") if t.strip()]
+
+
+def _parse_sweep(s: str) -> tuple[str, list]:
+    """Parse 'FEED_AMOUNT=5,10,20' into ('FEED_AMOUNT', [5, 10, 20])."""
+    name, sep, values = s.partition("=")
+    name = name.strip().upper()
+    if not sep or name not in SWEEPABLE:
+        raise argparse.ArgumentTypeError(f"expected NAME=V1,V2,... with NAME in {', '.join(SWEEPABLE)}")
+    return name, _parse_turn_list(values)
+
+
+def _parse_cli(argv=None):
+    parser = argparse.ArgumentParser(
+        description='The OOP Aquarium. Without --headless, starts the interactive menu.')
+    parser.add_argument("--headless", action="store_true",
+                        help="run a batch simulation without rendering, sleeping or prompts")
+    parser.add_argument("--width", type=int, default=MIN_TANK_WIDTH)
+    parser.add_argument("--height", type=int, default=MIN_TANK_HEIGHT)
+    parser.add_argument("--population", type=parse_population, default={},
+                        help="animals to place, e.g. sc=100,mo=50,oc=10,sh=10")
+    parser.add_argument("--turns", type=int, default=DEMO_TOTAL_STEPS)
+    parser.add_argument("--feed-every", type=int, default=0, metavar="N",
+                        help="feed all animals every N turns (0 = never)")
+    parser.add_argument("--feed-at", type=_parse_turn_list, default=[], metavar="T1,T2,...",
+                        help="also feed at these turns")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--vectorized", action="store_true", help="use the NumPy engine")
+    parser.add_argument("--stripes", type=int, default=0, metavar="N",
+                        help="split one wide tank into N column stripes stepped by worker processes (needs NumPy)")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    parser.add_argument("--profile", action="store_true",
+                        help="time the phases of every turn and add the measurements to the summary")
+    parser.add_argument("--record", metavar="LOG", help="write a replay log of the headless run to LOG")
+    parser.add_argument("--keyframe-every", type=int, default=1000, metavar="N",
+                        help="full snapshot in the replay log every N turns")
+    parser.add_argument("--replay", metavar="LOG", help="print the tank recorded in LOG at turn --at and exit")
+    parser.add_argument("--at", type=int, default=0, metavar="TURN", help="turn to show with --replay")
+    parser.add_argument("--tanks", type=int, default=1, metavar="N",
+                        help="run N independent tanks (per sweep point), seeds derived from --seed")
+    parser.add_argument("--sweep", type=_parse_sweep, action="append", default=[], metavar="NAME=V1,V2",
+                        help="run a tank set for each value of a simulation constant (repeatable)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes for --tanks/--sweep (default: one per CPU, 1 = no pool)")
+    args = parser.parse_args(argv)
+    if args.width < MIN_TANK_WIDTH or args.height < MIN_TANK_HEIGHT:
+        parser.error(f"tank must be at least {MIN_TANK_WIDTH}x{MIN_TANK_HEIGHT}")
+    return args
+
+
+def run_headless(args) -> None:
+    if args.tanks > 1 or args.sweep:
+        return run_headless_tanks(args)
+    summary = run_batch(args.width, args.height, args.population, args.turns,
+                        feed_every=args.feed_every, feed_at=args.feed_at,
+                        seed=args.seed, vectorized=args.vectorized, stripes=args.stripes,
+                        record=args.record, keyframe_every=args.keyframe_every, profile=args.profile)
+    if args.json:
+        print(json.dumps(summary.as_dict()))
+    else:
+        print(summary.format())
+
+
+def show_replay(args) -> None:
+    """Print the frame recorded in a replay log at a given turn."""
+    with ReplayLog(args.replay) as log:
+        if not log.first_turn <= args.at <= log.last_turn:
+            sys.exit(f"turn {args.at} is not in {args.replay} (turns {log.first_turn}..{log.last_turn})")
+        for line in log.render(args.at):
+            print(line)
+        print(f"\nTurn {args.at} of {log.first_turn}..{log.last_turn}")
+
+
+def run_headless_tanks(args) -> None:
+    """Run several tanks in parallel and print one line (or JSON record) per tank as they finish."""
+    base = TankConfig(args.width, args.height, args.population, args.turns, feed_every=args.feed_every,
+                      feed_at=tuple(args.feed_at), vectorized=args.vectorized)
+    configs = seeded(sweep(base, replicates=args.tanks, **dict(args.sweep)), args.seed)
+    for result in run_tanks(configs, workers=args.workers):
+        s = result.summary
+        if args.json:
+            print(json.dumps(result.as_dict()), flush=True)
+            continue
+        settings = " ".join(f"{name}={value}" for name, value in result.settings)
+        survivors = " ".join(f"{code}={n}" for code, n in s.survivors.items())
+        deaths = " ".join(f"{cause}={n}" for cause, n in s.deaths.items())
+        print(f"tank {result.index:>4}  seed {s.seed}  {settings}  survivors {survivors}  "
+              f"deaths {deaths}  {s.turns_per_second:.1f} turns/s", flush=True)
+
+
 if __name__ == "__main__":
-    main()
+    load_entry_points()
+    cli_args = _parse_cli()
+    if cli_args.replay:
+        show_replay(cli_args)
+    elif cli_args.headless:
+        run_headless(cli_args)
+    else:
+        main()
@@ -1,14 +1,26 @@
-from . import config
+from . import config, sprites
 
 
 class Animal:
+    # Per-instance state only; species-constant data (code, size, is_fish) lives on the class.
+    __slots__ = ("alive", "animal_id", "_food", "name", "_age", "x", "y", "directionH", "_hunger")
+
+    # Species code ("sc", "oc", ...) used to look up the sprite; set by concrete classes.
+    code = None
+    width = config.MAX_ANIMAL_WIDTH
+    height = config.MAX_ANIMAL_HEIGHT
+    is_fish = False
+
     def __init__(self, name, age, x, y, directionH):
         self.alive = True
-        self.width = config.MAX_ANIMAL_WIDTH
-        self.height = config.MAX_ANIMAL_HEIGHT
-        self.food = config.STARTING_FOOD
+        # Assigned by Aqua when the animal is added; 0 means "not in a tank".
+        self.animal_id = 0
+        # The scheduler.HungerScheduler keeping this animal's food and age while it is in a tank
+        # on the object path, or None; ``food`` and ``age`` read and write through it.
+        self._hunger = None
+        self._food = config.STARTING_FOOD
         self.name = name
-        self.age = age
+        self._age = age
         self.x = x
         self.y = y
         self.directionH = directionH
@@ -16,6 +28,28 @@ class Animal:
     def __str__(self):
         pass
 
+    @property
+    def food(self) -> int:
+        return self._food if self._hunger is None else self._hunger.food_of(self)
+
+    @food.setter
+    def food(self, food: int):
+        if self._hunger is None:
+            self._food = food
+        else:
+            self._hunger.rekey(self, food, self._hunger.age_of(self))
+
+    @property
+    def age(self) -> int:
+        return self._age if self._hunger is None else self._hunger.age_of(self)
+
+    @age.setter
+    def age(self, age: int):
+        if self._hunger is None:
+            self._age = age
+        else:
+            self._hunger.rekey(self, self._hunger.food_of(self), age)
+
     def get_food(self) -> int:
         return self.food
 
@@ -73,5 +107,8 @@ class Animal:
     def add_food(self, amount: int):
         self.food += amount
 
+    def get_sprite(self) -> sprites.Sprite:
+        return sprites.get_sprite(self.code, self.directionH)
+
     def get_animal(self):
-        pass
+        return self.get_sprite().lines
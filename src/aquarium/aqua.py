@@ -1,26 +1,157 @@
 from __future__ import annotations
 
-from . import animal, config, crab, fish, moly, ocypode, scalar, shrimp
+import sys
+
+from . import animal, config, crab, fastforward, fish, heatmap, population, species
+from .board import Board, Frame, display_lines, write_display
+from .events import ConsoleSink, EventBus, EventKind
+from .instrument import Instruments
+from .occupancy import Occupancy
+from .registry import AnimalRegistry
+from .scheduler import HungerScheduler
+from .spatial import CrabIndex
 from .utils import valid_num_check
 
+_WALL = ord("|")
+
 
 class Aqua:
-    def __init__(self, aqua_width, aqua_height):
+    """
+    The tank is drawn in layers. The background (walls, waterline, floor) is built once
+    by build_tank and never written to. The sprite layer is the animals themselves: moving,
+    drawing or erasing one only updates the occupancy layer. Labels are laid over the rows
+    by get_display_lines. The board is composited from background and sprites, later animals
+    on top, only when it is read.
+    """
+
+    def __init__(self, aqua_width, aqua_height, vectorized: bool = False, events: EventBus | None = None,
+                 stripes: int = 0):
         self.turn = 0
+        # Simulation events; by default the classic messages are printed to the console.
+        self.events = events if events is not None else EventBus([ConsoleSink()])
         self.aqua_height = aqua_height
         self.aqua_width = aqua_width
-        self.board = [' '] * self.aqua_height
+        self._board = Board(aqua_width, aqua_height)
+        self._board_stale = True
+        self.background = None
+        self.occupancy = Occupancy(aqua_width, aqua_height)
+        # False once an erasure may have cleared cells of an overlapping sprite; see _exact_occupancy.
+        self._occupancy_exact = True
+        # Ids of animals erased from the sprite layer and not drawn again yet.
+        self._off_layer = set()
+        # Double buffering (see publish): the last published Frame, the buffer the next
+        # publish composes into, and how many publishes have started.
+        self.frame = None
+        self._back = None
+        self._publishing = False
+        self._publishes_started = 0
         self.build_tank()
-        self.anim = []
+        self.animals = AnimalRegistry()
+        # Food and age on the object path; see scheduler.py.
+        self.hunger = HungerScheduler()
+        self.crabs = CrabIndex()
+        # Optional replay.ReplayRecorder logging every change to the tank.
+        self.recorder = None
+        # Optional instrument.Instruments timing the turns (see instrument()).
+        self.instruments = None
+        self.engine = None
+        if stripes > 1:
+            # Vectorized engine with the crabs stepped by ``stripes`` worker processes.
+            from .stripes import StripedEngine
+            self.engine = StripedEngine(self, stripes)
+        elif vectorized:
+            # Imported lazily: the vectorized engine needs NumPy, the default path does not.
+            from .engine import VectorEngine
+            self.engine = VectorEngine(self)
+
+    def _sync(self):
+        """Bring animal objects and board up to date with the vectorized engine."""
+        if self.engine is not None:
+            self.engine.sync()
+
+    def _expose(self):
+        """
+        Animal objects are being handed out and may be edited: the engine re-reads them before
+        the next turn. On the object path food and age read and write through the scheduler.
+        """
+        if self.engine is not None:
+            self.engine.invalidate()
+
+    def _invalidate(self):
+        """Tell the vectorized engine that animals or board were changed outside of it."""
+        if self.engine is not None:
+            self.engine.invalidate()
 
     def build_tank(self):
-        col, row = self.aqua_width, len(self.board)
-        tank = [[' '] * col for _ in range(row)]
-        tank[config.WATERLINE_ROW][1:-1] = '~' * (col - 2)
-        tank[-1] = ('_' * (col - 2)).join(['\\', '/'])
-        for r in tank[:-1]:
-            r[0], r[-1] = '|', '|'
-        self.board = tank
+        """Build the background layer (walls, waterline, floor) and clear the occupancy layer."""
+        if self.background is None:
+            col, row = self.aqua_width, self.aqua_height
+            tank = [bytearray(b' ' * col) for _ in range(row)]
+            tank[config.WATERLINE_ROW][1:-1] = b'~' * (col - 2)
+            tank[-1] = (b'_' * (col - 2)).join([b'\\', b'/'])
+            for r in tank[:-1]:
+                r[0] = r[-1] = _WALL
+            self.background = b''.join(tank)
+            view = memoryview(self.background)
+            self._background_rows = [view[r * col:(r + 1) * col] for r in range(row)]
+        self.occupancy.clear()
+        self._occupancy_exact = True
+        self._board_stale = True
+
+    @property
+    def board(self) -> Board:
+        """The composited board; composed from the layers first if a sprite changed since."""
+        if self._board_stale:
+            self._compose()
+        return self._board
+
+    def _compose(self):
+        self._compose_into(self._board)
+        self._board_stale = False
+
+    def _compose_into(self, board: Board):
+        """Composite the layers into ``board``: the background, then every sprite in order, later ones on top."""
+        board.load(self.background)
+        rows = board.rows
+        for a in self._sprites():
+            sprite = a.get_sprite()
+            top, x, width = self._animal_top_row(a), a.x, sprite.width
+            for i, line in enumerate(sprite.data):
+                rows[top + i][x:x + width] = line
+
+    def _sprites(self):
+        """Animals on the sprite layer, in drawing order."""
+        hidden = self._off_layer
+        if not hidden:
+            return self.animals
+        return [a for a in self.animals if a.animal_id not in hidden]
+
+    def _repaint_occupancy(self):
+        occ = self.occupancy
+        occ.clear()
+        for a in self._sprites():
+            top = self._animal_top_row(a)
+            occ.paint(a.animal_id, a.x, range(top, top + a.get_size()[0]), a.get_sprite().masks)
+        self._occupancy_exact = True
+
+    def _exact_occupancy(self):
+        """
+        Repaint the occupancy layer if an erasure may have cleared cells of an overlapping sprite.
+        Moves keep it exact in the crab rows, where sprites never overlap, which is all a turn reads.
+        """
+        if not self._occupancy_exact:
+            self._repaint_occupancy()
+
+    def reindex(self):
+        """Rebuild the crab index, occupancy layer, scheduler and board from the registry (after bulk changes)."""
+        self.hunger.rebuild(self.animals)
+        self.crabs.clear()
+        for a in self.animals:
+            if isinstance(a, crab.Crab):
+                self.crabs.add(a, a.x, a.width)
+        self._off_layer.clear()
+        self._repaint_occupancy()
+        self._board_stale = True
 
     def _animal_top_row(self, a: animal.Animal) -> int:
         """Board row index of the top of this animal's sprite."""
@@ -30,15 +161,10 @@ class Aqua:
             return y
         return self._crab_row(0, an_height)
 
-    def get_display_lines(self) -> tuple[list[str], list[int]]:
-        """
-        Build board display: hunger/food above each animal, name+age below.
-        Returns (list of display lines, list mapping display line index -> board row, or -1 for label lines).
-        """
-        board = self.get_board()
-        aq_width = self.aqua_width
+    def _labels(self, animals=None) -> dict:
+        """Board row -> [(x, text)] for the label lines of ``animals`` (default: all) shown above that row."""
         labels_at_row = {}
-        for a in self.anim:
+        for a in self.animals if animals is None else animals:
             if not a.get_alive():
                 continue
             top_row = self._animal_top_row(a)
@@ -57,167 +183,273 @@ class Aqua:
             # Crabs sit on the floor: show name+age above them (row below is the floor)
             elif isinstance(a, crab.Crab) and top_row - 1 >= 0:
                 labels_at_row.setdefault(top_row - 1, []).append((x, f"{a.name} ({a.get_age()})"))
+        return labels_at_row
 
-        lines = []
-        line_to_board_row = []
-        # Display row length matches board (each cell is 2 chars: char + space)
-        row_len = 2 * aq_width - 1
-        for row_idx in range(self.aqua_height):
-            if row_idx in labels_at_row:
-                # Label line: same length and borders as board row so edges don't disappear
-                label_chars = [" "] * row_len
-                for (x, text) in labels_at_row[row_idx]:
-                    start = 2 * x
-                    for i, c in enumerate(text):
-                        if start + i < row_len:
-                            label_chars[start + i] = c
-                label_chars[0], label_chars[-1] = "|", "|"
-                lines.append("".join(label_chars))
-                line_to_board_row.append(-1)
-            lines.append(" ".join(board[row_idx]))
-            line_to_board_row.append(row_idx)
-        return lines, line_to_board_row
-
-    def print_board(self):
+    def _animals_in(self, window) -> list[animal.Animal]:
+        """
+        Animals whose sprite or labels (see _labels) reach into a viewport.Window, in drawing
+        order. Each animal's box is checked: sprites are only laid out up to HEATMAP_POPULATION
+        animals, so this is cheap next to the layout itself.
+        """
+        x0, x1 = window.x, window.x + window.width
+        y0, y1 = window.y, window.y + window.lines
+        found = []
+        for a in self.animals:
+            height, width = a.get_size()
+            top = self._animal_top_row(a)
+            # Label lines go from the row above the sprite (crabs) to the row below it.
+            if a.x >= x1 or top - 1 >= y1 or top + height < y0:
+                continue
+            if a.x + width <= x0:
+                # Labels are drawn one character per half cell.
+                text = max(config.HUNGER_BAR_LENGTH + 5 + len(str(a.get_food())), len(f"{a.name} ({a.get_age()})"))
+                if a.x + (text + 1) // 2 <= x0:
+                    continue
+            found.append(a)
+        return found
+
+    def _layout(self, viewport):
+        """(board, labels, window) for get_display_lines/write_board, touching only what the viewport shows."""
+        board = self.get_board()
+        if viewport is None:
+            return board, self._labels(), None
+        viewport.track(self)
+        window = viewport.window(self.aqua_width, self.aqua_height)
+        return board, self._labels(self._animals_in(window)), window
+
+    def get_display_lines(self, viewport=None) -> tuple[list[str], list[int]]:
+        """
+        Build board display: hunger/food above each animal, name+age below.
+        Returns (list of display lines, list mapping display line index -> board row, or -1 for label lines).
+        With a viewport.Viewport, only the part of the tank inside it is laid out.
+        """
+        return display_lines(*self._layout(viewport))
+
+    def get_view_lines(self, viewport=None) -> list[str]:
+        """
+        Display lines for the screen: get_display_lines, or the density view (heatmap.py) past
+        HEATMAP_POPULATION animals or when ``viewport`` is zoomed out to HEATMAP_ZOOM.
+        """
+        zoom = viewport.zoom if viewport is not None else 1
+        if not heatmap.wants_heatmap(len(self.animals), zoom):
+            return self.get_display_lines(viewport)[0]
+        self._sync()
+        window = None
+        if viewport is not None:
+            viewport.track(self)
+            window = viewport.window(self.aqua_width, self.aqua_height)
+        return heatmap.density_lines(heatmap.census(self), window, self.aqua_width, self.aqua_height,
+                                     viewport.colour if viewport is not None else None)
+
+    def write_board(self, stream=None, viewport=None):
+        """
+        Write the display (as get_display_lines) to a binary stream, by default stdout's buffer.
+        Board rows are spaced out and written straight from the board bytes.
+        """
+        if stream is None:
+            sys.stdout.flush()
+            stream = sys.stdout.buffer
+        board, labels, window = self._layout(viewport)
+        write_display(board, labels, stream, window)
+
+    def publish(self) -> Frame:
+        """
+        Composite the current state into the back buffer and make it the front frame (``frame``).
+        The swap is one attribute assignment, so a reader sees the old frame or the new one, whole.
+        Past HEATMAP_POPULATION animals only their census is published, for the density view.
+        """
+        self._sync()
+        census, size = heatmap.census(self), (self.aqua_width, self.aqua_height)
+        self._publishes_started += 1
+        front = self.frame
+        if len(census.x) > config.HEATMAP_POPULATION:
+            self.frame = Frame(self._publishes_started, self.turn, None, {}, census, size)
+            if front is not None and front.board is not None:
+                self._back = front.board
+            return self.frame
+        back = self._back if self._back is not None else Board(self.aqua_width, self.aqua_height)
+        self._compose_into(back)
+        self.frame = Frame(self._publishes_started, self.turn, back, self._labels(), census, size)
+        self._back = front.board if front is not None else None
+        return self.frame
+
+    def publish_frames(self, enabled: bool = True):
+        """Publish a frame now and at the end of every turn, for readers on other threads (read_frame)."""
+        self._publishing = enabled
+        if enabled:
+            self.publish()
+
+    def read_frame(self, reader):
+        """
+        Return ``reader(frame)`` for the last published frame, without locks or copying; safe while
+        next_turn runs on another thread. A frame's buffer is reused by the next publish but one:
+        if that started while ``reader`` ran, it is called again with the newer frame.
+        """
+        while True:
+            frame = self.frame
+            if frame is None:
+                raise RuntimeError("no frame has been published; call publish() or publish_frames() first")
+            result = reader(frame)
+            if self._publishes_started <= frame.seq + 1:
+                return result
+
+    def print_board(self, viewport=None):
         """Print the updated board on screen (hunger above each animal, name+age below)."""
-        lines, _ = self.get_display_lines()
+        if hasattr(sys.stdout, "buffer"):
+            return self.write_board(viewport=viewport)
+        lines, _ = self.get_display_lines(viewport)
         for line in lines:
             print(line)
 
-    def get_board(self):
+    def get_board(self) -> Board:
+        self._sync()
         return self.board
 
     def get_all_animal(self):
-        """Return the list of all animals in the aquarium."""
-        return self.anim
+        """Return a list of all animals in the aquarium, in the order they were added."""
+        self._sync()
+        self._expose()
+        return self.animals.as_list()
+
+    def get_animal_by_id(self, animal_id: int) -> animal.Animal | None:
+        self._sync()
+        self._expose()
+        return self.animals.get(animal_id)
+
+    def get_animal_by_name(self, name: str) -> animal.Animal | None:
+        """The first-added animal with this name, or None."""
+        self._sync()
+        self._expose()
+        matches = self.animals.by_name(name)
+        return matches[0] if matches else None
 
     def _crab_row(self, row_from_top: int, crab_height: int) -> int:
         """Board row index for a crab line (0 = top of crab)."""
         return config.crab_row_index(self.aqua_height, crab_height, row_from_top)
 
+    def _blocked(self, row: int, col: int) -> bool:
+        """True if a wall or a sprite's '*' is at (col, row); col may be negative, as a list index."""
+        return self._background_rows[row][col] == _WALL or self.occupancy.masks[row][col] == 1
+
     def is_collision(self, a: animal.Animal) -> bool:
         """Return True if the next step of the crab would cause a collision."""
         x, y = a.get_position()
         a_dir = a.get_directionH()
         aq_height = self.aqua_height
-        board = self.get_board()
+        blocked = self._blocked
         zone_top = config.crab_zone_top_row(aq_height)
-        crabs = [c for c in self.get_all_animal() if isinstance(c, crab.Crab)]
-        for crab_2 in crabs:
-            if (a_dir == config.DIR_RIGHT and crab_2.x == x + a.width) or \
-                    (a_dir == config.DIR_LEFT and crab_2.x + crab_2.width == x):
-                self.delete_animal_from_board(crab_2)
-                crab_2.set_directionH(config.DIR_RIGHT) if crab_2.get_directionH() == config.DIR_LEFT else \
-                    crab_2.set_directionH(config.DIR_LEFT) if crab_2.get_directionH() == config.DIR_RIGHT else None
-                self.print_animal_on_board(crab_2)
+        crab_2 = self.crabs.blocker(x, a.width, a_dir)
+        if crab_2 is not None:
+            self.delete_animal_from_board(crab_2)
+            crab_2.set_directionH(config.DIR_RIGHT) if crab_2.get_directionH() == config.DIR_LEFT else \
+                crab_2.set_directionH(config.DIR_LEFT) if crab_2.get_directionH() == config.DIR_RIGHT else None
+            self.print_animal_on_board(crab_2)
 
-                self.delete_animal_from_board(a)
-                try:
-                    if (board[zone_top][x - 1] not in ['|', '*'] and
-                            board[zone_top + 1][x - 1] not in ['|', '*']):
-                        a.set_x(x - 1)
-                    elif (board[zone_top][x + a.width + 1] not in ['|', '*'] and
-                          board[zone_top + 1][x + a.width + 1] not in ['|', '*']):
-                        a.set_x(x + 1)
-                except IndexError:
-                    pass
-                a.set_directionH(config.DIR_LEFT) if a_dir == config.DIR_RIGHT else \
-                    a.set_directionH(config.DIR_RIGHT) if a_dir == config.DIR_LEFT else None
-                self.print_animal_on_board(a)
-                return True
+            self.delete_animal_from_board(a)
+            try:
+                if not blocked(zone_top, x - 1) and not blocked(zone_top + 1, x - 1):
+                    a.set_x(x - 1)
+                elif not blocked(zone_top, x + a.width + 1) and not blocked(zone_top + 1, x + a.width + 1):
+                    a.set_x(x + 1)
+            except IndexError:
+                pass
+            self.crabs.move(a, a.x, a.width)
+            self.events.emit(EventKind.COLLIDED, self.turn, a, crab_2.name)
+            a.set_directionH(config.DIR_LEFT) if a_dir == config.DIR_RIGHT else \
+                a.set_directionH(config.DIR_RIGHT) if a_dir == config.DIR_LEFT else None
+            self.print_animal_on_board(a)
+            return True
         return False
 
     def print_animal_on_board(self, a: animal.Animal):
-        k = a.get_animal()
-        x, y = a.get_position()
+        """Put the animal's sprite on the sprite layer at its position (the board is composited on read)."""
+        x = a.get_position()[0]
         an_height, an_width = a.get_size()
-        aq_height, aq_width = self.aqua_height, self.aqua_width
-        board = self.get_board()
-        if isinstance(a, fish.Fish):
-            if (aq_width - x) < an_width + 1:
-                a.set_x(aq_width - an_width - 1)
-            for i in range(an_height):
-                board[y + i][x:x + an_width] = k[i]
-        elif isinstance(a, crab.Crab):
-            if (aq_width - x) < an_width + 1:
-                a.set_x(aq_width - an_width - 1)
-            for i in range(an_height):
-                board[self._crab_row(i, an_height)][x:x + an_width] = k[i]
+        if (self.aqua_width - x) < an_width + 1:
+            a.set_x(self.aqua_width - an_width - 1)
+            if isinstance(a, crab.Crab):
+                self.crabs.move(a, a.x, an_width)
+        top = self._animal_top_row(a)
+        self.occupancy.paint(a.animal_id, a.x, range(top, top + an_height), a.get_sprite().masks)
+        self._off_layer.discard(a.animal_id)
+        self._board_stale = True
 
     def delete_animal_from_board(self, a: animal.Animal):
-        x, y = a.get_position()
+        """Take the animal's sprite off the sprite layer; the background needs no restoring."""
         an_height, an_width = a.get_size()
-        board = self.get_board()
-        aq_height = self.aqua_height
-        if isinstance(a, fish.Fish):
-            for h in range(an_height):
-                row_idx = y + h
-                # Restore waterline so '~' is not permanently erased when fish touches surface
-                fill = '~' if row_idx == config.WATERLINE_ROW else ' '
-                board[row_idx][x:x + an_width] = fill * an_width
-        else:
-            for i in range(an_height):
-                row_idx = self._crab_row(i, an_height)
-                fill = '~' if row_idx == config.WATERLINE_ROW else ' '
-                board[row_idx][x:x + an_width] = fill * an_width
+        top = self._animal_top_row(a)
+        self.occupancy.erase(a.x, range(top, top + an_height), an_width)
+        self._off_layer.add(a.animal_id)
+        self._occupancy_exact = False
+        self._board_stale = True
 
     def add_animal(self, name, age, x, y, directionH, directionV, animaltype):
-        if animaltype in ('sc', 'mo'):
-            return self.add_fish(name, age, x, y, directionH, directionV, animaltype)
-        if animaltype in ('oc', 'sh'):
-            return self.add_crab(name, age, x, y, directionH, animaltype)
-        return False
+        self._sync()
+        kind = species.get(animaltype)
+        if kind is None:
+            return False
+        if kind.is_fish:
+            added = self.add_fish(name, age, x, y, directionH, directionV, animaltype)
+        else:
+            added = self.add_crab(name, age, x, y, directionH, animaltype)
+        if added:
+            self._invalidate()
+        return added
 
     def add_fish(self, name, age, x, y, directionH, directionV, fishtype):
         """Add a fish to the aquarium."""
-        aq_height, aq_width = self.aqua_height, self.aqua_width
-        if (aq_width - x) < config.MAX_FISH_WIDTH + 1:
-            x = aq_width - config.MAX_FISH_WIDTH - 1
-
-        fish_bottom = config.fish_lowest_y(aq_height)
-        if fishtype == 'sc':
-            if (aq_height - config.MAX_ANIMAL_HEIGHT - 1) <= y:
-                y = fish_bottom - config.SCALAR_HEIGHT
-            new_fish = scalar.Scalar(name, age, x, y, directionH, directionV)
-            check_w, check_h = config.SCALAR_WIDTH, config.SCALAR_HEIGHT
-        elif fishtype == 'mo':
-            if (aq_height - config.MAX_ANIMAL_HEIGHT) <= y:
-                y = fish_bottom - config.MOLY_HEIGHT
-            new_fish = moly.Moly(name, age, x, y, directionH, directionV)
-            check_w, check_h = config.MOLY_WIDTH, config.MOLY_HEIGHT
-        else:
+        kind = species.get(fishtype)
+        if kind is None or not kind.is_fish:
             return False
-
-        if not self.check_if_free(x, y, width=check_w, height=check_h):
-            print("The place is not available! Please try again later. ")
+        max_width = max(config.MAX_FISH_WIDTH, kind.width)
+        if (self.aqua_width - x) < max_width + 1:
+            x = self.aqua_width - max_width - 1
+        y = min(y, config.fish_lowest_y(self.aqua_height) - kind.height)
+        new_fish = kind.make(name, age, x, y, directionH, directionV)
+
+        # Sprites are blitted as row slices, so they must start inside the tank.
+        if x < 0 or y < 0 or not self.check_if_free(x, y, width=kind.width, height=kind.height):
+            self.events.emit(EventKind.PLACEMENT_REJECTED, self.turn, new_fish)
             return False
 
-        self.anim.append(new_fish)
+        self.animals.add(new_fish)
+        self.hunger.add(new_fish)
+        self.events.emit(EventKind.BORN, self.turn, new_fish)
         self.print_animal_on_board(new_fish)
+        if self.recorder is not None:
+            self.recorder.added(new_fish)
         return True
 
     def add_crab(self, name, age, x, y, directionH, crabtype):
         """Add a crab to the aquarium."""
-        if (self.aqua_width - x) < config.MAX_CRAB_WIDTH + 1:
-            x = self.aqua_width - config.MAX_CRAB_WIDTH - 1
-        y = self.aqua_height - config.MAX_CRAB_HEIGHT
-
-        check_w = config.SHRIMP_WIDTH if crabtype == 'sh' else config.OCYPODE_WIDTH
-        check_h = config.SHRIMP_HEIGHT if crabtype == 'sh' else config.OCYPODE_HEIGHT
-        if not self.check_if_free(x, y, width=check_w, height=check_h):
-            print("The place is not available! Please try again later. ")
+        kind = species.get(crabtype)
+        if kind is None or kind.is_fish:
             return False
-
-        if crabtype == 'sh':
-            new_crab = shrimp.Shrimp(name, age, x, y, directionH)
-        elif crabtype == 'oc':
-            new_crab = ocypode.Ocypode(name, age, x, y, directionH)
-        else:
+        max_width = max(config.MAX_CRAB_WIDTH, kind.width)
+        if (self.aqua_width - x) < max_width + 1:
+            x = self.aqua_width - max_width - 1
+        y = self.aqua_height - config.MAX_CRAB_HEIGHT
+        new_crab = kind.make(name, age, x, y, directionH)
+        if x < 0 or not self.check_if_free(x, y, width=new_crab.width, height=new_crab.height):
+            self.events.emit(EventKind.PLACEMENT_REJECTED, self.turn, new_crab)
             return False
-        self.anim.append(new_crab)
+        self.animals.add(new_crab)
+        self.hunger.add(new_crab)
+        self.events.emit(EventKind.BORN, self.turn, new_crab)
+        self.crabs.add(new_crab, new_crab.x, new_crab.width)
         self.print_animal_on_board(new_crab)
+        if self.recorder is not None:
+            self.recorder.added(new_crab)
         return True
 
+    def add_many(self, columns: dict, relocate: bool = False) -> population.BulkResult:
+        """Add many animals in one pass (see population.py). Returns the ids added and the entries rejected."""
+        return population.add_many(self, columns, relocate)
+
+    def populate(self, path, relocate: bool = False) -> population.BulkResult:
+        """add_many() with the entries of a CSV or JSON Lines file."""
+        return population.add_many(self, population.load_population(path), relocate)
+
     def check_if_free(
         self,
         x: int,
@@ -228,22 +460,28 @@ class Aqua:
         """Check if the area at (x, y) with given width/height is free. Uses full animal bounds if not specified."""
         w = width if width is not None else config.MAX_ANIMAL_WIDTH
         h = height if height is not None else config.MAX_ANIMAL_HEIGHT
-        try:
-            for t in range(h):
-                row_idx = y + t
-                if row_idx < 0 or row_idx >= self.aqua_height:
-                    continue
-                row = self.board[row_idx]
-                x0, x1 = max(0, x), min(self.aqua_width, x + w)
-                if '*' in row[x0:x1]:
-                    return False
-        except IndexError:
-            return False
-        return True
+        self._sync()
+        self._exact_occupancy()
+        return self.occupancy.is_free(x, y, w, h)
+
+    def find_blocker(
+        self,
+        x: int,
+        y: int,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> animal.Animal | None:
+        """Return the animal occupying the area at (x, y), or None if it is free."""
+        w = width if width is not None else config.MAX_ANIMAL_WIDTH
+        h = height if height is not None else config.MAX_ANIMAL_HEIGHT
+        self._sync()
+        self._exact_occupancy()
+        return self.animals.get(self.occupancy.blocker(x, y, w, h))
 
     def left(self, a: animal.Animal):
         x, y = a.get_position()
-        if self.board[y][x - 1] == '|':
+        if self._background_rows[y][x - 1] == _WALL:
+            self.events.emit(EventKind.BOUNCED, self.turn, a, "wall")
             self.delete_animal_from_board(a)
             a.set_directionH(config.DIR_RIGHT)
             return self.print_animal_on_board(a)
@@ -254,12 +492,15 @@ class Aqua:
 
         self.delete_animal_from_board(a)
         a.left()
+        if isinstance(a, crab.Crab):
+            self.crabs.move(a, a.x, a.width)
         self.print_animal_on_board(a)
 
     def right(self, a: animal.Animal):
         x, y = a.get_position()
-        if (isinstance(a, crab.Crab) and self.board[y][x + a.width] == '|') or \
-                (isinstance(a, fish.Fish) and self.board[y][x + a.width] == '|'):
+        if (isinstance(a, crab.Crab) and self._background_rows[y][x + a.width] == _WALL) or \
+                (isinstance(a, fish.Fish) and self._background_rows[y][x + a.width] == _WALL):
+            self.events.emit(EventKind.BOUNCED, self.turn, a, "wall")
             self.delete_animal_from_board(a)
             a.set_directionH(config.DIR_LEFT)
             return self.print_animal_on_board(a)
@@ -270,11 +511,14 @@ class Aqua:
 
         self.delete_animal_from_board(a)
         a.right()
+        if isinstance(a, crab.Crab):
+            self.crabs.move(a, a.x, a.width)
         self.print_animal_on_board(a)
 
     def up(self, a: animal.Animal):
         x, y = a.get_position()
         if y == config.WATERLINE:
+            self.events.emit(EventKind.BOUNCED, self.turn, a, "waterline")
             self.delete_animal_from_board(a)
             a.set_directionV(config.DIR_DOWN)
             return self.print_animal_on_board(a)
@@ -286,6 +530,7 @@ class Aqua:
         x, y = a.get_position()
         bottom = config.fish_lowest_y(self.aqua_height)
         if y + a.height >= bottom:
+            self.events.emit(EventKind.BOUNCED, self.turn, a, "floor")
             a.set_directionV(config.DIR_UP)
             self.delete_animal_from_board(a)
             self.print_animal_on_board(a)
@@ -296,19 +541,42 @@ class Aqua:
 
     def next_turn(self):
         """Advance the simulation by one step."""
-        for a in self.anim[:]:
-            if self.turn % config.TURNS_PER_FOOD_DECREMENT == 0:
-                a.dec_food()
-                if self.turn % config.TURNS_PER_AGE_INCREMENT == 0:
-                    old_age = a.get_age()
-                    a.inc_age()
-                    if a.get_alive() and a.get_age() != old_age:
-                        print(f"  >> {a.name} is now {a.get_age()} years old!")
-
-                if not a.get_alive():
-                    self.delete_animal_from_board(a)
-                    self.anim.remove(a)
-                    continue
+        recorder = self.recorder
+        if recorder is not None:
+            recorder.before_turn()
+        if self.engine is not None:
+            self.engine.next_turn()
+        else:
+            self._next_turn_objects()
+        if recorder is not None:
+            recorder.after_turn()
+        if self._publishing:
+            self.publish()
+
+    def _next_turn_objects(self):
+        """One turn on the animal objects and the board (the path without an engine)."""
+        dying = {}
+        report_aging = False
+        if self.turn % config.TURNS_PER_FOOD_DECREMENT == 0:
+            aging = self.turn % config.TURNS_PER_AGE_INCREMENT == 0
+            dying = self.hunger.tick(aging)
+            report_aging = aging and self.events.wants(EventKind.AGED)
+        for a in self.animals:
+            if dying and a.animal_id in dying:
+                cause = dying[a.animal_id]
+                self.hunger.retire(a, cause)
+                if cause is EventKind.STARVED:
+                    a.starvation()
+                else:
+                    a.die()
+                self.events.emit(cause, self.turn, a)
+                self.delete_animal_from_board(a)
+                self._off_layer.discard(a.animal_id)
+                self.animals.remove(a)
+                self.crabs.remove(a)
+                continue
+            if report_aging:
+                self.events.emit(EventKind.AGED, self.turn, a)
 
             try:
                 if a.get_directionV() == config.DIR_DOWN:
@@ -325,26 +593,51 @@ class Aqua:
             else:
                 self.left(a)
 
-        for a in self.anim:
-            self.delete_animal_from_board(a)
-            self.print_animal_on_board(a)
-
         self.turn += 1
 
+    def instrument(self) -> Instruments:
+        """Start timing phases and counting events of every turn; returns the Instruments (detach() to stop)."""
+        if self.instruments is None:
+            Instruments().attach(self)
+        return self.instruments
+
+    def fast_forward(self, turns: int):
+        """
+        Advance the simulation by ``turns`` steps without playing every turn (see fastforward.py).
+        Ends in the same state as calling next_turn() ``turns`` times.
+        """
+        fastforward.fast_forward(self, turns)
+
     def print_all(self):
         """Print all animals in the aquarium."""
-        for a in self.anim:
+        self._sync()
+        for a in self.animals:
             print(a)
 
+    def close(self):
+        """Release engine resources (worker processes, shared memory). The tank stays readable."""
+        if self.engine is not None:
+            self._sync()
+            self.engine.close()
+
     def reset(self):
         """Remove all animals and redraw an empty tank."""
-        self.anim.clear()
+        self._sync()
+        self.animals.clear()
+        self.hunger.rebuild(())
+        self.crabs.clear()
         self.build_tank()
+        self._invalidate()
+        if self.recorder is not None:
+            self.recorder.keyframe()
 
     def feed_all(self):
         """Feed all animals in the aquarium."""
-        for a in self.get_all_animal():
-            a.add_food(config.FEED_AMOUNT)
+        if self.recorder is not None:
+            self.recorder.fed(config.FEED_AMOUNT)
+        if self.engine is not None:
+            return self.engine.feed(config.FEED_AMOUNT)
+        self.hunger.feed(config.FEED_AMOUNT)
 
     def several_steps(self):
         """Advance the simulation by a user-specified number of steps."""
@@ -0,0 +1,147 @@
+"""
+Headless batch runs: seed a tank, advance it many turns without rendering or
+sleeping, and summarise the outcome. Used by ``python main.py --headless``
+for throughput runs and CI soak tests.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Iterable, NamedTuple
+
+from . import config
+from .aqua import Aqua
+from .events import CounterSink, EventBus, EventKind
+from .population import COLUMNS
+from .replay import DEFAULT_KEYFRAME_EVERY, ReplayRecorder
+from .species import SPECIES
+
+
+class BatchSummary(NamedTuple):
+    """Outcome of one headless run."""
+    width: int
+    height: int
+    seed: int | None
+    turns: int
+    requested: dict   # type code -> animals asked for
+    placed: dict      # type code -> animals actually placed
+    survivors: dict   # type code -> animals alive at the end
+    deaths: dict      # cause ('starved', 'died_of_age') -> count
+    feedings: int
+    elapsed_seconds: float
+    profile: dict | None = None   # Instruments.snapshot() of the run, if profiled
+
+    @property
+    def turns_per_second(self) -> float:
+        return self.turns / self.elapsed_seconds if self.elapsed_seconds > 0 else float("inf")
+
+    def as_dict(self) -> dict:
+        d = self._asdict()
+        d["turns_per_second"] = self.turns_per_second
+        return d
+
+    def format(self) -> str:
+        lines = [
+            f"Tank {self.width}x{self.height}, seed {self.seed}, {self.turns} turns, {self.feedings} feedings",
+            f"Elapsed {self.elapsed_seconds:.3f}s ({self.turns_per_second:.1f} turns/s)",
+        ]
+        for kind in SPECIES.values():
+            if kind.code in self.requested:
+                lines.append(f"  {kind.label:<8} requested {self.requested[kind.code]:>7}  "
+                             f"placed {self.placed.get(kind.code, 0):>7}  "
+                             f"survived {self.survivors.get(kind.code, 0):>7}")
+        lines.append("  Deaths: " + ", ".join(f"{cause} {n}" for cause, n in self.deaths.items()))
+        if self.profile is not None:
+            lines.append("  Phases: " + ", ".join(f"{name} {phase['seconds']:.3f}s"
+                                                  for name, phase in self.profile["phases"].items()))
+            lines.append("  Tick latency: " + ", ".join(f"p{p} {seconds * 1e3:.3f}ms"
+                                                        for p, seconds in self.profile["tick_percentiles"].items()))
+            lines.append("  Counters: " + ", ".join(f"{name} {n}" for name, n in self.profile["counters"].items()))
+        return "\n".join(lines)
+
+
+def parse_population(spec: str) -> dict:
+    """Parse 'sc=100,mo=50,oc=10' into {'sc': 100, 'mo': 50, 'oc': 10}."""
+    codes = set(SPECIES)
+    population = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        code, sep, count = part.partition("=")
+        code = code.strip().lower()
+        if not sep or code not in codes:
+            raise ValueError(f"bad population entry {part!r}; expected CODE=COUNT with CODE in {sorted(codes)}")
+        population[code] = population.get(code, 0) + int(count)
+    return population
+
+
+def populate(aqua: Aqua, population: dict, rng: random.Random) -> dict:
+    """
+    Place animals at random spots in one bulk pass; an animal whose spot is taken goes to the
+    first free one (see population.py). Returns type code -> number placed.
+    """
+    fish_bottom = config.fish_lowest_y(aqua.aqua_height)
+    x_max = max(1, aqua.aqua_width - config.MAX_ANIMAL_WIDTH - 1)
+    columns = {name: [] for name in COLUMNS}
+    for code, count in population.items():
+        is_fish = SPECIES[code].is_fish
+        for i in range(count):
+            columns["type"].append(code)
+            columns["name"].append(f"{code}{i}")
+            columns["x"].append(rng.randint(1, x_max))
+            columns["y"].append(rng.randint(config.WATERLINE, max(config.WATERLINE, fish_bottom - config.MAX_FISH_HEIGHT))
+                                if is_fish else aqua.aqua_height - config.MAX_CRAB_HEIGHT)
+            columns["age"].append(rng.randint(1, 20))
+            columns["directionH"].append(rng.randint(0, 1))
+            columns["directionV"].append(rng.randint(0, 1))
+    result = aqua.add_many(columns, relocate=True)
+    placed = dict.fromkeys(population, 0)
+    for animal_id in result.added:
+        placed[aqua.animals.get(animal_id).code] += 1
+    return placed
+
+
+def run_batch(
+    width: int,
+    height: int,
+    population: dict,
+    turns: int,
+    feed_every: int = 0,
+    feed_at: Iterable[int] = (),
+    seed: int | None = None,
+    vectorized: bool = False,
+    stripes: int = 0,
+    record=None,
+    keyframe_every: int = DEFAULT_KEYFRAME_EVERY,
+    profile: bool = False,
+) -> BatchSummary:
+    """
+    Seed a tank and run ``turns`` turns with no rendering, sleeping or console output.
+    Animals are fed every ``feed_every`` turns (0 = never) and at each turn in ``feed_at``.
+    With ``stripes`` > 1 the crabs are stepped by that many worker processes (see stripes.py).
+    If ``record`` is a path, a replay log of the whole run is written there (see replay.py).
+    With ``profile`` the turns are instrumented (see instrument.py) and the summary carries the measurements.
+    """
+    rng = random.Random(seed)
+    deaths = CounterSink(kinds=(EventKind.STARVED, EventKind.DIED_OF_AGE))
+    aqua = Aqua(width, height, vectorized=vectorized, events=EventBus([deaths]), stripes=stripes)
+    feed_turns = set(feed_at)
+    feedings = 0
+    recorder = ReplayRecorder(aqua, record, keyframe_every) if record is not None else None
+    placed = populate(aqua, population, rng)
+    instruments = aqua.instrument() if profile else None
+    start = time.perf_counter()
+    for turn in range(turns):
+        if (feed_every and turn % feed_every == 0) or turn in feed_turns:
+            aqua.feed_all()
+            feedings += 1
+        aqua.next_turn()
+    survivors = {code: 0 for code in population}
+    for a in aqua.get_all_animal():
+        survivors[a.code] = survivors.get(a.code, 0) + 1
+    elapsed = time.perf_counter() - start
+    aqua.close()
+    if recorder is not None:
+        recorder.close()
+    death_counts = {kind.value: deaths.counts[kind.value] for kind in (EventKind.STARVED, EventKind.DIED_OF_AGE)}
+    return BatchSummary(width, height, seed, turns, dict(population), placed, survivors, death_counts,
+                        feedings, elapsed, instruments.snapshot() if instruments is not None else None)
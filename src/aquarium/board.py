@@ -0,0 +1,238 @@
+"""
+The tank's cells as one contiguous byte grid.
+
+Board keeps height x width ASCII bytes, row-major, in a single bytearray;
+``rows`` holds a memoryview per row, so sprites are blitted as byte slices
+(``board.rows[r][x:x + w] = sprite.data[i]``) and output is written
+straight from the buffer. as_array() views the same memory as a NumPy
+uint8 array.
+
+For code written against the old list-of-lists board, ``board[r]`` is a
+BoardRow: indexing it gives one-character strings, slicing gives a list
+of them, and str/list/bytes can be assigned to a slice of the same length.
+
+Frame is a complete board published by Aqua.publish (double buffering).
+Above HEATMAP_POPULATION animals it carries only their census, for the
+density view (heatmap.py).
+
+display_lines() and write_display() lay a board out for the terminal, each
+cell followed by a space, with label lines (hunger bars, names) inserted
+above the rows they belong to.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from .heatmap import density_lines, wants_heatmap
+
+# Cell value used for empty cells.
+BLANK = ord(" ")
+
+
+def _to_bytes(value) -> bytes:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+    if isinstance(value, BoardRow):
+        return value.tobytes()
+    return "".join(value).encode("ascii")
+
+
+class BoardRow:
+    """Character view of one board row (see module docstring)."""
+
+    __slots__ = ("_view",)
+
+    def __init__(self, view: memoryview):
+        self._view = view
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(self._view[i].tobytes().decode("ascii"))
+        return chr(self._view[i])
+
+    def __setitem__(self, i, value):
+        if isinstance(i, slice):
+            data = _to_bytes(value)
+            n = len(range(*i.indices(len(self._view))))
+            self._view[i] = data[:n]
+        else:
+            self._view[i] = ord(value)
+
+    def __iter__(self):
+        return iter(self._view.tobytes().decode("ascii"))
+
+    def __contains__(self, char) -> bool:
+        return char.encode("ascii") in self._view.tobytes()
+
+    def __eq__(self, other):
+        if isinstance(other, BoardRow):
+            return self._view == other._view
+        if isinstance(other, (list, str)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def tobytes(self) -> bytes:
+        return self._view.tobytes()
+
+    def __str__(self) -> str:
+        return self._view.tobytes().decode("ascii")
+
+    def __repr__(self) -> str:
+        return f"BoardRow({str(self)!r})"
+
+
+class Board:
+    """height x width cells in one bytearray, with a memoryview per row."""
+
+    __slots__ = ("width", "height", "data", "rows", "_compat")
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.data = bytearray(b" " * (width * height))
+        view = memoryview(self.data)
+        self.rows = [view[r * width:(r + 1) * width] for r in range(height)]
+        self._compat = [BoardRow(row) for row in self.rows]
+
+    def load(self, data) -> None:
+        """Replace every cell from a bytes-like object of width * height bytes."""
+        if len(data) != len(self.data):
+            raise ValueError(f"expected {len(self.data)} board bytes, got {len(data)}")
+        self.data[:] = data
+
+    def tobytes(self) -> bytes:
+        return bytes(self.data)
+
+    def as_array(self):
+        """The cells as a writable (height, width) NumPy uint8 view of the same memory."""
+        import numpy as np
+        return np.frombuffer(self.data, dtype=np.uint8).reshape(self.height, self.width)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, r) -> BoardRow:
+        return self._compat[r]
+
+    def __setitem__(self, r: int, value):
+        self.rows[r][:] = _to_bytes(value)
+
+    def __iter__(self):
+        return iter(self._compat)
+
+    def __eq__(self, other):
+        if isinstance(other, Board):
+            return (self.width, self.height, self.data) == (other.width, other.height, other.data)
+        try:
+            return len(other) == self.height and all(mine == theirs for mine, theirs in zip(self._compat, other))
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+
+def label_line(width: int, labels, x0: int = 0, x1: int | None = None) -> str:
+    """
+    Label line for board columns x0..x1-1: same length and borders as a board row so edges
+    don't disappear. Text running out of those columns is cut off.
+    """
+    x1 = width if x1 is None else x1
+    row_len = 2 * (x1 - x0) - 1
+    label_chars = [" "] * row_len
+    for (x, text) in labels:
+        start = 2 * (x - x0)
+        if start >= row_len or start + len(text) <= 0:
+            continue
+        for i, c in enumerate(text):
+            if 0 <= start + i < row_len:
+                label_chars[start + i] = c
+    if x0 == 0:
+        label_chars[0] = "|"
+    if x1 == width:
+        label_chars[-1] = "|"
+    return "".join(label_chars)
+
+
+def _visible(board: Board, labels_at_row: dict, window) -> tuple[int, int, list]:
+    """
+    (x0, x1, [(row, labels or None)]) of the rows to lay out. ``window`` is a viewport.Window
+    or None for the whole board; label lines count against its lines, and only labels reaching
+    into its columns are kept.
+    """
+    if window is None:
+        return 0, board.width, [(row, labels_at_row.get(row)) for row in range(board.height)]
+    x0, y0, width, max_lines = window.x, window.y, window.width, window.lines
+    x1 = min(board.width, x0 + width)
+    rows, used = [], 0
+    for row in range(y0, board.height):
+        labels = [(x, text) for x, text in labels_at_row.get(row, ()) if x < x1 and 2 * (x - x0) + len(text) > 0]
+        used += 2 if labels else 1
+        if used > max_lines:
+            break
+        rows.append((row, labels))
+    return x0, x1, rows
+
+
+def display_lines(board: Board, labels_at_row: dict, window=None) -> tuple[list[str], list[int]]:
+    """
+    The board as display lines, with the label lines of ``labels_at_row`` (row -> [(x, text)]),
+    limited to ``window`` if given (see _visible).
+    Returns (lines, list mapping display line index -> board row, or -1 for label lines).
+    """
+    x0, x1, rows = _visible(board, labels_at_row, window)
+    lines = []
+    line_to_board_row = []
+    # Display row length matches board (each cell is 2 chars: char + space)
+    spaced = bytearray(b" " * (2 * (x1 - x0) - 1))
+    for row_idx, labels in rows:
+        if labels:
+            lines.append(label_line(board.width, labels, x0, x1))
+            line_to_board_row.append(-1)
+        spaced[::2] = board.rows[row_idx][x0:x1]
+        lines.append(spaced.decode("ascii"))
+        line_to_board_row.append(row_idx)
+    return lines, line_to_board_row
+
+
+def write_display(board: Board, labels_at_row: dict, stream, window=None) -> None:
+    """Write display_lines() to a binary stream, each board row straight from the board bytes."""
+    x0, x1, rows = _visible(board, labels_at_row, window)
+    spaced = bytearray(b" " * (2 * (x1 - x0) - 1) + b"\n")
+    cells = memoryview(spaced)[:-1:2]
+    for row_idx, labels in rows:
+        if labels:
+            stream.write(label_line(board.width, labels, x0, x1).encode("utf-8") + b"\n")
+        cells[:] = board.rows[row_idx][x0:x1]
+        stream.write(spaced)
+    stream.flush()
+
+
+class Frame(NamedTuple):
+    """A complete frame published by Aqua.publish(); see Aqua.read_frame."""
+    seq: int          # publish number
+    turn: int         # aqua.turn when it was published
+    board: Board      # None when the population is past HEATMAP_POPULATION
+    labels: dict      # board row -> [(x, text)]
+    census: object    # heatmap.Census of the animals
+    size: tuple       # (width, height) of the tank
+
+    def display_lines(self, viewport=None) -> tuple[list[str], list[int]]:
+        """The frame as Aqua.get_display_lines lays it out, optionally through a viewport.Viewport."""
+        window = viewport.window(*self.size) if viewport is not None else None
+        return display_lines(self.board, self.labels, window)
+
+    def view_lines(self, viewport=None) -> list[str]:
+        """The frame as Aqua.get_view_lines shows it: sprites, or density when that is wanted."""
+        zoom = viewport.zoom if viewport is not None else 1
+        if self.board is not None and not wants_heatmap(len(self.census.x), zoom):
+            return self.display_lines(viewport)[0]
+        window = viewport.window(*self.size) if viewport is not None else None
+        return density_lines(self.census, window, *self.size, viewport.colour if viewport is not None else None)
+
+    def write(self, stream, viewport=None) -> None:
+        window = viewport.window(*self.size) if viewport is not None else None
+        write_display(self.board, self.labels, stream, window)
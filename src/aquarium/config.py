@@ -72,9 +72,20 @@ MAX_AGE_INPUT = 100
 # Demo mode: total steps and how often to feed (every N steps).
 DEMO_TOTAL_STEPS = 120
 DEMO_FEED_INTERVAL = 50
+# Simulation timestep of the demo (seconds per turn).
 DEMO_SLEEP_SECONDS = 0.5
-# Delay between steps when running "Take several steps" (so you see movement).
+# Simulation timestep when running "Take several steps" (so you see movement).
 STEP_DELAY_SECONDS = 0.4
+# Most frames per second drawn by the animated views, independent of the timestep.
+DISPLAY_FPS = 20
+# Cells (columns, rows) the arrow keys scroll the view of a tank larger than the terminal.
+VIEWPORT_SCROLL_COLUMNS = 4
+VIEWPORT_SCROLL_ROWS = 2
+# Density view: drawn instead of sprites above this many animals, or at this zoom
+# (board cells per screen cell) and beyond. Shades from empty to densest.
+HEATMAP_POPULATION = 5000
+HEATMAP_ZOOM = 2
+HEATMAP_SHADES = " ░▒▓█"
 
 # Direction constants (0 = left/down, 1 = right/up) for clarity in code.
 DIR_LEFT = 0
@@ -0,0 +1,156 @@
+"""
+Crab rows of the board as a compact byte buffer.
+
+Crabs only ever draw on the bottom MAX_CRAB_HEIGHT rows above the floor, and
+they only interact with each other there. CrabZone keeps those rows as
+bytearrays and steps a whole population of crabs with the same rules as
+Aqua.left/right/is_collision, without going through the per-object path.
+Like the tank, it is layered: ``rows`` holds only the crab sprites, and the
+walls are read from ``background``.
+"""
+
+from __future__ import annotations
+
+from . import config
+from .events import EventKind
+from .spatial import CrabIndex
+
+_WALL = ord("|")
+_STAR = ord("*")
+
+
+def _flip(direction: int) -> int:
+    """Reverse a horizontal direction; unknown values are left alone (as in Aqua)."""
+    if direction == config.DIR_LEFT:
+        return config.DIR_RIGHT
+    if direction == config.DIR_RIGHT:
+        return config.DIR_LEFT
+    return direction
+
+
+class CrabZone:
+    def __init__(self, aqua_width: int, aqua_height: int, rows=None, background=None):
+        self.width = aqua_width
+        self.top = config.crab_zone_top_row(aqua_height)
+        # Row (relative to top) that holds a crab's stored y; used for wall checks.
+        self.y_row = (aqua_height - config.MAX_CRAB_HEIGHT) - self.top
+        if rows is None:
+            rows = [bytearray(b" " * aqua_width) for _ in range(config.MAX_CRAB_HEIGHT)]
+        self.rows = rows
+        if background is None:
+            wall_row = bytearray(b" " * aqua_width)
+            wall_row[0] = wall_row[-1] = _WALL
+            background = [bytes(wall_row)] * config.MAX_CRAB_HEIGHT
+        self.background = background
+
+    @classmethod
+    def from_tank(cls, aqua, crabs) -> "CrabZone":
+        """The crab rows of ``aqua``: its background, with ``crabs`` drawn in order."""
+        top = config.crab_zone_top_row(aqua.aqua_height)
+        background = [bytes(aqua._background_rows[top + i]) for i in range(config.MAX_CRAB_HEIGHT)]
+        zone = cls(aqua.aqua_width, aqua.aqua_height, background=background)
+        for a in crabs:
+            zone.paint(a.x, a.get_sprite().data)
+        return zone
+
+    def blocked(self, row: int, col: int) -> bool:
+        """True if a wall or a crab's '*' is at (col, row); col may be negative, as a list index."""
+        return self.background[row][col] == _WALL or self.rows[row][col] == _STAR
+
+    def paint(self, x: int, frames) -> None:
+        """Draw a crab sprite (bytes rows) with its left edge at column x."""
+        offset = config.MAX_CRAB_HEIGHT - len(frames)
+        for i, line in enumerate(frames):
+            self.rows[offset + i][x:x + len(line)] = line
+
+    def erase(self, x: int, width: int, height: int) -> None:
+        blank = b" " * width
+        for i in range(config.MAX_CRAB_HEIGHT - height, config.MAX_CRAB_HEIGHT):
+            self.rows[i][x:x + width] = blank
+
+    def step(self, xs: list, dirs: list, kinds: list, dying, sprites, sizes, events=None) -> list[bool]:
+        """
+        Advance every crab by one turn, in list order, updating xs/dirs in place.
+
+        kinds[i] selects sprites[(kind, facing_right)] (tuple of bytes rows) and
+        sizes[kind] = (height, width). Crabs flagged in ``dying`` are erased when
+        their turn comes, exactly like Aqua.next_turn removes them. If ``events``
+        is a list, (EventKind, crab, other crab or None) tuples are appended to it
+        for wall bounces and collisions.
+        Returns a list of booleans: False for crabs removed this turn.
+        """
+        n = len(xs)
+        present = [True] * n
+        blocked = self.blocked
+        wall_row = self.background[self.y_row]
+        index = CrabIndex()
+        for j in range(n):
+            index.add(j, xs[j], sizes[kinds[j]][1])
+
+        def frames(i):
+            return sprites[(kinds[i], dirs[i] != config.DIR_LEFT)]
+
+        def collide(k) -> bool:
+            x, a_dir = xs[k], dirs[k]
+            a_h, a_w = sizes[kinds[k]]
+            j = index.blocker(x, a_w, a_dir)
+            if j is not None:
+                w2 = sizes[kinds[j]][1]
+                self.erase(xs[j], w2, sizes[kinds[j]][0])
+                dirs[j] = _flip(dirs[j])
+                self.paint(xs[j], frames(j))
+
+                self.erase(x, a_w, a_h)
+                try:
+                    if not blocked(0, x - 1) and not blocked(1, x - 1):
+                        xs[k] = x - 1
+                    elif not blocked(0, x + a_w + 1) and not blocked(1, x + a_w + 1):
+                        xs[k] = x + 1
+                except IndexError:
+                    pass
+                index.move(k, xs[k], a_w)
+                if events is not None:
+                    events.append((EventKind.COLLIDED, k, j))
+                dirs[k] = _flip(a_dir)
+                self.paint(xs[k], frames(k))
+                return True
+            return False
+
+        for k in range(n):
+            height, width = sizes[kinds[k]]
+            x = xs[k]
+            if dying[k]:
+                self.erase(x, width, height)
+                present[k] = False
+                index.remove(k)
+                continue
+            if dirs[k] == config.DIR_RIGHT:
+                if wall_row[x + width] == _WALL:
+                    if events is not None:
+                        events.append((EventKind.BOUNCED, k, None))
+                    dirs[k] = config.DIR_LEFT
+                    self.paint(x, frames(k))
+                    continue
+                if collide(k):
+                    continue
+                self.erase(x, width, height)
+                xs[k] = x + 1
+            else:
+                if wall_row[x - 1] == _WALL:
+                    if events is not None:
+                        events.append((EventKind.BOUNCED, k, None))
+                    dirs[k] = config.DIR_RIGHT
+                    self.paint(x, frames(k))
+                    continue
+                if collide(k):
+                    continue
+                self.erase(x, width, height)
+                xs[k] = x - 1
+            index.move(k, xs[k], width)
+            self.paint(xs[k], frames(k))
+
+        # Final redraw pass: repaint every surviving crab in order.
+        for k in range(n):
+            if present[k]:
+                self.paint(xs[k], frames(k))
+        return present
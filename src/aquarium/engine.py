@@ -0,0 +1,210 @@
+"""
+Vectorized simulation engine (optional, requires NumPy).
+
+VectorEngine keeps the population of an Aqua in struct-of-arrays NumPy
+columns (position, directions, food, age, species) and advances it with
+batched array operations: hunger/aging, wall bounces and waterline/floor
+reflection for all fish at once. Crabs interact with their neighbours, so
+they are stepped in order on a byte buffer of the crab rows (CrabZone).
+
+The Fish/Crab objects in ``aqua.animals`` stay the public view of the
+population: they are written back lazily, whenever Aqua needs them, and
+the board is composited from them like on the default path.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from . import config, fish
+from .crab_zone import CrabZone
+from .events import EventKind
+from .species import SPECIES
+
+
+class VectorEngine:
+    def __init__(self, aqua):
+        self.aqua = aqua
+        self.width = aqua.aqua_width
+        self.height = aqua.aqua_height
+
+        # Species columns are numbered in registry order.
+        kinds = list(SPECIES.values())
+        self.column_of = {kind.code: s for s, kind in enumerate(kinds)}
+        self.sizes = [(kind.height, kind.width) for kind in kinds]
+        self.heights = np.array([h for h, _ in self.sizes], dtype=np.int64)
+        self.widths = np.array([w for _, w in self.sizes], dtype=np.int64)
+        self.is_fish_species = np.array([kind.is_fish for kind in kinds])
+
+        self.crab_sprites = {}
+        for s, kind in enumerate(kinds):
+            for facing in (False, True):
+                self.crab_sprites[(s, facing)] = kind.frames[config.DIR_RIGHT if facing else config.DIR_LEFT].data
+
+        self.objs = []
+        self.zone = None
+        self._stale = True   # objects changed since the columns were gathered
+        self._dirty = False  # columns changed since the objects were written back
+
+    # ------------------------------------------------------------------
+    # Object <-> column synchronisation
+    # ------------------------------------------------------------------
+    def close(self):
+        """Release resources held by the engine (nothing for the in-process engine)."""
+
+    def invalidate(self):
+        """Mark the columns stale after the objects were changed directly."""
+        self._stale = True
+
+    def gather(self):
+        """Load the columns from aqua.animals and draw the crabs on a CrabZone."""
+        objs = self.aqua.animals.as_list()
+        self.objs = objs
+        self.species = np.array([self.column_of[a.code] for a in objs], dtype=np.int64)
+        self.x = np.array([a.x for a in objs], dtype=np.int64)
+        self.y = np.array([a.y for a in objs], dtype=np.int64)
+        self.dir_h = np.array([a.directionH for a in objs], dtype=np.int64)
+        self.dir_v = np.array([getattr(a, "directionV", 0) for a in objs], dtype=np.int64)
+        self.food = np.array([a.food for a in objs], dtype=np.int64)
+        self.age = np.array([a.age for a in objs], dtype=np.int64)
+        self.zone = CrabZone.from_tank(self.aqua, [a for a in objs if not a.is_fish])
+        self._stale = False
+
+    def sync(self):
+        """Write the columns back to the animal objects (the board is composited from them on read)."""
+        if not self._dirty:
+            return
+        # Detach the objects from the scheduler so food and age are plain writes; reindex re-adds them.
+        self.aqua.hunger.rebuild(())
+        for i, a in enumerate(self.objs):
+            a.x = int(self.x[i])
+            a.y = int(self.y[i])
+            a.directionH = int(self.dir_h[i])
+            if isinstance(a, fish.Fish):
+                a.directionV = int(self.dir_v[i])
+            a.food = int(self.food[i])
+            a.age = int(self.age[i])
+        self.aqua.animals.replace(self.objs)
+        self.aqua.reindex()
+        self._dirty = False
+
+    def feed(self, amount: int):
+        """Add food to every animal at once (Aqua.feed_all)."""
+        if self._stale:
+            self.gather()
+        self.food += amount
+        self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+    def next_turn(self):
+        """Advance the whole population by one turn (same rules as Aqua.next_turn)."""
+        if self._stale:
+            self.gather()
+        turn = self.aqua.turn
+        n = len(self.objs)
+        dying = np.zeros(n, dtype=bool)
+        if n and turn % config.TURNS_PER_FOOD_DECREMENT == 0:
+            dying = self._hunger_phase(turn % config.TURNS_PER_AGE_INCREMENT == 0)
+
+        fish_mask = self.is_fish_species[self.species] & ~dying
+        if fish_mask.any():
+            self._move_fish(np.flatnonzero(fish_mask))
+
+        crab_idx = np.flatnonzero(~self.is_fish_species[self.species])
+        if crab_idx.size:
+            events = self.aqua.events
+            want_events = events.wants(EventKind.BOUNCED) or events.wants(EventKind.COLLIDED)
+            for kind, k, other in self._step_crabs(crab_idx, dying[crab_idx], want_events):
+                detail = "wall" if other is None else self.objs[crab_idx[other]].name
+                events.emit(kind, turn, self.objs[crab_idx[k]], detail)
+
+        if dying.any():
+            self._drop(~dying)
+        self._dirty = True
+        self.aqua.turn += 1
+
+    def _step_crabs(self, crab_idx, dying, want_events: bool) -> list:
+        """
+        Step the crabs at crab_idx (in order) on the crab zone and update their columns.
+        Returns (EventKind, crab, other crab or None) tuples, crabs given as positions in crab_idx.
+        """
+        xs = self.x[crab_idx].tolist()
+        dirs = self.dir_h[crab_idx].tolist()
+        crab_events = [] if want_events else None
+        self.zone.step(xs, dirs, self.species[crab_idx].tolist(), dying.tolist(),
+                       self.crab_sprites, self.sizes, crab_events)
+        self.x[crab_idx] = xs
+        self.dir_h[crab_idx] = dirs
+        return crab_events or []
+
+    def _hunger_phase(self, age_turn: bool):
+        """Decrement food (and age on age turns); report events in animal order. Returns the dying mask."""
+        self.food -= 1
+        starved = self.food == 0
+        died_of_age = np.zeros_like(starved)
+        aged = np.zeros_like(starved)
+        if age_turn:
+            aged = ~starved
+            self.age[aged] += 1
+            died_of_age = aged & (self.age == config.MAX_AGE)
+            aged &= ~died_of_age
+        events, turn = self.aqua.events, self.aqua.turn
+        dying = starved | died_of_age
+        report = dying | aged if events.wants(EventKind.AGED) else dying
+        for i in np.flatnonzero(report):
+            a = self.objs[i]
+            a.food, a.age = int(self.food[i]), int(self.age[i])
+            if starved[i]:
+                a.starvation()
+                events.emit(EventKind.STARVED, turn, a)
+            elif died_of_age[i]:
+                a.die()
+                events.emit(EventKind.DIED_OF_AGE, turn, a)
+            else:
+                events.emit(EventKind.AGED, turn, a)
+        return dying
+
+    def _move_fish(self, idx):
+        """One vertical and one horizontal step for the fish at idx (Aqua.up/down/left/right)."""
+        w_tank = self.width
+        h = self.heights[self.species[idx]]
+        w = self.widths[self.species[idx]]
+        x, y = self.x[idx], self.y[idx]
+        dir_h, dir_v = self.dir_h[idx], self.dir_v[idx]
+
+        down = dir_v == config.DIR_DOWN
+        hit_floor = down & (y + h >= config.fish_lowest_y(self.height))
+        hit_surface = ~down & (y == config.WATERLINE)
+        y = y + (down & ~hit_floor) - (~down & ~hit_surface)
+        dir_v = np.where(hit_floor, config.DIR_UP, np.where(hit_surface, config.DIR_DOWN, dir_v))
+        x = np.minimum(x, w_tank - w - 1)
+
+        right = dir_h == config.DIR_RIGHT
+        # Walls are the '|' columns 0 and width-1 (negative columns wrap like list indexing).
+        col = np.where(right, x + w, x - 1) % w_tank
+        wall = (col == 0) | (col == w_tank - 1)
+        x = x + np.where(wall, 0, np.where(right, 1, -1))
+        dir_h = np.where(wall, np.where(right, config.DIR_LEFT, config.DIR_RIGHT), dir_h)
+        x = np.minimum(x, w_tank - w - 1)
+
+        self.x[idx], self.y[idx] = x, y
+        self.dir_h[idx], self.dir_v[idx] = dir_h, dir_v
+
+        events = self.aqua.events
+        if events.wants(EventKind.BOUNCED):
+            bounced = hit_floor | hit_surface | wall
+            for i, floor, surface, side in zip(idx[bounced].tolist(), hit_floor[bounced].tolist(),
+                                               hit_surface[bounced].tolist(), wall[bounced].tolist()):
+                a = self.objs[i]
+                if floor or surface:
+                    events.emit(EventKind.BOUNCED, self.aqua.turn, a, "floor" if floor else "waterline")
+                if side:
+                    events.emit(EventKind.BOUNCED, self.aqua.turn, a, "wall")
+
+    def _drop(self, keep):
+        """Remove the animals not in ``keep`` from every column."""
+        for name in ("species", "x", "y", "dir_h", "dir_v", "food", "age"):
+            setattr(self, name, getattr(self, name)[keep])
+        self.objs = [a for a, k in zip(self.objs, keep.tolist()) if k]
@@ -0,0 +1,168 @@
+"""
+Simulation event stream.
+
+The simulation reports what happens (an animal was born, aged, starved,
+bumped into a wall...) as typed Event records on an EventBus instead of
+calling print(). Sinks decide what to do with them: drop them, keep the
+last N, batch them to a file, or render the classic console messages.
+With no sink interested in an event kind, emitting it is a set lookup.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import json
+import sys
+from enum import Enum
+from typing import NamedTuple
+
+
+class EventKind(str, Enum):
+    BORN = "born"
+    AGED = "aged"
+    STARVED = "starved"
+    DIED_OF_AGE = "died_of_age"
+    COLLIDED = "collided"
+    BOUNCED = "bounced"
+    PLACEMENT_REJECTED = "placement_rejected"
+
+
+class Event(NamedTuple):
+    kind: EventKind
+    turn: int
+    animal_id: int
+    name: str
+    age: int
+    is_fish: bool
+    detail: str = ""   # e.g. "wall"/"waterline"/"floor" for bounces, the other crab for collisions
+
+
+def format_event(event: Event) -> str | None:
+    """Console message for an event, or None for events that were never printed."""
+    kind = event.kind
+    if kind is EventKind.STARVED:
+        kind_name = "fish" if event.is_fish else "crab"
+        return (f"the {kind_name} {event.name} died at the age of {event.age} years\n"
+                "Because he ran out of food!")
+    if kind is EventKind.DIED_OF_AGE and not event.is_fish:
+        return f"{event.name} died in good health"
+    if kind is EventKind.AGED:
+        return f"  >> {event.name} is now {event.age} years old!"
+    if kind is EventKind.PLACEMENT_REJECTED:
+        return "The place is not available! Please try again later. "
+    return None
+
+
+# Kinds that have a console message.
+CONSOLE_KINDS = frozenset({EventKind.STARVED, EventKind.DIED_OF_AGE, EventKind.AGED, EventKind.PLACEMENT_REJECTED})
+
+
+class NullSink:
+    """Accepts nothing; a bus with only null sinks does no work per event."""
+    kinds = frozenset()
+
+    def handle(self, event: Event):
+        pass
+
+
+class RingBufferSink:
+    """Keeps the last ``capacity`` events (optionally only some kinds) in memory."""
+
+    def __init__(self, capacity: int = 1000, kinds=None):
+        self.kinds = frozenset(kinds) if kinds is not None else frozenset(EventKind)
+        self.events = collections.deque(maxlen=capacity)
+
+    def handle(self, event: Event):
+        self.events.append(event)
+
+
+class CounterSink:
+    """Counts events per kind."""
+
+    def __init__(self, kinds=None):
+        self.kinds = frozenset(kinds) if kinds is not None else frozenset(EventKind)
+        self.counts = collections.Counter()
+
+    def handle(self, event: Event):
+        self.counts[event.kind.value] += 1
+
+
+class BatchedFileSink:
+    """Appends events as JSON lines to a file, writing in batches of ``batch_size``."""
+
+    def __init__(self, path, batch_size: int = 1000, kinds=None):
+        self.kinds = frozenset(kinds) if kinds is not None else frozenset(EventKind)
+        self.batch_size = batch_size
+        self._pending = []
+        self._file = open(path, "a", encoding="utf-8")
+
+    def handle(self, event: Event):
+        self._pending.append(event)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            self._file.write("".join(json.dumps(e._asdict()) + "\n" for e in self._pending))
+            self._pending.clear()
+        self._file.flush()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+class ConsoleSink:
+    """Prints the classic console messages (aging, deaths, rejected placements)."""
+    kinds = CONSOLE_KINDS
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def handle(self, event: Event):
+        message = format_event(event)
+        if message is not None:
+            # Resolve sys.stdout at call time so redirect_stdout still works.
+            print(message, file=self.stream if self.stream is not None else sys.stdout)
+
+
+class EventBus:
+    def __init__(self, sinks=()):
+        self.sinks = list(sinks)
+        self._refresh()
+
+    def _refresh(self):
+        self.kinds = frozenset().union(*(sink.kinds for sink in self.sinks))
+
+    def subscribe(self, sink):
+        self.sinks.append(sink)
+        self._refresh()
+
+    def unsubscribe(self, sink):
+        self.sinks.remove(sink)
+        self._refresh()
+
+    def wants(self, kind: EventKind) -> bool:
+        return kind in self.kinds
+
+    def emit(self, kind: EventKind, turn: int, a, detail: str = ""):
+        """Publish an event about animal ``a`` to every sink interested in ``kind``."""
+        if kind not in self.kinds:
+            return
+        event = Event(kind, turn, a.animal_id, a.name, a.age, a.is_fish, detail)
+        for sink in self.sinks:
+            if kind in sink.kinds:
+                sink.handle(event)
+
+    @contextlib.contextmanager
+    def redirect(self, *sinks):
+        """Temporarily replace all sinks (e.g. to capture messages while animating)."""
+        saved = self.sinks
+        self.sinks = list(sinks)
+        self._refresh()
+        try:
+            yield self
+        finally:
+            self.sinks = saved
+            self._refresh()
@@ -0,0 +1,149 @@
+"""
+Fast-forward a tank many turns without stepping every turn.
+
+Between deaths a tank is a closed system. A fish bounces between the walls
+and between WATERLINE and the crab zone independently of everything else,
+so each axis is a periodic walk: on a span of L + 1 positions it moves one
+cell per turn and spends one turn turning round at each end, a period of
+2L + 2 turns. Its position after any number of turns is phase arithmetic.
+Crabs interact, so they are stepped on a CrabZone; their configuration is
+a deterministic function of itself, so once it repeats the rest of the
+cycle is skipped too. Hunger and aging are counters (see scheduler.py),
+which tell when the next animal dies; that turn is played normally, so
+deaths happen at the right turn and slot.
+
+Birthday, bounce and collision events of the skipped turns are not
+reported; turns played normally report everything.
+"""
+
+from __future__ import annotations
+
+import math
+
+from . import config, sprites
+from .crab_zone import CrabZone
+
+# Crab configurations remembered while looking for a cycle.
+CYCLE_MEMORY = 1 << 16
+
+
+def bounce(pos: int, forward: bool, lo: int, hi: int, turns: int) -> tuple[int, bool]:
+    """
+    Position and direction after ``turns`` turns of the bounce rule on [lo, hi]:
+    move one cell towards the end you face, or turn round (without moving) when already there.
+    """
+    span = hi - lo
+    phase = pos - lo if forward else span + 1 + (hi - pos)
+    phase = (phase + turns) % (2 * span + 2)
+    if phase <= span:
+        return lo + phase, True
+    return hi - (phase - span - 1), False
+
+
+def _multiples(start: int, turns: int, period: int) -> int:
+    """How many turns in [start, start + turns) are multiples of ``period``."""
+    return (start + turns - 1) // period - (start - 1) // period
+
+
+def _nth_multiple(start: int, n: int, period: int) -> int:
+    """The n-th (1-based) turn >= start that is a multiple of ``period``."""
+    return -(-start // period) * period + (n - 1) * period
+
+
+def _fish_band(aqua, a):
+    """(x_lo, x_hi, y_lo, y_hi) if the fish moves on the regular bounce paths, else None."""
+    x_hi = aqua.aqua_width - 1 - a.width
+    y_hi = config.fish_lowest_y(aqua.aqua_height) - a.height
+    if (1 <= a.x <= x_hi and config.WATERLINE <= a.y <= y_hi
+            and a.directionH in (config.DIR_LEFT, config.DIR_RIGHT)
+            and a.directionV in (config.DIR_DOWN, config.DIR_UP)):
+        return 1, x_hi, config.WATERLINE, y_hi
+    return None
+
+
+def _next_death_turn(aqua) -> float:
+    """First turn (>= aqua.turn) on which an animal starves or dies of old age."""
+    food_period = config.TURNS_PER_FOOD_DECREMENT
+    age_period = math.lcm(food_period, config.TURNS_PER_AGE_INCREMENT)
+    starve_ticks, old_ticks = aqua.hunger.ticks_until_death()
+    turn = math.inf
+    if starve_ticks is not None:
+        turn = _nth_multiple(aqua.turn, starve_ticks, food_period)
+    if old_ticks is not None:
+        turn = min(turn, _nth_multiple(aqua.turn, old_ticks, age_period))
+    return turn
+
+
+def _advance_crabs(aqua, crabs, turns: int):
+    """Step the crabs ``turns`` turns on a CrabZone, skipping whole cycles of their configuration."""
+    kinds = [a.code for a in crabs]
+    xs = [a.x for a in crabs]
+    dirs = [a.directionH for a in crabs]
+    frames, sizes = {}, {}
+    for code in set(kinds):
+        for facing in (False, True):
+            sprite = sprites.get_sprite(code, config.DIR_RIGHT if facing else config.DIR_LEFT)
+            frames[code, facing] = sprite.data
+        sizes[code] = (sprite.height, sprite.width)
+    zone = CrabZone.from_tank(aqua, crabs)
+    dying = [False] * len(crabs)
+    seen = {}
+    done = 0
+    while done < turns:
+        if seen is not None:
+            state = (tuple(xs), tuple(dirs))
+            if state in seen:
+                period = done - seen[state]
+                done += (turns - done) // period * period
+                seen = None
+                continue
+            seen[state] = done
+            if len(seen) > CYCLE_MEMORY:
+                seen = None
+        zone.step(xs, dirs, kinds, dying, frames, sizes)
+        done += 1
+    for a, x, direction in zip(crabs, xs, dirs):
+        a.x, a.directionH = x, direction
+
+
+def _skip(aqua, turns: int):
+    """Advance ``turns`` turns during which nobody dies."""
+    start = aqua.turn
+    food_period = config.TURNS_PER_FOOD_DECREMENT
+    aqua.hunger.advance(_multiples(start, turns, food_period),
+                        _multiples(start, turns, math.lcm(food_period, config.TURNS_PER_AGE_INCREMENT)))
+    crabs = []
+    for a in aqua.animals:
+        if not a.is_fish:
+            crabs.append(a)
+            continue
+        x_lo, x_hi, y_lo, y_hi = _fish_band(aqua, a)
+        a.x, right = bounce(a.x, a.directionH == config.DIR_RIGHT, x_lo, x_hi, turns)
+        a.y, down = bounce(a.y, a.directionV == config.DIR_DOWN, y_lo, y_hi, turns)
+        a.directionH = config.DIR_RIGHT if right else config.DIR_LEFT
+        a.directionV = config.DIR_DOWN if down else config.DIR_UP
+    if crabs:
+        _advance_crabs(aqua, crabs, turns)
+    aqua.turn += turns
+    aqua.reindex()
+
+
+def fast_forward(aqua, turns: int):
+    """Advance ``aqua`` by ``turns`` turns, computing fish paths in closed form (see module docstring)."""
+    if aqua.recorder is not None:
+        raise RuntimeError("fast_forward would leave a gap in the replay log; close the recorder first")
+    aqua._sync()
+    aqua.reindex()
+    end = aqua.turn + turns
+    while aqua.turn < end:
+        stop = min(end, _next_death_turn(aqua))
+        if stop > aqua.turn:
+            if all(_fish_band(aqua, a) for a in aqua.animals if a.is_fish):
+                _skip(aqua, stop - aqua.turn)
+            else:
+                # Fish placed off the regular paths: play the turns normally.
+                while aqua.turn < stop:
+                    aqua._next_turn_objects()
+        if aqua.turn < end:
+            aqua._next_turn_objects()
+    aqua._invalidate()
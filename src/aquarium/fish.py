@@ -2,10 +2,14 @@ from . import animal, config
 
 
 class Fish(animal.Animal):
+    __slots__ = ("directionV",)
+
+    width = config.MAX_FISH_WIDTH
+    height = config.MAX_FISH_HEIGHT
+    is_fish = True
+
     def __init__(self, name, age, x, y, directionH, directionV):
         super().__init__(name, age, x, y, directionH)
-        self.width = config.MAX_FISH_WIDTH
-        self.height = config.MAX_FISH_HEIGHT
         self.directionV = directionV
 
     def __str__(self):
@@ -19,8 +23,6 @@ class Fish(animal.Animal):
         self.set_y(self.y + 1)
 
     def starvation(self):
-        print(f'the fish {self.name} died at the age of {self.age} years')
-        print('Because he ran out of food!')
         self.alive = False
 
     def die(self):
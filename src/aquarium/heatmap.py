@@ -0,0 +1,145 @@
+"""
+Density view: population counts per screen cell instead of sprites.
+
+With tens of thousands of animals, sprites overlap into noise and drawing
+them costs more than the turn. Zoomed out, or above HEATMAP_POPULATION
+animals, the views draw this instead: each screen cell covers zoom x zoom
+board cells, and its shade (HEATMAP_SHADES) is the number of animals whose
+sprite centre falls in it, relative to the densest cell in view. Empty
+cells show the tank's walls, waterline and floor.
+
+Counting is a histogram over the animals' centres: NumPy's bincount when
+NumPy is installed (on the vectorized engine the positions come straight
+from its columns), a plain loop otherwise. Cells can be coloured by their
+most common species or by the mean food of their animals.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from . import config
+from .species import SPECIES
+from .viewport import Window
+
+try:
+    import numpy as np
+except ImportError:  # the density view works without NumPy, only slower
+    np = None
+
+# ANSI colours: by species (registry order, cycled), and by mean food (starving, hungry, fed).
+_SPECIES_COLOURS = (33, 36, 31, 35, 32, 34)
+_HUNGER_COLOURS = (31, 33, 32)
+_RESET = "\033[0m"
+
+
+class Census(NamedTuple):
+    """Where the animals are: sprite centres, species index (SPECIES order) and food, one entry per animal."""
+    x: object
+    y: object
+    species: object
+    food: object
+
+
+def wants_heatmap(population: int, zoom: int) -> bool:
+    """True if a view of this many animals at this zoom should show density rather than sprites."""
+    return population > config.HEATMAP_POPULATION or zoom >= config.HEATMAP_ZOOM
+
+
+def census(aqua) -> Census:
+    """The animals of ``aqua`` (synced) as a Census."""
+    engine = aqua.engine
+    if np is not None and engine is not None and not engine._stale and len(engine.objs) == len(aqua.animals):
+        heights, widths = engine.heights[engine.species], engine.widths[engine.species]
+        is_fish = engine.is_fish_species[engine.species]
+        # Crabs are drawn on the rows above the floor, whatever their stored y.
+        top = np.where(is_fish, engine.y, config.content_bottom_row(aqua.aqua_height) - heights + 1)
+        return Census(engine.x + widths // 2, top + heights // 2, engine.species.copy(), engine.food.copy())
+    index = {code: i for i, code in enumerate(SPECIES)}
+    xs, ys, kinds, food = [], [], [], []
+    for a in aqua.animals:
+        height, width = a.get_size()
+        xs.append(a.x + width // 2)
+        ys.append(aqua._animal_top_row(a) + height // 2)
+        kinds.append(index[a.code])
+        food.append(a.get_food())
+    if np is not None:
+        return Census(np.array(xs, dtype=np.int64), np.array(ys, dtype=np.int64),
+                      np.array(kinds, dtype=np.int64), np.array(food, dtype=np.int64))
+    return Census(xs, ys, kinds, food)
+
+
+def _bin(c: Census, window, cols: int, rows: int):
+    """Per screen cell (row-major): animal count, most common species index, and mean food."""
+    zoom, cells, n_species = window.zoom, cols * rows, max(1, len(SPECIES))
+    if np is not None:
+        bx = (np.asarray(c.x) - window.x) // zoom
+        by = (np.asarray(c.y) - window.y) // zoom
+        inside = (bx >= 0) & (bx < cols) & (by >= 0) & (by < rows)
+        cell = by[inside] * cols + bx[inside]
+        counts = np.bincount(cell, minlength=cells)
+        per_species = np.bincount(cell * n_species + np.asarray(c.species)[inside], minlength=cells * n_species)
+        food = np.bincount(cell, weights=np.asarray(c.food)[inside], minlength=cells)
+        return (counts.tolist(), per_species.reshape(cells, n_species).argmax(axis=1).tolist(),
+                (food / np.maximum(counts, 1)).tolist())
+    counts, food = [0] * cells, [0] * cells
+    per_species = [[0] * n_species for _ in range(cells)]
+    for x, y, kind, fed in zip(c.x, c.y, c.species, c.food):
+        bx, by = (x - window.x) // zoom, (y - window.y) // zoom
+        if 0 <= bx < cols and 0 <= by < rows:
+            i = by * cols + bx
+            counts[i] += 1
+            per_species[i][kind] += 1
+            food[i] += fed
+    dominant = [max(range(n_species), key=tally.__getitem__) for tally in per_species]
+    return counts, dominant, [f / max(n, 1) for f, n in zip(food, counts)]
+
+
+def _background(lo: int, hi: int, board_width: int, board_height: int, across: bool) -> str:
+    """Glyph of an empty screen cell covering board columns (across) or rows [lo, hi)."""
+    if across:
+        return "|" if lo <= 0 < hi or lo <= board_width - 1 < hi else " "
+    if lo <= board_height - 1 < hi:
+        return "_"
+    return "~" if lo <= config.WATERLINE_ROW < hi else " "
+
+
+def density_lines(c: Census, window, board_width: int, board_height: int, colour: str | None = None) -> list[str]:
+    """
+    Display lines of the density view of ``window`` (a viewport.Window, or None for the whole
+    board at zoom 1) over a board of this size. ``colour`` is None, "species" (most common
+    species per cell) or "hunger" (mean food per cell).
+    """
+    if window is None:
+        window = Window(0, 0, board_width, board_height)
+    zoom = window.zoom
+    cols = min(window.width, -(-(board_width - window.x) // zoom))
+    rows = min(window.lines, -(-(board_height - window.y) // zoom))
+    if cols <= 0 or rows <= 0:
+        return []
+    counts, dominant, food = _bin(c, window, cols, rows)
+    shades = config.HEATMAP_SHADES
+    densest = max(counts) or 1
+    column_glyphs = [_background(window.x + i * zoom, window.x + (i + 1) * zoom, board_width, board_height, True)
+                     for i in range(cols)]
+    lines = []
+    for r in range(rows):
+        row_glyph = _background(window.y + r * zoom, window.y + (r + 1) * zoom, board_width, board_height, False)
+        parts = []
+        for i in range(r * cols, (r + 1) * cols):
+            n = counts[i]
+            if not n:
+                glyph = column_glyphs[i - r * cols]
+                if glyph == " ":
+                    glyph = row_glyph
+                parts.append(glyph + " ")
+                continue
+            cell = shades[-(-n * (len(shades) - 1) // densest)] * 2
+            if colour == "species":
+                cell = f"\033[{_SPECIES_COLOURS[dominant[i] % len(_SPECIES_COLOURS)]}m{cell}{_RESET}"
+            elif colour == "hunger":
+                level = 0 if food[i] <= 1 else 1 if food[i] < config.STARTING_FOOD else 2
+                cell = f"\033[{_HUNGER_COLOURS[level]}m{cell}{_RESET}"
+            parts.append(cell)
+        lines.append("".join(parts))
+    return lines
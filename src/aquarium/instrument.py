@@ -0,0 +1,198 @@
+"""
+Opt-in timing and counters for Aqua.next_turn.
+
+Instruments.attach(aqua) (or aqua.instrument()) wraps the methods that make
+up a turn with timers, as instance attributes shadowing the class methods,
+and subscribes a CounterSink to the event bus. Nothing is wrapped or
+subscribed until then, so an uninstrumented tank pays nothing; detach()
+removes it all again.
+
+Phases (seconds and calls; nested phases are also part of their parent):
+
+    object path   hunger, vertical, horizontal (includes collisions)
+    engine path   gather, hunger, fish, crabs
+    both          redraw (compositing the board, whenever it is read)
+
+Counters: collisions, bounces, deaths, and sprite cell writes (sprite
+draws and erasures on the object path). Tick latency goes into a
+log-bucketed histogram with percentiles. snapshot() returns all of it as a
+dict; to_json() and to_prometheus() export it.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import time
+
+from .events import CounterSink, EventKind
+
+# Tick latency histogram: bucket upper bounds grow by 2**(1/4) from 1 microsecond.
+_BUCKET_BASE = 1e-6
+_BUCKETS_PER_DOUBLING = 4
+_BUCKET_COUNT = 4 * 27   # up to ~134 s; slower ticks land in the last bucket
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+# (phase name, object holding the method, method name); the holder is looked up on the tank.
+_OBJECT_PHASES = (
+    ("hunger", "hunger", "tick"),
+    ("vertical", "", "up"),
+    ("vertical", "", "down"),
+    ("horizontal", "", "left"),
+    ("horizontal", "", "right"),
+    ("collisions", "", "is_collision"),
+    ("redraw", "", "_compose_into"),
+)
+_ENGINE_PHASES = (
+    ("gather", "engine", "gather"),
+    ("hunger", "engine", "_hunger_phase"),
+    ("fish", "engine", "_move_fish"),
+    ("crabs", "engine", "_step_crabs"),
+)
+_COUNTED_EVENTS = {
+    EventKind.COLLIDED: "collisions",
+    EventKind.BOUNCED: "bounces",
+    EventKind.STARVED: "deaths",
+    EventKind.DIED_OF_AGE: "deaths",
+}
+
+
+def bucket_bound(i: int) -> float:
+    """Upper bound (seconds) of latency bucket i."""
+    return _BUCKET_BASE * 2 ** (i / _BUCKETS_PER_DOUBLING)
+
+
+class Instruments:
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.phases = {}            # name -> [seconds, calls]
+        self.cell_writes = 0
+        self.ticks = 0
+        self.tick_seconds = 0.0
+        self.tick_max = 0.0
+        self.buckets = [0] * _BUCKET_COUNT
+        self._events = CounterSink(kinds=_COUNTED_EVENTS)
+        self._aqua = None
+        self._wrapped = []          # (object, attribute) pairs to delete on detach
+
+    def attach(self, aqua):
+        """Start measuring ``aqua``; its current state is synced first."""
+        if self._aqua is not None:
+            raise RuntimeError("these instruments are already attached to a tank")
+        self._aqua = aqua
+        aqua._sync()
+        self._wrap(aqua, "next_turn", self._time_tick)
+        for phase, holder, name in _OBJECT_PHASES + (_ENGINE_PHASES if aqua.engine is not None else ()):
+            self._wrap(getattr(aqua, holder) if holder else aqua, name, self._timer(phase))
+        for name in ("print_animal_on_board", "delete_animal_from_board"):
+            self._wrap(aqua, name, self._count_cells)
+        aqua.events.subscribe(self._events)
+        aqua.instruments = self
+        return self
+
+    def detach(self):
+        aqua = self._aqua
+        if aqua is None:
+            return
+        for obj, name in self._wrapped:
+            delattr(obj, name)
+        self._wrapped.clear()
+        aqua.events.unsubscribe(self._events)
+        aqua.instruments = None
+        self._aqua = None
+
+    def _wrap(self, obj, name: str, decorate):
+        setattr(obj, name, decorate(getattr(obj, name)))
+        self._wrapped.append((obj, name))
+
+    def _timer(self, phase: str):
+        totals = self.phases.setdefault(phase, [0.0, 0])
+        clock = self.clock
+
+        def decorate(method):
+            def timed(*args, **kwargs):
+                start = clock()
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    totals[0] += clock() - start
+                    totals[1] += 1
+            return timed
+        return decorate
+
+    def _time_tick(self, method):
+        clock = self.clock
+
+        def timed():
+            start = clock()
+            try:
+                return method()
+            finally:
+                self.record_tick(clock() - start)
+        return timed
+
+    def _count_cells(self, method):
+        def counted(a):
+            height, width = a.get_size()
+            self.cell_writes += height * width
+            return method(a)
+        return counted
+
+    def record_tick(self, seconds: float):
+        self.ticks += 1
+        self.tick_seconds += seconds
+        self.tick_max = max(self.tick_max, seconds)
+        i = 0 if seconds <= _BUCKET_BASE else math.ceil(math.log2(seconds / _BUCKET_BASE) * _BUCKETS_PER_DOUBLING)
+        self.buckets[min(i, _BUCKET_COUNT - 1)] += 1
+
+    def percentile(self, p: float) -> float:
+        """Tick latency (seconds) below which ``p`` percent of ticks fall, to bucket resolution."""
+        if not self.ticks:
+            return 0.0
+        rank = p / 100 * self.ticks
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min(bucket_bound(i), self.tick_max)
+        return self.tick_max
+
+    def counters(self) -> dict:
+        counts = dict.fromkeys(sorted(set(_COUNTED_EVENTS.values())), 0)
+        for kind, name in _COUNTED_EVENTS.items():
+            counts[name] += self._events.counts[kind.value]
+        counts["cell_writes"] = self.cell_writes
+        return counts
+
+    def snapshot(self) -> dict:
+        return {
+            "ticks": self.ticks,
+            "tick_seconds": self.tick_seconds,
+            "tick_max_seconds": self.tick_max,
+            "tick_percentiles": {str(p): self.percentile(p) for p in PERCENTILES},
+            "phases": {name: {"seconds": seconds, "calls": calls} for name, (seconds, calls) in self.phases.items()},
+            "counters": self.counters(),
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot())
+
+    def to_prometheus(self, prefix: str = "aquarium") -> str:
+        """The measurements in the Prometheus text exposition format."""
+        lines = [f"# TYPE {prefix}_phase_seconds_total counter"]
+        lines += [f'{prefix}_phase_seconds_total{{phase="{name}"}} {seconds!r}'
+                  for name, (seconds, _) in self.phases.items()]
+        lines.append(f"# TYPE {prefix}_phase_calls_total counter")
+        lines += [f'{prefix}_phase_calls_total{{phase="{name}"}} {calls}' for name, (_, calls) in self.phases.items()]
+        for name, value in self.counters().items():
+            lines += [f"# TYPE {prefix}_{name}_total counter", f"{prefix}_{name}_total {value}"]
+        lines.append(f"# TYPE {prefix}_tick_seconds histogram")
+        cumulative = 0
+        for i, count in enumerate(self.buckets[:-1]):
+            cumulative += count
+            lines.append(f'{prefix}_tick_seconds_bucket{{le="{bucket_bound(i):.9g}"}} {cumulative}')
+        lines.append(f'{prefix}_tick_seconds_bucket{{le="+Inf"}} {self.ticks}')
+        lines.append(f"{prefix}_tick_seconds_sum {self.tick_seconds!r}")
+        lines.append(f"{prefix}_tick_seconds_count {self.ticks}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,164 @@
+"""
+Asyncio run loop for the animated views (demo, several steps).
+
+Three tasks share one event loop:
+
+    keys        stdin is read as it becomes readable, with the terminal kept in
+                cbreak mode for the whole run; P pauses or resumes, Q quits,
+                other keys go to ``on_key`` (e.g. scrolling the viewport)
+    simulation  one turn per fixed timestep, catching up after a late wake-up
+    render      draws the newest state at most ``fps`` times a second; the
+                frame is built and written in a worker thread, and states
+                produced while it is busy are never drawn
+
+so a slow terminal holds up neither input nor the simulation, and a paused
+run waits on an event instead of polling.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from contextlib import nullcontext
+from typing import Callable
+
+from . import config, terminal_io
+from .renderer import DiffRenderer
+
+# Turns the simulation may fall behind before it gives up catching up.
+_MAX_LAG_STEPS = 5
+# Poll interval for keys on Windows, where consoles cannot be watched by the event loop.
+_WINDOWS_KEY_POLL_SECONDS = 0.02
+
+
+class LiveRun:
+    """
+    Runs ``steps`` turns: ``step(i)`` plays turn i and ``frame(done, paused)`` returns the
+    display lines for the state after ``done`` turns. ``frame`` runs in a worker thread while
+    turns go on, so it should read a published frame (Aqua.read_frame). ``on_key(key)``
+    is called with every other key and returns True if the frame needs redrawing.
+    ``keys`` is an asyncio.Queue of keys to use instead of stdin.
+    """
+
+    def __init__(self, steps: int, step: Callable[[int], None], frame: Callable[[int, bool], list[str]],
+                 steps_per_second: float, fps: float = config.DISPLAY_FPS, renderer: DiffRenderer | None = None,
+                 keys: asyncio.Queue | None = None, on_key: Callable[[str], bool] | None = None):
+        self.steps = steps
+        self.step = step
+        self.frame = frame
+        self.step_interval = 1 / steps_per_second
+        self.frame_interval = 1 / fps
+        self.renderer = renderer if renderer is not None else DiffRenderer()
+        self.keys = keys
+        self.on_key = on_key
+        self.done = 0
+        self.paused = False
+        self.frames = 0
+
+    async def run(self) -> bool:
+        """Play the turns; False if the user quit first."""
+        self._resume = asyncio.Event()
+        self._resume.set()
+        self._changed = asyncio.Event()
+        self._changed.set()
+        self._closing = False
+        with terminal_io.raw_mode() if self.keys is None else nullcontext():
+            keys, stop_keys = (self.keys, None) if self.keys is not None else self._stdin_keys()
+            try:
+                reader = asyncio.create_task(self._read_keys(keys))
+                simulation = asyncio.create_task(self._simulate())
+                render = asyncio.create_task(self._render())
+                await asyncio.wait((reader, simulation), return_when=asyncio.FIRST_COMPLETED)
+                completed = simulation.done()
+                for task in (reader, simulation):
+                    task.cancel()
+                self._closing = True
+                self._changed.set()
+                await asyncio.gather(reader, simulation, render, return_exceptions=True)
+                for task in (reader, simulation, render):
+                    if not task.cancelled() and task.exception() is not None:
+                        raise task.exception()
+            finally:
+                if stop_keys is not None:
+                    stop_keys()
+        return completed
+
+    def _stdin_keys(self) -> tuple[asyncio.Queue, Callable[[], None] | None]:
+        """A queue fed with keys from stdin, and a function that stops feeding it."""
+        queue = asyncio.Queue()
+        if not sys.stdin.isatty():
+            return queue, None
+        loop = asyncio.get_running_loop()
+        if sys.platform == "win32":
+            async def poll():
+                while True:
+                    key = terminal_io.try_get_key()
+                    if key is not None:
+                        queue.put_nowait(key)
+                    else:
+                        await asyncio.sleep(_WINDOWS_KEY_POLL_SECONDS)
+            task = loop.create_task(poll())
+            return queue, task.cancel
+        fd = sys.stdin.fileno()
+
+        def readable():
+            for key in terminal_io.decode_keys(os.read(fd, 64)):
+                queue.put_nowait(key)
+        loop.add_reader(fd, readable)
+        return queue, lambda: loop.remove_reader(fd)
+
+    async def _read_keys(self, keys: asyncio.Queue):
+        while True:
+            key = await keys.get()
+            if key == "q":
+                return
+            if key == "p":
+                self.paused = not self.paused
+                if self.paused:
+                    self._resume.clear()
+                else:
+                    self._resume.set()
+                self._changed.set()
+            elif self.on_key is not None and self.on_key(key):
+                self._changed.set()
+
+    async def _simulate(self):
+        loop = asyncio.get_running_loop()
+        due = loop.time()
+        while self.done < self.steps:
+            if not self._resume.is_set():
+                await self._resume.wait()
+                due = loop.time()  # do not try to catch up on the pause
+            now = loop.time()
+            if now < due:
+                await asyncio.sleep(due - now)
+                continue
+            self.step(self.done)
+            self.done += 1
+            self._changed.set()
+            due = max(due + self.step_interval, now - _MAX_LAG_STEPS * self.step_interval)
+            await asyncio.sleep(0)  # let keys and frames through while catching up
+
+    async def _render(self):
+        loop = asyncio.get_running_loop()
+        next_frame = loop.time()
+        while True:
+            await self._changed.wait()
+            if self._closing:
+                return
+            self._changed.clear()
+            await asyncio.to_thread(self._draw, self.done, self.paused)
+            self.frames += 1
+            next_frame = max(next_frame + self.frame_interval, loop.time())
+            await asyncio.sleep(next_frame - loop.time())
+
+    def _draw(self, done: int, paused: bool):
+        self.renderer.render(self.frame(done, paused))
+
+
+def run_live(steps: int, step: Callable[[int], None], frame: Callable[[int, bool], list[str]],
+             steps_per_second: float, fps: float = config.DISPLAY_FPS,
+             on_key: Callable[[str], bool] | None = None) -> bool:
+    """Run a LiveRun on a new event loop; False if the user quit first."""
+    return asyncio.run(LiveRun(steps, step, frame, steps_per_second, fps, on_key=on_key).run())
@@ -0,0 +1,89 @@
+"""
+Occupancy layer: which animal owns each cell of the tank.
+
+Mirrors every sprite write to the board, but instead of glyphs it keeps, per
+row, a byte mask (1 where a '*' is drawn) and the id of the animal whose
+sprite was drawn over each cell. "Is this rectangle free?" is then one
+C-level search per row, independent of the sprite glyphs. Masks are kept as
+bytes rather than one big int per row so that updates cost O(sprite width)
+even on tanks that are thousands of columns wide.
+"""
+
+from __future__ import annotations
+
+from array import array
+
+
+class Occupancy:
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.clear()
+
+    def clear(self):
+        self.masks = [bytearray(self.width) for _ in range(self.height)]
+        self.owners = [array("q", bytes(8 * self.width)) for _ in range(self.height)]
+
+    def paint(self, animal_id: int, x: int, rows, sprite_masks):
+        """Record a sprite drawn at column x over the given rows, from its per-row masks (Sprite.masks)."""
+        masks, owners = self.masks, self.owners
+        width = len(sprite_masks[0]) if sprite_masks else 0
+        if x < 0 or x + width > self.width:
+            lo, hi = max(0, -x), max(0, min(width, self.width - x))
+            x, width = x + lo, hi - lo
+            sprite_masks = [mask[lo:hi] for mask in sprite_masks]
+        owner = array("q", [animal_id]) * width
+        for row, mask in zip(rows, sprite_masks):
+            masks[row][x:x + width] = mask
+            owners[row][x:x + width] = owner
+
+    def erase(self, x: int, rows, width: int):
+        """Record that columns x..x+width-1 of the given rows were cleared."""
+        if x < 0:
+            width, x = width + x, 0
+        width = min(width, self.width - x)
+        if width <= 0:
+            return
+        blank, no_owner = bytes(width), array("q", bytes(8 * width))
+        for row in rows:
+            self.masks[row][x:x + width] = blank
+            self.owners[row][x:x + width] = no_owner
+
+    def _spans(self, x: int, y: int, width: int, height: int):
+        """Yield (row, x0, x1) for each in-bounds row of a rectangle, clipped to the tank."""
+        x0, x1 = max(0, x), min(self.width, x + width)
+        if x1 <= x0:
+            return
+        for row in range(max(0, y), min(self.height, y + height)):
+            yield row, x0, x1
+
+    def is_free(self, x: int, y: int, width: int, height: int) -> bool:
+        """True if no '*' cell lies inside the rectangle."""
+        masks = self.masks
+        for row, x0, x1 in self._spans(x, y, width, height):
+            if masks[row].find(1, x0, x1) != -1:
+                return False
+        return True
+
+    def first_free(self, x: int, y: int, width: int, height: int, x_max: int) -> int | None:
+        """
+        Smallest column in [x, x_max] where the rectangle with its top row at y is free, or None.
+        Jumps past the last occupied column of each blocked position instead of trying every column.
+        """
+        rows = [self.masks[row] for row in range(max(0, y), min(self.height, y + height))]
+        if not rows:
+            return x if x <= x_max else None
+        while x <= x_max:
+            last = max(mask.rfind(1, max(0, x), x + width) for mask in rows)
+            if last == -1:
+                return x
+            x = last + 1
+        return None
+
+    def blocker(self, x: int, y: int, width: int, height: int) -> int | None:
+        """Id of the animal drawn over the first occupied cell in the rectangle, or None."""
+        for row, x0, x1 in self._spans(x, y, width, height):
+            col = self.masks[row].find(1, x0, x1)
+            if col != -1:
+                return self.owners[row][col]
+        return None
@@ -2,16 +2,8 @@ from . import config, crab
 
 
 class Ocypode(crab.Crab):
-    def __init__(self, name, age, x, y, directionH):
-        super().__init__(name, age, x, y, directionH)
-        self.width = config.OCYPODE_WIDTH
-        self.height = config.OCYPODE_HEIGHT
+    __slots__ = ()
 
-    def get_animal(self):
-        ocypode = [
-            ' *   * ',
-            '  ***  ',
-            '*******',
-            '*     *'
-        ]
-        return ocypode
+    code = "oc"
+    width = config.OCYPODE_WIDTH
+    height = config.OCYPODE_HEIGHT
@@ -5,57 +5,27 @@ User moves with arrow keys, Enter to place, ESC to cancel.
 
 from __future__ import annotations
 
-from . import config, moly, ocypode, scalar, shrimp
+from . import config, species
 from .terminal_io import KEY_DOWN, KEY_ENTER, KEY_ESCAPE, KEY_LEFT, KEY_RIGHT, KEY_UP, clear_screen, get_key
 
 
-# Placement dimensions and bounds by type code
-_PLACEMENT = {
-    "sc": (config.SCALAR_WIDTH, config.SCALAR_HEIGHT, True),
-    "mo": (config.MOLY_WIDTH, config.MOLY_HEIGHT, True),
-    "oc": (config.OCYPODE_WIDTH, config.OCYPODE_HEIGHT, False),
-    "sh": (config.SHRIMP_WIDTH, config.SHRIMP_HEIGHT, False),
-}
-
-
 def _get_placement_sprite(code: str) -> tuple[list[str], int, int]:
     """Return (sprite lines, width, height) for the animal type. Sprite faces right."""
-    w, h, _ = _PLACEMENT[code]
-    if code == "sc":
-        a = scalar.Scalar("", 0, 0, 0, config.DIR_RIGHT, 0)
-    elif code == "mo":
-        a = moly.Moly("", 0, 0, 0, config.DIR_RIGHT, 0)
-    elif code == "oc":
-        a = ocypode.Ocypode("", 0, 0, 0, config.DIR_RIGHT)
-    elif code == "sh":
-        a = shrimp.Shrimp("", 0, 0, 0, config.DIR_RIGHT)
-    else:
-        return ([], w, h)
-    return (a.get_animal(), w, h)
+    kind = species.SPECIES[code]
+    return (kind.frames[config.DIR_RIGHT].lines, kind.width, kind.height)
 
 
 def _bounds(aqua, code: str):
     """Return (width, height, x_min, x_max, y_min, y_max, cursor_y_for_crab)."""
-    w, h, is_fish = _PLACEMENT[code]
-    aq_w = aqua.aqua_width
-    aq_h = aqua.aqua_height
-    x_min = 1
-    x_max = max(1, aq_w - w - 1)
-    if is_fish:
-        fish_bottom = config.fish_lowest_y(aq_h)
-        y_min = config.WATERLINE
-        y_max = max(y_min, fish_bottom - h)
-        return w, h, x_min, x_max, y_min, y_max, None
-    else:
-        # Crab: y is fixed; we only move x. Use same row logic as aqua._crab_row.
-        crab_top = config.crab_row_index(aq_h, h, 0)
-        return w, h, x_min, x_max, crab_top, crab_top, crab_top
+    kind = species.SPECIES[code]
+    x_min, x_max, y_min, y_max = kind.placement_bounds(aqua.aqua_width, aqua.aqua_height)
+    return kind.width, kind.height, x_min, x_max, y_min, y_max, None if kind.is_fish else y_min
 
 
 def _draw_board_with_cursor(
     aqua, cursor_x: int, cursor_y: int, can_place: bool,
     sprite: list[str], w: int, h: int, is_fish: bool,
-    animal_type_code: str,
+    animal_type_code: str, blocker=None,
 ) -> None:
     """Print the aquarium board with the placement sprite drawn at (cursor_x, cursor_y)."""
     lines, line_to_board_row = aqua.get_display_lines()
@@ -74,9 +44,11 @@ def _draw_board_with_cursor(
         lines[i] = "".join(line_list)
     for line in lines:
         print(line)
-    type_name = next((t.name for t in config.ANIMAL_TYPES if t.code == animal_type_code), animal_type_code)
+    type_name = species.SPECIES[animal_type_code].label
     if can_place:
         status = f"  Placing {type_name}: [OK - space free]  Enter to place"
+    elif blocker is not None:
+        status = f"  Placing {type_name}: [No room here - {blocker.name} is in the way]  Move to a free spot"
     else:
         status = f"  Placing {type_name}: [No room here]  Move to a free spot"
     print(status)
@@ -88,7 +60,7 @@ def run_placement(aqua, animal_type_code: str) -> tuple[int, int] | None:
     Returns (x, y) on confirm, or None if user cancels.
     """
     w, h, x_min, x_max, y_min, y_max, crab_cursor_y = _bounds(aqua, animal_type_code)
-    is_fish = animal_type_code in ("sc", "mo")
+    is_fish = species.SPECIES[animal_type_code].is_fish
     sprite, sprite_w, sprite_h = _get_placement_sprite(animal_type_code)
 
     # Initial cursor: middle of valid range
@@ -98,7 +70,9 @@ def run_placement(aqua, animal_type_code: str) -> tuple[int, int] | None:
     while True:
         clear_screen()
         can_place = aqua.check_if_free(cursor_x, cursor_y, width=w, height=h)
-        _draw_board_with_cursor(aqua, cursor_x, cursor_y, can_place, sprite, sprite_w, sprite_h, is_fish, animal_type_code)
+        blocker = None if can_place else aqua.find_blocker(cursor_x, cursor_y, width=w, height=h)
+        _draw_board_with_cursor(aqua, cursor_x, cursor_y, can_place, sprite, sprite_w, sprite_h, is_fish,
+                                animal_type_code, blocker)
         print()
         print("  Arrow keys: move  |  Enter: place here  |  ESC: cancel")
         print()
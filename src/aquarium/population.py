@@ -0,0 +1,161 @@
+"""
+Bulk population: add many animals to a tank in one pass.
+
+A population is given column-wise, as a dict of equally long lists:
+
+    type        species code (required)
+    name        default: type code + entry index
+    age         default: 1
+    x, y        position, as for Aqua.add_animal; None (or missing) to let the packer choose
+    directionH  default: DIR_LEFT
+    directionV  default: DIR_DOWN
+
+or read from a CSV file (a header row with those column names) or a JSON
+Lines file (one object per line) by load_population().
+
+Entries are accepted by the same rule as add_animal: the (clamped)
+rectangle must be free of other sprites, including those placed earlier in
+the same call. Entries without a position are packed first-fit, row by row,
+into the animal's zone. Occupancy only grows during a call, so a spot found
+taken for one shape stays taken, and each shape's search resumes where the
+previous one stopped.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from typing import NamedTuple
+
+from . import config
+from .events import EventKind
+from .species import SPECIES
+
+COLUMNS = ("type", "name", "age", "x", "y", "directionH", "directionV")
+_INT_COLUMNS = ("age", "x", "y", "directionH", "directionV")
+
+
+class BulkResult(NamedTuple):
+    """Outcome of Aqua.add_many."""
+    added: list      # animal ids, in entry order
+    rejected: dict   # entry index -> reason
+
+
+def load_population(path) -> dict:
+    """Read a CSV or JSON Lines population file into columns."""
+    path = Path(path)
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.suffix.lower() == ".csv":
+            rows = [{key: (value if value != "" else None) for key, value in row.items()} for row in csv.DictReader(f)]
+        else:
+            rows = [json.loads(line) for line in f if line.strip()]
+    columns = {name: [row.get(name) for row in rows] for name in COLUMNS}
+    for name in _INT_COLUMNS:
+        columns[name] = [None if value is None else int(value) for value in columns[name]]
+    return columns
+
+
+def _column(columns: dict, name: str, n: int) -> list:
+    values = columns.get(name)
+    if values is None:
+        return [None] * n
+    if len(values) != n:
+        raise ValueError(f"column {name!r} has {len(values)} entries, expected {n}")
+    return list(values)
+
+
+def _check_rect(aqua, kind, x: int, y: int) -> tuple[int, int]:
+    """The position add_fish/add_crab would check for an animal requested at (x, y)."""
+    limits = config.MAX_FISH_WIDTH if kind.is_fish else config.MAX_CRAB_WIDTH
+    max_width = max(limits, kind.width)
+    if (aqua.aqua_width - x) < max_width + 1:
+        x = aqua.aqua_width - max_width - 1
+    if kind.is_fish:
+        return x, min(y, config.fish_lowest_y(aqua.aqua_height) - kind.height)
+    return x, aqua.aqua_height - config.MAX_CRAB_HEIGHT
+
+
+class _Packer:
+    """First-fit search for free spots, one resumable cursor per species."""
+
+    def __init__(self, aqua):
+        self.aqua = aqua
+        self.cursors = {}   # species code -> (y, x) where its search continues
+
+    def find(self, kind) -> tuple[int, int] | None:
+        aqua = self.aqua
+        x_min, x_max, y_min, y_max = kind.placement_bounds(aqua.aqua_width, aqua.aqua_height)
+        x_max, y_min = _check_rect(aqua, kind, x_max, y_min)
+        if not kind.is_fish:
+            y_max = y_min
+        y, x = self.cursors.get(kind.code, (y_min, x_min))
+        while y <= y_max:
+            found = aqua.occupancy.first_free(x, y, kind.width, kind.height, x_max)
+            if found is not None:
+                self.cursors[kind.code] = (y, found)
+                return found, y
+            y, x = y + 1, x_min
+        self.cursors[kind.code] = (y, x)
+        return None
+
+
+def add_many(aqua, columns: dict, relocate: bool = False) -> BulkResult:
+    """
+    Add the animals described by ``columns`` (see module docstring). With ``relocate``, an
+    entry whose requested spot is taken is packed like one without a position instead of
+    being rejected. Rejections are reported in the result, not as events.
+    """
+    types = list(columns["type"])
+    n = len(types)
+    names, ages, xs, ys = (_column(columns, name, n) for name in ("name", "age", "x", "y"))
+    dirs_h, dirs_v = _column(columns, "directionH", n), _column(columns, "directionV", n)
+
+    aqua._sync()
+    aqua._exact_occupancy()
+    occupancy, packer = aqua.occupancy, _Packer(aqua)
+    added, rejected, new = [], {}, []
+    for i, code in enumerate(types):
+        kind = SPECIES.get(code)
+        if kind is None:
+            rejected[i] = f"unknown type {code!r}"
+            continue
+        spot = None
+        if xs[i] is not None and (ys[i] is not None or not kind.is_fish):
+            spot = _check_rect(aqua, kind, xs[i], ys[i] if ys[i] is not None else 0)
+            if min(spot) < 0:
+                rejected[i] = "outside the tank"
+                continue
+            if not occupancy.is_free(*spot, kind.width, kind.height):
+                spot = None
+                if not relocate:
+                    rejected[i] = "no room"
+                    continue
+        if spot is None:
+            spot = packer.find(kind)
+            if spot is None:
+                rejected[i] = "no room"
+                continue
+        x, y = spot
+        name = names[i] if names[i] is not None else f"{code}{i}"
+        age = ages[i] if ages[i] is not None else 1
+        a = kind.make(name, age, x, y,
+                      dirs_h[i] if dirs_h[i] is not None else config.DIR_LEFT,
+                      dirs_v[i] if dirs_v[i] is not None else config.DIR_DOWN)
+        aqua.animals.add(a)
+        top = aqua._animal_top_row(a)
+        occupancy.paint(a.animal_id, x, range(top, top + kind.height), a.get_sprite().masks)
+        new.append(a)
+        added.append(a.animal_id)
+
+    for a in new:
+        aqua.hunger.add(a)
+        if not a.is_fish:
+            aqua.crabs.add(a, a.x, a.width)
+        aqua.events.emit(EventKind.BORN, aqua.turn, a)
+        aqua.print_animal_on_board(a)
+        if aqua.recorder is not None:
+            aqua.recorder.added(a)
+    if new:
+        aqua._invalidate()
+    return BulkResult(added, rejected)
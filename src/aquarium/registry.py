@@ -0,0 +1,116 @@
+"""
+Animal registry: the population of a tank, in insertion order.
+
+Animals get stable integer ids (never reused) and live in a slot list.
+Removing one leaves a hole that iteration skips, so deaths cost O(1) and
+are safe in the middle of a loop over the population; the holes are
+compacted away in bulk once they make up half of the slots. Id and name
+lookups go through hash indexes.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+from . import animal
+
+
+class AnimalRegistry:
+    def __init__(self):
+        self._slots = []      # animals in insertion order; None where one was removed
+        self._slot_of = {}    # animal id -> index in _slots
+        self._names = {}      # name -> {animal id: animal}, in insertion order
+        self._next_id = 1     # 0 is reserved for "no animal" (e.g. empty occupancy cells)
+        self._holes = 0
+        self._iterating = 0
+
+    def __len__(self) -> int:
+        return len(self._slots) - self._holes
+
+    def __contains__(self, a) -> bool:
+        slot = self._slot_of.get(getattr(a, "animal_id", 0))
+        return slot is not None and self._slots[slot] is a
+
+    def __iter__(self) -> Iterator[animal.Animal]:
+        """Live animals in insertion order. Animals removed meanwhile are skipped; ones added are not visited."""
+        slots = self._slots
+        self._iterating += 1
+        try:
+            for i in range(len(slots)):
+                a = slots[i]
+                if a is not None:
+                    yield a
+        finally:
+            self._iterating -= 1
+
+    def add(self, a: animal.Animal) -> int:
+        """Register an animal under a new id and return it."""
+        a.animal_id = self._next_id
+        self._next_id += 1
+        self._insert(a)
+        return a.animal_id
+
+    def insert(self, a: animal.Animal):
+        """Register an animal that already has an id (e.g. one recreated from a replay log)."""
+        self._insert(a)
+        self._next_id = max(self._next_id, a.animal_id + 1)
+
+    def _insert(self, a: animal.Animal):
+        self._slot_of[a.animal_id] = len(self._slots)
+        self._slots.append(a)
+        self._names.setdefault(a.name, {})[a.animal_id] = a
+
+    def remove(self, a: animal.Animal):
+        """Remove an animal in O(1) (amortised); a no-op if it is not registered."""
+        if a not in self:
+            return
+        self._slots[self._slot_of.pop(a.animal_id)] = None
+        same_name = self._names[a.name]
+        del same_name[a.animal_id]
+        if not same_name:
+            del self._names[a.name]
+        self._holes += 1
+        if self._holes * 2 > len(self._slots) and not self._iterating:
+            self.compact()
+
+    def compact(self):
+        """Drop the holes left by removals. Skipped while the registry is being iterated."""
+        if not self._holes or self._iterating:
+            return
+        self._slots = [a for a in self._slots if a is not None]
+        self._slot_of = {a.animal_id: i for i, a in enumerate(self._slots)}
+        self._holes = 0
+
+    def replace(self, animals):
+        """Replace the population with ``animals`` (already registered, ids kept), in that order."""
+        self._slots = []
+        self._slot_of.clear()
+        self._names.clear()
+        self._holes = 0
+        for a in animals:
+            self._insert(a)
+
+    def clear(self):
+        self.replace(())
+
+    @property
+    def next_id(self) -> int:
+        """Id the next added animal will get."""
+        return self._next_id
+
+    def restore(self, animals, next_id: int):
+        """Load a saved population (ids already assigned) and id counter."""
+        self.replace(animals)
+        self._next_id = next_id
+
+    def get(self, animal_id: int) -> animal.Animal | None:
+        slot = self._slot_of.get(animal_id)
+        return None if slot is None else self._slots[slot]
+
+    def by_name(self, name: str) -> list[animal.Animal]:
+        """All animals with this name, oldest registration first."""
+        return list(self._names.get(name, {}).values())
+
+    def as_list(self) -> list[animal.Animal]:
+        self.compact()
+        return [a for a in self._slots if a is not None]
@@ -0,0 +1,78 @@
+"""
+Incremental terminal renderer for animation loops (demo, several steps).
+
+DiffRenderer remembers the last frame it drew and, for the next one, emits
+only ANSI cursor moves plus the characters that changed, in a single
+buffered write. It falls back to a full repaint on the first frame, when
+the number of lines changes, or when the terminal is resized. Lines with
+colour escapes (the coloured density view) are rewritten whole when they
+change, since their string positions are not screen columns.
+"""
+
+from __future__ import annotations
+
+import shutil
+import sys
+
+# Runs of changed cells closer than this are merged: rewriting a few unchanged
+# characters is cheaper than another cursor-move sequence.
+_MERGE_GAP = 4
+
+
+def changed_spans(old: str, new: str) -> list[tuple[int, int]]:
+    """Return [start, end) column ranges where ``new`` differs from ``old``."""
+    spans = []
+    start = None
+    last_diff = -_MERGE_GAP - 1
+    for i in range(min(len(old), len(new))):
+        if old[i] != new[i]:
+            if start is None:
+                start = i
+            elif i - last_diff > _MERGE_GAP:
+                spans.append((start, last_diff + 1))
+                start = i
+            last_diff = i
+    if start is not None:
+        spans.append((start, last_diff + 1))
+    if len(new) > len(old):
+        if spans and len(old) - spans[-1][1] <= _MERGE_GAP:
+            spans[-1] = (spans[-1][0], len(new))
+        else:
+            spans.append((len(old), len(new)))
+    return spans
+
+
+class DiffRenderer:
+    def __init__(self, stream=None):
+        self.stream = stream if stream is not None else sys.stdout
+        self._previous = None
+        self._size = None
+
+    def invalidate(self):
+        """Force a full repaint on the next frame (e.g. after other output was printed)."""
+        self._previous = None
+
+    def render(self, lines: list[str]) -> None:
+        """Draw a frame (list of text lines), writing only what changed since the last one."""
+        size = shutil.get_terminal_size()
+        previous = self._previous
+        if previous is None or size != self._size or len(lines) != len(previous):
+            out = ["\033[2J\033[H", "\n".join(lines), "\n"]
+        else:
+            out = []
+            for row, (old, new) in enumerate(zip(previous, lines)):
+                if old == new:
+                    continue
+                if "\033" in old or "\033" in new:
+                    out.append(f"\033[{row + 1};1H{new}\033[0m\033[K")
+                    continue
+                for start, end in changed_spans(old, new):
+                    out.append(f"\033[{row + 1};{start + 1}H{new[start:end]}")
+                if len(new) < len(old):
+                    out.append(f"\033[{row + 1};{len(new) + 1}H\033[K")
+            # Park the cursor below the frame so later prints do not overwrite it.
+            out.append(f"\033[{len(lines) + 1};1H")
+        self.stream.write("".join(out))
+        self.stream.flush()
+        self._previous = list(lines)
+        self._size = size
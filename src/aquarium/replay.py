@@ -0,0 +1,220 @@
+"""
+Append-only replay log of a simulation, with seeking.
+
+A ReplayRecorder attached to a tank appends one record per change:
+
+    KEYFRAME  a full snapshot (snapshot.dumps), every ``keyframe_every`` turns
+    TURN      one next_turn: which animals died, the new position and
+              directions of every animal that moved or turned, and whether
+              this was a hunger (and aging) turn
+    FEED      feed_all and the amount given to every animal
+    ADD       an animal added to the tank
+
+Each record is a small header (kind, body length, turn) and a packed body.
+ReplayLog seeks to a turn by restoring the nearest earlier keyframe and
+applying the records after it; nothing is re-simulated.
+"""
+
+from __future__ import annotations
+
+import bisect
+import mmap
+import struct
+
+from . import config
+from .aqua import Aqua
+from .events import EventBus
+from .snapshot import RECORD_SIZE, Snapshot, animal_from_record, dumps, record_of, unpack_record
+
+MAGIC = b"AQLOG1"
+
+KEYFRAME, TURN, FEED, ADD = 1, 2, 3, 4
+
+_HEADER = struct.Struct("<BIQ")        # kind, body length, turn
+_TURN = struct.Struct("<BII")          # flags, deaths, changes
+_CHANGE = struct.Struct("<Qqqbb")      # id, x, y, directionH, directionV
+_DEATH = struct.Struct("<Q")
+_FEED = struct.Struct("<q")
+
+# TURN flags.
+HUNGER, AGING = 1, 2
+
+DEFAULT_KEYFRAME_EVERY = 1000
+
+
+def _pose(a) -> tuple:
+    return a.x, a.y, a.directionH, getattr(a, "directionV", 0)
+
+
+def _poses(aqua) -> dict:
+    """Animal id -> pose, read without handing the animals out (which would make the engine re-gather)."""
+    engine = aqua.engine
+    if engine is not None and not engine._stale:
+        return dict(zip((a.animal_id for a in engine.objs),
+                        zip(engine.x.tolist(), engine.y.tolist(), engine.dir_h.tolist(), engine.dir_v.tolist())))
+    return {a.animal_id: _pose(a) for a in aqua.animals}
+
+
+class ReplayRecorder:
+    """Logs every change to ``aqua`` to ``path`` until closed."""
+
+    def __init__(self, aqua: Aqua, path, keyframe_every: int = DEFAULT_KEYFRAME_EVERY):
+        self.aqua = aqua
+        self.keyframe_every = keyframe_every
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self._before = None
+        aqua.recorder = self
+        self.keyframe()
+
+    def close(self):
+        if self.aqua.recorder is self:
+            self.aqua.recorder = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _write(self, kind: int, body: bytes):
+        self._file.write(_HEADER.pack(kind, len(body), self.aqua.turn))
+        self._file.write(body)
+
+    def keyframe(self):
+        self._last_keyframe = self.aqua.turn
+        self._write(KEYFRAME, dumps(self.aqua))
+
+    def added(self, a):
+        record, name = record_of(a)
+        self._write(ADD, record + name)
+
+    def fed(self, amount: int):
+        self._write(FEED, _FEED.pack(amount))
+
+    def before_turn(self):
+        if self.aqua.turn - self._last_keyframe >= self.keyframe_every:
+            self.keyframe()
+        self._before = _poses(self.aqua)
+
+    def after_turn(self):
+        turn = self.aqua.turn - 1
+        before = self._before
+        changes = []
+        for animal_id, pose in _poses(self.aqua).items():
+            if before.pop(animal_id) != pose:
+                changes.append(_CHANGE.pack(animal_id, *pose))
+        flags = 0
+        if turn % config.TURNS_PER_FOOD_DECREMENT == 0:
+            flags |= HUNGER
+            if turn % config.TURNS_PER_AGE_INCREMENT == 0:
+                flags |= AGING
+        body = [_TURN.pack(flags, len(before), len(changes))]
+        body += [_DEATH.pack(animal_id) for animal_id in before]
+        body += changes
+        self._file.write(_HEADER.pack(TURN, sum(map(len, body)), turn))
+        self._file.write(b"".join(body))
+        self._before = None
+
+
+class ReplayLog:
+    """A recorded log, memory-mapped. ``seek(turn)`` rebuilds the tank as it was when that turn began."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path}: not an aquarium replay log")
+        self._keyframes = []     # offsets of KEYFRAME records
+        self._turns = []         # turn number of each TURN record
+        self._turn_offsets = []  # ... and its offset
+        offset, end = len(MAGIC), len(self._map)
+        while offset + _HEADER.size <= end:
+            kind, length, turn = _HEADER.unpack_from(self._map, offset)
+            if offset + _HEADER.size + length > end:
+                break  # truncated tail (e.g. the recorder is still writing)
+            if kind == KEYFRAME:
+                self._keyframes.append(offset)
+            elif kind == TURN:
+                self._turns.append(turn)
+                self._turn_offsets.append(offset)
+            offset += _HEADER.size + length
+        self._end = offset
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def first_turn(self) -> int:
+        return _HEADER.unpack_from(self._map, self._keyframes[0])[2]
+
+    @property
+    def last_turn(self) -> int:
+        """Last turn that can be sought to (the state after the last recorded turn)."""
+        return self._turns[-1] + 1 if self._turns else self.first_turn
+
+    def _records(self, start: int, stop: int):
+        offset = start
+        while offset < stop:
+            kind, length, turn = _HEADER.unpack_from(self._map, offset)
+            body = offset + _HEADER.size
+            yield kind, turn, body, length
+            offset = body + length
+
+    def seek(self, turn: int) -> Aqua:
+        """The tank as it was just before next_turn() ran with aqua.turn == ``turn`` (after feedings/additions)."""
+        if not self.first_turn <= turn <= self.last_turn:
+            raise ValueError(f"turn {turn} is outside the log ({self.first_turn}..{self.last_turn})")
+        i = bisect.bisect_left(self._turns, turn)
+        stop = self._turn_offsets[i] if i < len(self._turns) else self._end
+        start = self._keyframes[bisect.bisect_left(self._keyframes, stop) - 1]
+        _, length, _ = _HEADER.unpack_from(self._map, start)
+        body = start + _HEADER.size
+        aqua = Snapshot(self._map[body:body + length]).restore(events=EventBus())
+        if self._apply(aqua, body + length, stop):
+            aqua.reindex()
+        return aqua
+
+    def _apply(self, aqua: Aqua, start: int, stop: int) -> bool:
+        animals, data = aqua.animals, self._map
+        applied = False
+        for kind, turn, body, length in self._records(start, stop):
+            applied = True
+            if kind == TURN:
+                flags, deaths, changes = _TURN.unpack_from(data, body)
+                offset = body + _TURN.size
+                for (animal_id,) in _DEATH.iter_unpack(data[offset:offset + deaths * _DEATH.size]):
+                    animals.remove(animals.get(animal_id))
+                offset += deaths * _DEATH.size
+                if flags:
+                    aged = bool(flags & AGING)
+                    for a in animals:
+                        a.food -= 1
+                        a.age += aged
+                for animal_id, x, y, dir_h, dir_v in _CHANGE.iter_unpack(data[offset:offset + changes * _CHANGE.size]):
+                    a = animals.get(animal_id)
+                    a.x, a.y, a.directionH = x, y, dir_h
+                    if a.is_fish:
+                        a.directionV = dir_v
+                aqua.turn = turn + 1
+            elif kind == FEED:
+                (amount,) = _FEED.unpack_from(data, body)
+                for a in animals:
+                    a.food += amount
+            elif kind == ADD:
+                # An ADD body is one snapshot record followed by the name it points at.
+                animals.insert(animal_from_record(unpack_record(data, body, body + RECORD_SIZE)))
+        return applied
+
+    def render(self, turn: int) -> list[str]:
+        """Display lines (Aqua.get_display_lines) of the tank at ``turn``."""
+        return self.seek(turn).get_display_lines()[0]
+
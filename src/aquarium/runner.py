@@ -0,0 +1,120 @@
+"""
+Multi-tank runner: fan independent headless tanks out over a process pool.
+
+Each TankConfig is one batch run (see batch.run_batch), optionally with
+simulation constants from config overridden (e.g. FEED_AMOUNT for a
+sweep). Seeds are derived from a base seed and the tank's index, never
+from the worker that runs it, so a sweep reproduces with any number of
+workers. Results stream back as TankResult records as tanks finish.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, Iterator, NamedTuple
+
+from . import config
+from .batch import BatchSummary, run_batch
+
+# Simulation constants a TankConfig may override.
+SWEEPABLE = ("TURNS_PER_FOOD_DECREMENT", "TURNS_PER_AGE_INCREMENT", "MAX_AGE", "FEED_AMOUNT", "STARTING_FOOD")
+
+
+class TankConfig(NamedTuple):
+    """One headless tank to run. ``settings`` holds (config name, value) overrides."""
+    width: int
+    height: int
+    population: dict
+    turns: int
+    feed_every: int = 0
+    feed_at: tuple = ()
+    seed: int | None = None
+    vectorized: bool = False
+    settings: tuple = ()
+
+
+class TankResult(NamedTuple):
+    """Outcome of one tank of a run, tagged with its position in the input."""
+    index: int
+    settings: tuple
+    summary: BatchSummary
+
+    def as_dict(self) -> dict:
+        d = {"index": self.index, "settings": dict(self.settings)}
+        d.update(self.summary.as_dict())
+        return d
+
+
+def derive_seed(base_seed: int, index: int) -> int:
+    """Seed of tank ``index`` in a run seeded with ``base_seed``."""
+    return random.Random(f"{base_seed}/{index}").getrandbits(63)
+
+
+def seeded(configs: Iterable[TankConfig], base_seed: int | None) -> list[TankConfig]:
+    """Give every config without a seed one derived from ``base_seed`` and its index (fresh seeds if None)."""
+    if base_seed is None:
+        base_seed = random.SystemRandom().getrandbits(63)
+    return [cfg if cfg.seed is not None else cfg._replace(seed=derive_seed(base_seed, i))
+            for i, cfg in enumerate(configs)]
+
+
+def sweep(base: TankConfig, replicates: int = 1, **axes) -> list[TankConfig]:
+    """
+    Configs for every combination of the given constants (e.g. FEED_AMOUNT=[5, 10]),
+    each repeated ``replicates`` times. Seed them with seeded().
+    """
+    for name in axes:
+        if name not in SWEEPABLE:
+            raise ValueError(f"cannot sweep {name!r}; expected one of {SWEEPABLE}")
+    names = list(axes)
+    configs = []
+    for values in itertools.product(*(axes[name] for name in names)):
+        settings = base.settings + tuple(zip(names, values))
+        configs.extend(base._replace(settings=settings) for _ in range(replicates))
+    return configs
+
+
+@contextlib.contextmanager
+def _overridden(settings):
+    """Temporarily set config constants (in the current process)."""
+    saved = {}
+    try:
+        for name, value in settings:
+            if name not in SWEEPABLE:
+                raise ValueError(f"cannot override {name!r}; expected one of {SWEEPABLE}")
+            saved.setdefault(name, getattr(config, name))
+            setattr(config, name, value)
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(config, name, value)
+
+
+def run_tank(index: int, cfg: TankConfig) -> TankResult:
+    """Run one tank to completion (in whichever process calls it)."""
+    with _overridden(cfg.settings):
+        summary = run_batch(cfg.width, cfg.height, cfg.population, cfg.turns, feed_every=cfg.feed_every,
+                            feed_at=cfg.feed_at, seed=cfg.seed, vectorized=cfg.vectorized)
+    return TankResult(index, cfg.settings, summary)
+
+
+def run_tanks(configs: Iterable[TankConfig], workers: int | None = None, ordered: bool = False) -> Iterator[TankResult]:
+    """
+    Run tanks across ``workers`` processes (None = one per CPU, 0 or 1 = in this process)
+    and yield their results as they finish, or in input order if ``ordered``.
+    """
+    configs = list(configs)
+    if workers is not None and workers <= 1:
+        for i, cfg in enumerate(configs):
+            yield run_tank(i, cfg)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        if ordered:
+            yield from pool.map(run_tank, range(len(configs)), configs)
+            return
+        futures = [pool.submit(run_tank, i, cfg) for i, cfg in enumerate(configs)]
+        for future in as_completed(futures):
+            yield future.result()
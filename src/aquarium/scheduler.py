@@ -0,0 +1,123 @@
+"""
+Hunger and aging scheduler for the object path of Aqua.next_turn.
+
+Every hunger turn takes one food from every animal, and every aging turn
+adds a year; feed_all gives the same amount to everyone. So instead of
+updating each animal, the scheduler keeps two global counters:
+
+    hunger      food decrements so far minus food handed out
+    age_rounds  aging turns so far
+
+and files each animal under a fixed key: food + hunger and age - age_rounds.
+An animal's food and age are derived from its key on demand. It starves on
+the decrement that brings its food to exactly 0, i.e. when hunger reaches
+its food key, and dies of old age when age_rounds reaches MAX_AGE minus its
+age key. Both are bucket lookups, so a turn only touches the animals that
+die on it and feeding is O(1).
+
+A tracked animal's ``food`` and ``age`` attributes read and write through
+the scheduler (see Animal.food), so objects handed out by Aqua are never
+stale and editing them re-keys the animal.
+"""
+
+from __future__ import annotations
+
+from . import animal, config
+from .events import EventKind
+
+
+class HungerScheduler:
+    def __init__(self):
+        self.hunger = 0
+        self.age_rounds = 0
+        self._keys = {}        # animal id -> (food key, age key)
+        self._tracked = {}     # animal id -> animal
+        self._starve_at = {}   # food key -> ids of animals that starve when hunger reaches it
+        self._age_at = {}      # age key -> ids of animals aging in step with it
+        self._last_tick_aged = False
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, a: animal.Animal):
+        self._file(a.animal_id, a.food + self.hunger, a.age - self.age_rounds)
+        self._tracked[a.animal_id] = a
+        a._hunger = self
+
+    def _file(self, animal_id: int, food_key: int, age_key: int):
+        self._keys[animal_id] = (food_key, age_key)
+        self._starve_at.setdefault(food_key, set()).add(animal_id)
+        self._age_at.setdefault(age_key, set()).add(animal_id)
+
+    def _unfile(self, animal_id: int):
+        food_key, age_key = self._keys.pop(animal_id)
+        for buckets, key in ((self._starve_at, food_key), (self._age_at, age_key)):
+            bucket = buckets[key]
+            bucket.discard(animal_id)
+            if not bucket:
+                del buckets[key]
+
+    def remove(self, a: animal.Animal):
+        """Stop tracking the animal, leaving its current food and age in the object."""
+        a._food, a._age = self.food_of(a), self.age_of(a)
+        a._hunger = None
+        self._unfile(a.animal_id)
+        del self._tracked[a.animal_id]
+
+    def rekey(self, a: animal.Animal, food: int, age: int):
+        """Set a tracked animal's food and age."""
+        self._unfile(a.animal_id)
+        self._file(a.animal_id, food + self.hunger, age - self.age_rounds)
+
+    def rebuild(self, animals):
+        """Track exactly ``animals`` (e.g. after the registry was replaced), keeping their food and age."""
+        for a in list(self._tracked.values()):
+            self.remove(a)
+        for a in animals:
+            self.add(a)
+
+    def feed(self, amount: int):
+        self.hunger -= amount
+
+    def food_of(self, a: animal.Animal) -> int:
+        return self._keys[a.animal_id][0] - self.hunger
+
+    def age_of(self, a: animal.Animal) -> int:
+        return self._keys[a.animal_id][1] + self.age_rounds
+
+    def retire(self, a: animal.Animal, cause: EventKind):
+        """Stop tracking a dying animal, leaving its final food and age in the object."""
+        self.remove(a)
+        if cause is EventKind.STARVED and self._last_tick_aged:
+            a.age -= 1  # it starved before its birthday
+
+    def ticks_until_death(self) -> tuple[int | None, int | None]:
+        """
+        (hunger ticks until the next starvation, aging ticks until the next death of old age),
+        None where nobody is due.
+        """
+        last_age = config.MAX_AGE - self.age_rounds
+        starve = min((key for key in self._starve_at if key > self.hunger), default=None)
+        old = max((key for key in self._age_at if key < last_age), default=None)
+        return (None if starve is None else starve - self.hunger,
+                None if old is None else last_age - old)
+
+    def advance(self, ticks: int, aging_ticks: int):
+        """Apply ``ticks`` hunger turns, ``aging_ticks`` of them aging turns, that kill nobody."""
+        self.hunger += ticks
+        self.age_rounds += aging_ticks
+
+    def tick(self, aging: bool) -> dict:
+        """
+        Take one food from everyone (and add a year if ``aging``).
+        Returns {animal id: EventKind.STARVED or EventKind.DIED_OF_AGE} for the animals that die.
+        """
+        self.hunger += 1
+        self._last_tick_aged = aging
+        dying = dict.fromkeys(self._starve_at.get(self.hunger, ()), EventKind.STARVED)
+        if aging:
+            # Animals that starve on this turn do not get older.
+            self.age_rounds += 1
+            for animal_id in self._age_at.get(config.MAX_AGE - self.age_rounds, ()):
+                dying.setdefault(animal_id, EventKind.DIED_OF_AGE)
+        return dying
@@ -0,0 +1,181 @@
+"""
+Binary snapshots of a whole tank.
+
+Layout (little endian), version 1:
+
+    header   magic, version, width, height, turn, next id, animal count,
+             and the offsets of the sections below
+    board    height x width bytes, one per cell
+    animals  fixed-width records (id, species code, x, y, directions, food,
+             age, name offset and length)
+    names    UTF-8 names, concatenated
+
+open_snapshot() memory-maps the file and decodes records only when they are
+accessed, so even huge snapshots open immediately. load() rebuilds an Aqua
+from it: the animals are recreated with their ids, and the crab index,
+occupancy layer and board are rebuilt from the sprites. The stored board is
+for readers of the file; it is what the tank showed when it was saved.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from typing import Iterator, NamedTuple
+
+from .aqua import Aqua
+from .species import SPECIES
+
+MAGIC = b"AQSNAP"
+VERSION = 1
+
+_HEADER = struct.Struct("<6sHIIQQQQQQ")
+_RECORD = struct.Struct("<Q2sqqbbqqQI")
+RECORD_SIZE = _RECORD.size
+
+
+class SnapshotError(ValueError):
+    """The file is not a snapshot this version can read."""
+
+
+class AnimalRecord(NamedTuple):
+    animal_id: int
+    code: str
+    x: int
+    y: int
+    directionH: int
+    directionV: int
+    food: int
+    age: int
+    name: str
+
+
+def record_of(a, name_at: int = 0) -> tuple[bytes, bytes]:
+    """(fixed-width record, encoded name) for an animal whose name starts at ``name_at`` in the name blob."""
+    name = str(a.name).encode("utf-8")
+    return _RECORD.pack(a.animal_id, a.code.encode("ascii"), a.x, a.y, a.directionH,
+                        getattr(a, "directionV", 0), a.food, a.age, name_at, len(name)), name
+
+
+def unpack_record(buffer, offset: int, names_offset: int) -> AnimalRecord:
+    (animal_id, code, x, y, dir_h, dir_v, food, age, name_at, name_len) = _RECORD.unpack_from(buffer, offset)
+    start = names_offset + name_at
+    if start + name_len > len(buffer):
+        raise SnapshotError(f"name of animal {animal_id} runs past the end of the snapshot")
+    try:
+        name = bytes(buffer[start:start + name_len]).decode("utf-8")
+        return AnimalRecord(animal_id, code.decode("ascii"), x, y, dir_h, dir_v, food, age, name)
+    except UnicodeDecodeError:
+        raise SnapshotError(f"animal record {animal_id} is corrupt") from None
+
+
+def animal_from_record(rec: AnimalRecord):
+    """Recreate the animal a record describes, with its id."""
+    a = SPECIES[rec.code].make(rec.name, rec.age, rec.x, rec.y, rec.directionH, rec.directionV)
+    a.food = rec.food
+    a.animal_id = rec.animal_id
+    return a
+
+
+def dumps(aqua: Aqua) -> bytes:
+    """The complete state of ``aqua`` as snapshot bytes."""
+    board = aqua.get_board()
+    # Read only: the animals are not handed out, so the vectorized engine keeps its columns.
+    animals = aqua.animals.as_list()
+    width, height = aqua.aqua_width, aqua.aqua_height
+
+    records, names = bytearray(), bytearray()
+    for a in animals:
+        record, name = record_of(a, len(names))
+        records += record
+        names += name
+
+    board_offset = _HEADER.size
+    records_offset = board_offset + width * height
+    names_offset = records_offset + len(records)
+    header = _HEADER.pack(MAGIC, VERSION, width, height, aqua.turn, aqua.animals.next_id, len(animals),
+                          board_offset, records_offset, names_offset)
+    return b"".join((header, board.data, records, names))
+
+
+def save(aqua: Aqua, path) -> None:
+    """Write the complete state of ``aqua`` to ``path``."""
+    with open(path, "wb") as f:
+        f.write(dumps(aqua))
+
+
+class Snapshot:
+    """A snapshot held in a buffer (normally a memory-mapped file); animal records are decoded on access."""
+
+    def __init__(self, buffer, source="snapshot"):
+        self._buffer = buffer
+        if len(buffer) < _HEADER.size:
+            raise SnapshotError(f"{source}: too short to be a snapshot")
+        (magic, version, self.width, self.height, self.turn, self.next_id, self._count,
+         self._board_offset, self._records_offset, self._names_offset) = _HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION:
+            raise SnapshotError(f"{source}: not a version {VERSION} aquarium snapshot")
+        size = len(buffer)
+        if (self._board_offset + self.width * self.height > size
+                or self._records_offset + self._count * _RECORD.size > size or self._names_offset > size):
+            raise SnapshotError(f"{source}: truncated snapshot (sections run past its {size} bytes)")
+        self._source = source
+
+    def close(self):
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> AnimalRecord:
+        if not -self._count <= i < self._count:
+            raise IndexError("animal record out of range")
+        i %= self._count
+        rec = unpack_record(self._buffer, self._records_offset + i * _RECORD.size, self._names_offset)
+        if rec.code not in SPECIES:
+            raise SnapshotError(f"{self._source}: animal record {i} has unknown species {rec.code!r}")
+        return rec
+
+    def __iter__(self) -> Iterator[AnimalRecord]:
+        for i in range(self._count):
+            yield self[i]
+
+    def board_row(self, row: int) -> str:
+        start = self._board_offset + row * self.width
+        return bytes(self._buffer[start:start + self.width]).decode("latin-1")
+
+    def restore(self, **aqua_options) -> Aqua:
+        """Build a tank in this state. ``aqua_options`` are passed to Aqua (e.g. vectorized, events)."""
+        aqua = Aqua(self.width, self.height, **aqua_options)
+        aqua.turn = self.turn
+        aqua.animals.restore([animal_from_record(rec) for rec in self], self.next_id)
+        aqua.reindex()
+        aqua._invalidate()
+        return aqua
+
+
+def open_snapshot(path) -> Snapshot:
+    """Memory-map a snapshot file."""
+    with open(path, "rb") as f:
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # an empty file cannot be mapped
+            raise SnapshotError(f"{path}: too short to be a snapshot") from None
+    try:
+        return Snapshot(buffer, path)
+    except SnapshotError:
+        buffer.close()
+        raise
+
+
+def load(path, **aqua_options) -> Aqua:
+    """Rebuild a tank from a snapshot file. ``aqua_options`` are passed to Aqua (e.g. vectorized, events)."""
+    with open_snapshot(path) as snap:
+        return snap.restore(**aqua_options)
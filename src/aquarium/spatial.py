@@ -0,0 +1,77 @@
+"""
+Spatial index for crabs on the floor strip.
+
+Crabs only bump into a neighbour whose edge touches theirs, so the index
+buckets crabs by the column of their left edge (x) and of their right edge
+(x + width). Finding the crab a moving crab would hit is then a dict lookup
+instead of a scan over every crab in the tank.
+"""
+
+from __future__ import annotations
+
+from . import config
+
+
+class CrabIndex:
+    def __init__(self):
+        self._by_left = {}   # column -> {key: order}
+        self._by_right = {}  # column -> {key: order}
+        self._entries = {}   # key -> (order, left, right)
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def add(self, key, x: int, width: int):
+        """Index a crab. Crabs added earlier win ties in blocker(), like the order of Aqua.animals."""
+        order = self._next_order
+        self._next_order += 1
+        self._insert(key, order, x, x + width)
+
+    def move(self, key, x: int, width: int):
+        """Re-index a crab after its x changed."""
+        order, left, right = self._entries[key]
+        if left == x and right == x + width:
+            return
+        self._discard(key)
+        self._insert(key, order, x, x + width)
+
+    def remove(self, key):
+        if key in self._entries:
+            self._discard(key)
+
+    def clear(self):
+        self._by_left.clear()
+        self._by_right.clear()
+        self._entries.clear()
+
+    def blocker(self, x: int, width: int, direction: int):
+        """
+        Return the first-added crab whose edge touches the side a crab at x (of the
+        given width) is walking towards, or None.
+        """
+        if direction == config.DIR_RIGHT:
+            bucket = self._by_left.get(x + width)
+        elif direction == config.DIR_LEFT:
+            bucket = self._by_right.get(x)
+        else:
+            return None
+        if not bucket:
+            return None
+        return min(bucket, key=bucket.get)
+
+    def _insert(self, key, order: int, left: int, right: int):
+        self._entries[key] = (order, left, right)
+        self._by_left.setdefault(left, {})[key] = order
+        self._by_right.setdefault(right, {})[key] = order
+
+    def _discard(self, key):
+        _, left, right = self._entries.pop(key)
+        for buckets, col in ((self._by_left, left), (self._by_right, right)):
+            bucket = buckets[col]
+            del bucket[key]
+            if not bucket:
+                del buckets[col]
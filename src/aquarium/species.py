@@ -0,0 +1,96 @@
+"""
+Species registry: one descriptor per animal type, looked up by type code.
+
+Everything that depends on the kind of animal (Aqua.add_animal, placement,
+the menu, the demo, batch runs, snapshots, the vectorized engine) reads the
+Species in SPECIES instead of comparing codes. The built-in species are
+registered in config.ANIMAL_TYPES order. register() adds one at runtime;
+installed packages can advertise a callable under the "aquarium.species"
+entry point group that does so, run by load_entry_points().
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from . import config, crab, fish, moly, ocypode, scalar, shrimp, sprites
+
+ENTRY_POINT_GROUP = "aquarium.species"
+
+
+class Species(NamedTuple):
+    code: str
+    label: str
+    cls: type        # Fish or Crab subclass; see make()
+    width: int
+    height: int
+    frames: dict     # direction -> sprites.Sprite
+
+    @property
+    def is_fish(self) -> bool:
+        return self.cls.is_fish
+
+    @property
+    def movement(self) -> type:
+        """Base class whose rules move this species (fish.Fish or crab.Crab)."""
+        return fish.Fish if self.is_fish else crab.Crab
+
+    @property
+    def zone(self) -> str:
+        """'water' (between WATERLINE and the crab rows) or 'floor' (the crab rows)."""
+        return "water" if self.is_fish else "floor"
+
+    def make(self, name, age, x, y, directionH, directionV=config.DIR_DOWN):
+        """A new, unregistered animal of this species."""
+        if self.is_fish:
+            return self.cls(name, age, x, y, directionH, directionV)
+        return self.cls(name, age, x, y, directionH)
+
+    def placement_bounds(self, aqua_width: int, aqua_height: int) -> tuple[int, int, int, int]:
+        """(x_min, x_max, y_min, y_max) of the sprite's top-left corner; crabs have one fixed row."""
+        x_min, x_max = 1, max(1, aqua_width - self.width - 1)
+        if self.is_fish:
+            y_max = max(config.WATERLINE, config.fish_lowest_y(aqua_height) - self.height)
+            return x_min, x_max, config.WATERLINE, y_max
+        top = config.crab_row_index(aqua_height, self.height, 0)
+        return x_min, x_max, top, top
+
+
+SPECIES: dict[str, Species] = {}
+
+
+def register(cls: type, label: str, art=None) -> Species:
+    """
+    Register an Animal subclass (defining code, width, height and is_fish) under its code.
+    ``art`` (right-facing sprite lines) is required unless sprites already has the code.
+    """
+    if len(cls.code) != 2 or not cls.code.isascii():
+        raise ValueError(f"species code {cls.code!r} must be two ASCII characters (snapshots store it as such)")
+    if art is not None:
+        sprites.register(cls.code, art)
+    frames = {direction: sprites.get_sprite(cls.code, direction) for direction in (config.DIR_LEFT, config.DIR_RIGHT)}
+    kind = Species(cls.code, label, cls, cls.width, cls.height, frames)
+    SPECIES[cls.code] = kind
+    return kind
+
+
+def get(code: str) -> Species | None:
+    return SPECIES.get(code)
+
+
+def load_entry_points() -> None:
+    """Call every function registered under the ENTRY_POINT_GROUP entry point group."""
+    from importlib.metadata import entry_points
+    found = entry_points()
+    if hasattr(found, "select"):
+        found = found.select(group=ENTRY_POINT_GROUP)
+    else:  # Python 3.9: a dict of group -> entry points
+        found = found.get(ENTRY_POINT_GROUP, ())
+    for entry_point in found:
+        entry_point.load()()
+
+
+_BUILTIN = {cls.code: cls for cls in (scalar.Scalar, moly.Moly, ocypode.Ocypode, shrimp.Shrimp)}
+for _info in config.ANIMAL_TYPES:
+    register(_BUILTIN[_info.code], _info.label)
+del _info
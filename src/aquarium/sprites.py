@@ -0,0 +1,80 @@
+"""
+Sprite table: every species' frames, built once at import.
+
+Each (species code, direction) maps to an immutable Sprite holding the
+interned text lines (already mirrored for left-facing animals), their
+ASCII bytes and per-row occupancy masks. Animals, placement and the
+vectorized engine look frames up here instead of rebuilding them.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import NamedTuple
+
+from . import config
+
+# Right-facing art per species code.
+_ART = {
+    "sc": (
+        '******  ',
+        '    *** ',
+        '  ******',
+        '    *** ',
+        '******  ',
+    ),
+    "mo": (
+        '*   *** ',
+        '********',
+        '*   *** ',
+    ),
+    "oc": (
+        ' *   * ',
+        '  ***  ',
+        '*******',
+        '*     *',
+    ),
+    "sh": (
+        '    * *',
+        '****** ',
+        '  * *  ',
+    ),
+}
+
+
+class Sprite(NamedTuple):
+    lines: tuple[str, ...]     # text rows, top to bottom
+    data: tuple[bytes, ...]    # the same rows as ASCII bytes
+    masks: tuple[bytes, ...]   # per row: 1 where a '*' is drawn, 0 elsewhere
+    width: int
+    height: int
+
+
+def line_mask(line: str) -> bytes:
+    """Byte mask of one sprite line: 1 for '*' cells, 0 elsewhere."""
+    return bytes(1 if c == "*" else 0 for c in line)
+
+
+def _build(lines) -> Sprite:
+    lines = tuple(sys.intern(line) for line in lines)
+    return Sprite(lines, tuple(line.encode("ascii") for line in lines),
+                  tuple(line_mask(line) for line in lines), len(lines[0]), len(lines))
+
+
+SPRITES = {}
+
+
+def register(code: str, art) -> None:
+    """Add (or replace) a species' frames from its right-facing art."""
+    SPRITES[code, config.DIR_RIGHT] = _build(art)
+    SPRITES[code, config.DIR_LEFT] = _build(line[::-1] for line in art)
+
+
+for _code, _lines in _ART.items():
+    register(_code, _lines)
+del _code, _lines
+
+
+def get_sprite(code: str, direction: int) -> Sprite:
+    """Sprite of a species facing ``direction`` (anything but DIR_LEFT faces right)."""
+    return SPRITES[code, config.DIR_LEFT if direction == config.DIR_LEFT else config.DIR_RIGHT]
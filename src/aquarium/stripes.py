@@ -0,0 +1,192 @@
+"""
+Striped engine: one wide tank stepped by several worker processes.
+
+Fish never look at the board, so the vectorized engine already updates them
+all at once; the serial part of a turn is the crabs, which interact with
+their neighbours on the floor strip. Crabs can only affect each other when
+they are close: in one turn a crab moves at most one column and reads at
+most two columns past its sprite. So each turn the crabs are cut into
+clusters separated by at least CLUSTER_GAP empty columns, and the tank into
+column stripes, one per worker; a stripe owns the clusters that start in
+it. The crab rows and crab columns live in shared memory: each worker steps
+its clusters (in animal order, with the usual rules) and writes back only
+the columns its clusters can touch. Ownership is recomputed every turn, so
+crabs walking across a stripe boundary are simply handed to the next
+worker. The result is identical to the single-process engine.
+"""
+
+from __future__ import annotations
+
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from . import config
+from .crab_zone import CrabZone
+from .engine import VectorEngine
+
+# Crabs at least this many empty columns apart cannot interact within a turn
+# (each reads up to 2 columns beyond its sprite and moves at most 1).
+CLUSTER_GAP = 6
+
+# Per-worker state: sprite tables (set once by the pool initializer) and attached shared blocks.
+_SPRITES = None
+_SIZES = None
+_ATTACHED = {}
+
+
+def crab_clusters(left, right) -> list[tuple[np.ndarray, int, int]]:
+    """
+    Group crabs (footprints [left, right)) that could interact this turn.
+    Returns (member positions in input order, leftmost column, rightmost column + 1) per cluster, left to right.
+    """
+    if not len(left):
+        return []
+    by_x = np.argsort(left, kind="stable")
+    ends = np.maximum.accumulate(right[by_x])
+    breaks = np.flatnonzero(left[by_x][1:] - ends[:-1] >= CLUSTER_GAP) + 1
+    starts = np.concatenate(([0], breaks))
+    stops = np.concatenate((breaks, [len(by_x)]))
+    return [(np.sort(by_x[a:b]), int(left[by_x[a]]), int(ends[b - 1])) for a, b in zip(starts, stops)]
+
+
+def _layout(width: int, capacity: int):
+    """Byte offsets of the zone rows and the int64 crab columns in a shared block."""
+    zone_bytes = config.MAX_CRAB_HEIGHT * width
+    zone_bytes += -zone_bytes % 8
+    return zone_bytes, capacity * 8
+
+
+def _views(buf, width: int, capacity: int):
+    """(zone rows, x, direction, species, dying, order) arrays over a shared block."""
+    zone_bytes, column_bytes = _layout(width, capacity)
+    zone = np.ndarray((config.MAX_CRAB_HEIGHT, width), dtype=np.uint8, buffer=buf)
+    columns = [np.ndarray((capacity,), dtype=np.int64, buffer=buf, offset=zone_bytes + i * column_bytes)
+               for i in range(5)]
+    return (zone, *columns)
+
+
+def _init_worker(sprites, sizes):
+    global _SPRITES, _SIZES
+    _SPRITES, _SIZES = sprites, sizes
+
+
+def _attach(name: str):
+    shm = _ATTACHED.get(name)
+    if shm is None:
+        for old in _ATTACHED.values():
+            old.close()
+        _ATTACHED.clear()
+        # Workers share the engine's resource tracker, so attaching does not take ownership.
+        shm = shared_memory.SharedMemory(name=name)
+        _ATTACHED[name] = shm
+    return shm
+
+
+def _step_stripe(name: str, width: int, height: int, capacity: int, clusters, want_events: bool) -> list:
+    """Worker: step the given clusters on a copy of the crab rows and write back their columns."""
+    zone_rows, x, d, kind, dying, order = _views(_attach(name).buf, width, capacity)
+    zone = CrabZone(width, height, rows=[bytearray(zone_rows[i].tobytes()) for i in range(config.MAX_CRAB_HEIGHT)])
+    events = []
+    for start, stop, lo, hi in clusters:
+        members = order[start:stop]
+        xs, dirs = x[members].tolist(), d[members].tolist()
+        cluster_events = [] if want_events else None
+        zone.step(xs, dirs, kind[members].tolist(), dying[members].tolist(), _SPRITES, _SIZES, cluster_events)
+        x[members], d[members] = xs, dirs
+        # Everything the cluster could have drawn on lies within one column of its footprint.
+        lo, hi = max(0, lo - 1), min(width, hi + 1)
+        for i, row in enumerate(zone.rows):
+            zone_rows[i, lo:hi] = np.frombuffer(row, dtype=np.uint8, count=hi - lo, offset=lo)
+        for kind_, k, j in cluster_events or ():
+            events.append((kind_, int(members[k]), None if j is None else int(members[j])))
+    return events
+
+
+def _unlink(shm):
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _release(pool, blocks, owner_pid: int):
+    if os.getpid() != owner_pid:
+        # A forked worker inherited this finalizer with the engine; the blocks belong to the creator.
+        return
+    if pool is not None:
+        pool.shutdown()
+    for shm in blocks:
+        shm.close()
+        _unlink(shm)
+
+
+class StripedEngine(VectorEngine):
+    def __init__(self, aqua, stripes: int):
+        super().__init__(aqua)
+        self.stripes = stripes
+        self._pool = None
+        self._shm = None
+        self._capacity = 0
+        self._blocks = []
+        self._finalizer = None
+
+    def close(self):
+        """Stop the workers and free the shared memory."""
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._pool = self._shm = None
+        self._capacity = 0
+        self._blocks = []
+
+    def _ensure_resources(self, crabs: int):
+        if crabs > self._capacity:
+            capacity = max(crabs, 2 * self._capacity, 64)
+            zone_bytes, column_bytes = _layout(self.width, capacity)
+            shm = shared_memory.SharedMemory(create=True, size=zone_bytes + 5 * column_bytes)
+            if self._shm is not None:
+                self._shm.close()
+                _unlink(self._shm)
+                self._blocks.remove(self._shm)
+            self._blocks.append(shm)
+            self._shm, self._capacity = shm, capacity
+        # Forked workers inherit the finalizer below; _release does nothing outside this process.
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.stripes, initializer=_init_worker,
+                                             initargs=(self.crab_sprites, self.sizes))
+        if self._finalizer is None:
+            self._finalizer = weakref.finalize(self, _release, self._pool, self._blocks, os.getpid())
+
+    def _step_crabs(self, crab_idx, dying, want_events: bool) -> list:
+        m = len(crab_idx)
+        if self.stripes <= 1:
+            return super()._step_crabs(crab_idx, dying, want_events)
+        self._ensure_resources(m)
+        zone_rows, x, d, kind, dead, order = _views(self._shm.buf, self.width, self._capacity)
+        for i, row in enumerate(self.zone.rows):
+            zone_rows[i] = np.frombuffer(row, dtype=np.uint8)
+        species = self.species[crab_idx]
+        x[:m], d[:m], kind[:m], dead[:m] = self.x[crab_idx], self.dir_h[crab_idx], species, dying
+
+        # Hand every cluster to the stripe its left edge falls in.
+        tasks = [[] for _ in range(self.stripes)]
+        start = 0
+        for members, lo, hi in crab_clusters(x[:m], x[:m] + self.widths[species]):
+            order[start:start + len(members)] = members
+            tasks[min(self.stripes - 1, lo * self.stripes // self.width)].append(
+                (start, start + len(members), lo, hi))
+            start += len(members)
+        futures = [self._pool.submit(_step_stripe, self._shm.name, self.width, self.height, self._capacity,
+                                     clusters, want_events)
+                   for clusters in tasks if clusters]
+        events = [e for f in futures for e in f.result()]
+
+        self.x[crab_idx], self.dir_h[crab_idx] = x[:m], d[:m]
+        self.zone.rows = [bytearray(zone_rows[i].tobytes()) for i in range(config.MAX_CRAB_HEIGHT)]
+        # Same order as one sequential pass: by crab, keeping each crab's own events in order.
+        events.sort(key=lambda e: e[1])
+        return events
@@ -5,6 +5,7 @@ Works on Windows (msvcrt) and Unix (termios/tty).
 
 from __future__ import annotations
 
+import contextlib
 import sys
 
 # Key result constants for clarity
@@ -15,6 +16,8 @@ KEY_DOWN = "down"
 KEY_ENTER = "enter"
 KEY_ESCAPE = "escape"
 
+_ARROWS = {b"\x1b[A": KEY_UP, b"\x1b[B": KEY_DOWN, b"\x1b[C": KEY_RIGHT, b"\x1b[D": KEY_LEFT}
+
 
 def clear_screen() -> None:
     """Clear the terminal screen (cross-platform)."""
@@ -123,3 +126,44 @@ def try_get_key() -> str | None:
         if not select.select([sys.stdin], [], [], 0)[0]:
             return None
         return _get_key_unix()
+
+
+@contextlib.contextmanager
+def raw_mode():
+    """
+    Keep a Unix terminal in cbreak mode (keys arrive at once, unechoed; output is unchanged)
+    until the block exits. A no-op on Windows and when stdin is not a terminal.
+    """
+    if sys.platform == "win32" or not sys.stdin.isatty():
+        yield
+        return
+    import termios
+    import tty
+    fd = sys.stdin.fileno()
+    old = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+
+
+def decode_keys(data: bytes) -> list[str]:
+    """Split raw terminal input into keys (same values as get_key(); other keys are dropped)."""
+    keys = []
+    i = 0
+    while i < len(data):
+        arrow = _ARROWS.get(data[i:i + 3])
+        if arrow is not None:
+            keys.append(arrow)
+            i += 3
+            continue
+        ch = data[i]
+        i += 1
+        if ch in (0x0D, 0x0A):
+            keys.append(KEY_ENTER)
+        elif ch == 0x1B:
+            keys.append(KEY_ESCAPE)
+        elif 32 <= ch < 127:
+            keys.append(chr(ch).lower())
+    return keys
@@ -0,0 +1,132 @@
+"""
+Camera over a tank larger than the terminal.
+
+A Viewport is a window of ``width`` board columns starting at column x, and
+as many board rows from row y on as fit in ``height`` display lines (label
+lines included). Aqua.get_display_lines/write_board and Frame.display_lines
+take one and lay out only the cells and labels inside it, so a frame costs
+what the screen holds, not what the tank holds.
+
+The view is moved with scroll() or centred on an animal with follow();
+track() re-centres it on the followed animal before each frame. Zoomed
+out (``zoom`` board cells per screen cell, from HEATMAP_ZOOM on) it shows
+population density instead of sprites (see heatmap.py), optionally
+coloured by ``colour``.
+"""
+
+from __future__ import annotations
+
+import shutil
+from typing import NamedTuple
+
+from . import config
+from .terminal_io import KEY_DOWN, KEY_LEFT, KEY_RIGHT, KEY_UP
+
+_SCROLL_KEYS = {
+    KEY_LEFT: (-config.VIEWPORT_SCROLL_COLUMNS, 0),
+    KEY_RIGHT: (config.VIEWPORT_SCROLL_COLUMNS, 0),
+    KEY_UP: (0, -config.VIEWPORT_SCROLL_ROWS),
+    KEY_DOWN: (0, config.VIEWPORT_SCROLL_ROWS),
+}
+
+
+# Colourings of the density view, cycled by the C key.
+COLOURS = (None, "species", "hunger")
+
+
+class Window(NamedTuple):
+    """The part of a board to lay out, clamped to it."""
+    x: int          # first column
+    y: int          # first row
+    width: int      # screen cells across (board columns when zoom is 1)
+    lines: int      # display lines available (board rows and label lines)
+    zoom: int = 1   # board cells per screen cell, across and down
+
+
+class Viewport:
+    def __init__(self, width: int, height: int, x: int = 0, y: int = 0):
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+        self.following = None   # id of the animal kept in view, or None
+        self.zoom = 1
+        self.colour = None      # one of COLOURS
+
+    @classmethod
+    def for_terminal(cls, reserved_lines: int = 0) -> "Viewport":
+        """A view filling the terminal, less ``reserved_lines`` lines (e.g. a footer)."""
+        view = cls(1, 1)
+        view.fit_terminal(reserved_lines)
+        return view
+
+    def fit_terminal(self, reserved_lines: int = 0):
+        """Resize to the current terminal: each cell takes two columns (glyph and space)."""
+        size = shutil.get_terminal_size()
+        self.width = max(1, (size.columns + 1) // 2)
+        self.height = max(2, size.lines - reserved_lines)
+
+    def scroll(self, dx: int, dy: int):
+        """Move the view by (dx, dy) cells; this stops following an animal."""
+        self.x += dx
+        self.y += dy
+        self.following = None
+
+    def follow(self, animal_id: int | None):
+        """Keep the animal with this id in the middle of the view (None: stop)."""
+        self.following = animal_id
+
+    def follow_next(self, aqua):
+        """Follow the animal added after the one followed now; after the last one, stop following."""
+        ids = sorted(a.animal_id for a in aqua.animals)
+        later = [i for i in ids if self.following is None or i > self.following]
+        self.following = later[0] if later else None
+
+    def track(self, aqua):
+        """Centre the view on the followed animal, if it is still in the tank."""
+        if self.following is None:
+            return
+        a = aqua.animals.get(self.following)
+        if a is None:
+            self.following = None
+            return
+        width, height = a.get_size()
+        self.x = a.x + width // 2 - self.width * self.zoom // 2
+        # Label lines take about half the display lines; the density view has none.
+        lines = self.height // 4 if self.zoom == 1 else self.height * self.zoom // 2
+        self.y = aqua._animal_top_row(a) + height // 2 - lines
+
+    def window(self, board_width: int, board_height: int) -> Window:
+        """The window clamped to a board of this size (the view itself is clamped too)."""
+        zoom = self.zoom
+        width = min(self.width, -(-board_width // zoom))
+        self.x = max(0, min(self.x, board_width - width * zoom))
+        self.y = max(0, min(self.y, board_height - 1))
+        return Window(self.x, self.y, width, self.height, zoom)
+
+    def zoom_by(self, factor: int):
+        """Zoom out (factor > 1) or in (factor < 0: by -factor) around the centre of the view."""
+        old = self.zoom
+        self.zoom = max(1, old * factor if factor > 0 else old // -factor)
+        self.x += self.width * (old - self.zoom) // 2
+        self.y += self.height * (old - self.zoom) // 2
+
+    def handle_key(self, key: str, aqua) -> bool:
+        """
+        Arrow keys scroll, F follows the next animal (see follow_next), - and + zoom out and in,
+        C cycles the density colouring. True if the key was used.
+        """
+        if key in _SCROLL_KEYS:
+            dx, dy = _SCROLL_KEYS[key]
+            self.scroll(dx * self.zoom, dy * self.zoom)
+        elif key == "f":
+            self.follow_next(aqua)
+        elif key == "-":
+            self.zoom_by(2)
+        elif key in ("+", "="):
+            self.zoom_by(-2)
+        elif key == "c":
+            self.colour = COLOURS[(COLOURS.index(self.colour) + 1) % len(COLOURS)]
+        else:
+            return False
+        return True
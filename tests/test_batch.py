@@ -0,0 +1,17 @@
+import pytest
+
+from aquarium.batch import parse_population, run_batch
+
+
+def test_parse_population():
+    assert parse_population("sc=3, mo=2,sc=1") == {"sc": 4, "mo": 2}
+    with pytest.raises(ValueError):
+        parse_population("xx=3")
+
+
+def test_run_batch_is_reproducible_and_silent(capsys):
+    first = run_batch(60, 30, {"sc": 5, "oc": 3}, 120, feed_every=40, seed=11)
+    second = run_batch(60, 30, {"sc": 5, "oc": 3}, 120, feed_every=40, seed=11)
+    assert capsys.readouterr().out == ""
+    assert first.feedings == 3
+    assert (first.placed, first.survivors) == (second.placed, second.survivors)
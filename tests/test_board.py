@@ -0,0 +1,74 @@
+import io
+import threading
+
+from aquarium import Aqua
+from aquarium.board import Board
+from aquarium.events import EventBus
+
+
+def test_rows_behave_like_lists_of_characters():
+    board = Board(6, 2)
+    board[0][1:4] = "abc"
+    board[1][2:4] = ["x", "y"]
+    board[1][0] = "|"
+    assert board[0][1] == "a"
+    assert board[0][1:4] == ["a", "b", "c"]
+    assert "y" in board[1] and "*" not in board[1]
+    assert board == [list(" abc  "), list("| xy  ")]
+    assert board.rows[0].tobytes() == b" abc  "
+    assert [row[:] for row in board] == [list(" abc  "), list("| xy  ")]
+
+
+def test_write_board_matches_display_lines():
+    aq = Aqua(40, 25, events=EventBus())
+    aq.add_animal("nemo", 3, 5, 6, 0, 1, "sc")
+    aq.add_animal("bob", 2, 20, 0, 1, 0, "oc")
+    aq.next_turn()
+    out = io.BytesIO()
+    aq.write_board(out)
+    lines, _ = aq.get_display_lines()
+    assert out.getvalue().decode("utf-8") == "".join(line + "\n" for line in lines)
+
+
+def test_animals_starting_left_of_the_tank_are_rejected():
+    aq = Aqua(40, 25, events=EventBus())
+    assert not aq.add_animal("nemo", 3, -3, 6, 0, 1, "sc")
+    assert not aq.add_animal("bob", 2, -1, 0, 1, 0, "oc")
+    assert aq.add_many({"type": ["mo"], "x": [-2], "y": [6]}).rejected == {0: "outside the tank"}
+    assert aq.add_animal("dory", 3, 0, 6, 0, 1, "mo")
+    assert [len(row) for row in aq.get_board()] == [40] * 25
+
+
+def test_fish_crossing_each_other_leave_no_trace():
+    aq = Aqua(60, 25, events=EventBus())
+    aq.add_animal("a", 3, 5, 8, 1, 0, "sc")
+    aq.add_animal("b", 3, 30, 8, 0, 0, "mo")
+    for _ in range(20):   # they swim through each other and apart again
+        aq.next_turn()
+    fresh = Aqua(60, 25, events=EventBus())
+    for a in aq.get_all_animal():
+        fresh.add_animal(a.name, a.age, a.x, a.y, a.directionH, a.directionV, a.code)
+    assert aq.get_board() == fresh.get_board()
+
+
+def test_frames_read_on_another_thread_are_complete():
+    aq = Aqua(80, 25, events=EventBus())
+    aq.add_many({"type": ["sc", "mo", "oc", "sh"] * 4})
+    aq.publish_frames()
+    expected = {aq.turn: aq.get_board().tobytes()}
+    seen = []
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            seen.append(aq.read_frame(lambda frame: (frame.turn, frame.board.tobytes())))
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    for _ in range(150):
+        aq.next_turn()
+        expected[aq.turn] = aq.get_board().tobytes()
+    done.set()
+    reader.join()
+    assert seen and all(expected[turn] == cells for turn, cells in seen)
+    assert aq.frame.turn == 150 and aq.frame.display_lines() == aq.get_display_lines()
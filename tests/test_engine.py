@@ -0,0 +1,47 @@
+import contextlib
+import io
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from aquarium import Aqua
+
+
+def _populate(aquarium, seed, count):
+    rng = random.Random(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(count):
+            code = rng.choice(["sc", "mo", "oc", "sh", "oc", "sh"])
+            y = rng.randint(3, aquarium.aqua_height - 10) if code in ("sc", "mo") else aquarium.aqua_height - 4
+            aquarium.add_animal(f"a{i}", rng.choice([1, 50, 119]), rng.randint(1, aquarium.aqua_width - 9), y,
+                                rng.randint(0, 1), rng.randint(0, 1), code)
+
+
+def _state(aquarium):
+    return [(a.name, a.x, a.y, a.directionH, getattr(a, "directionV", None), a.food, a.age)
+            for a in aquarium.get_all_animal()]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_vectorized_engine_matches_object_path(seed):
+    plain, fast = Aqua(90, 30), Aqua(90, 30, vectorized=True)
+    _populate(plain, seed, 40)
+    _populate(fast, seed, 40)
+    assert _state(plain) == _state(fast)
+
+    out_plain, out_fast = io.StringIO(), io.StringIO()
+    for turn in range(260):
+        if turn % 37 == 0:
+            plain.feed_all()
+            fast.feed_all()
+        with contextlib.redirect_stdout(out_plain):
+            plain.next_turn()
+        with contextlib.redirect_stdout(out_fast):
+            fast.next_turn()
+        if turn % 13 == 0:
+            assert fast.get_board() == plain.get_board()
+    assert _state(plain) == _state(fast)
+    assert fast.get_board() == plain.get_board()
+    assert out_fast.getvalue() == out_plain.getvalue()
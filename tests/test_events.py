@@ -0,0 +1,34 @@
+from aquarium import Aqua
+from aquarium.events import (ConsoleSink, CounterSink, EventBus, EventKind, NullSink, RingBufferSink,
+                             BatchedFileSink)
+
+
+def _starving_tank(bus):
+    aq = Aqua(40, 20, events=bus)
+    aq.add_animal("nemo", 1, 5, 5, 1, 1, "sc")
+    aq.add_animal("bob", 1, 20, 20, 1, 0, "oc")
+    for a in aq.get_all_animal():
+        a.food = 1
+    return aq
+
+
+def test_sinks_receive_only_their_kinds(tmp_path):
+    ring = RingBufferSink(kinds={EventKind.STARVED})
+    counter = CounterSink()
+    out = tmp_path / "events.jsonl"
+    to_file = BatchedFileSink(out, batch_size=2)
+    aq = _starving_tank(EventBus([NullSink(), ring, counter, to_file]))
+    aq.next_turn()
+    to_file.close()
+    assert [e.name for e in ring.events] == ["nemo", "bob"]
+    assert counter.counts["born"] == 2 and counter.counts["starved"] == 2
+    assert len(out.read_text().splitlines()) == sum(counter.counts.values())
+
+
+def test_console_sink_prints_classic_messages(capsys):
+    aq = _starving_tank(EventBus([ConsoleSink()]))
+    with aq.events.redirect():
+        aq.add_animal("again", 1, 5, 5, 1, 1, "sc")
+    assert capsys.readouterr().out == ""
+    aq.next_turn()
+    assert "the fish nemo died at the age of 1 years\nBecause he ran out of food!" in capsys.readouterr().out
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from aquarium import Aqua
+from aquarium.events import EventBus
+
+
+def _tank(seed, vectorized=False):
+    rng = random.Random(seed)
+    aq = Aqua(70, 30, vectorized=vectorized, events=EventBus())
+    for i in range(6):
+        aq.add_animal(f"f{i}", rng.randrange(1, 80), rng.randrange(1, 55), rng.randrange(3, 18),
+                      rng.randrange(2), rng.randrange(2), rng.choice(("sc", "mo")))
+    for i in range(4):
+        aq.add_animal(f"c{i}", rng.randrange(1, 80), rng.randrange(1, 55), 0, rng.randrange(2), 0,
+                      rng.choice(("oc", "sh")))
+    aq.get_animal_by_name("f0").food = 35
+    return aq
+
+
+def _state(aq):
+    return aq.turn, aq.get_board(), [(a.animal_id, a.x, a.y, a.directionH, getattr(a, "directionV", 0), a.food, a.age)
+                                     for a in aq.get_all_animal()]
+
+
+@pytest.mark.parametrize("turns", [1, 57, 400, 1500])
+def test_fast_forward_matches_stepping(turns):
+    stepped, skipped = _tank(turns), _tank(turns)
+    for _ in range(turns):
+        stepped.next_turn()
+    skipped.fast_forward(turns)
+    assert _state(skipped) == _state(stepped)
+    stepped.feed_all()
+    skipped.feed_all()
+    for _ in range(30):
+        stepped.next_turn()
+    skipped.fast_forward(30)
+    assert _state(skipped) == _state(stepped)
+
+
+def test_fast_forward_with_the_vectorized_engine():
+    pytest.importorskip("numpy")
+    stepped, skipped = _tank(3), _tank(3, vectorized=True)
+    for _ in range(300):
+        stepped.next_turn()
+    skipped.fast_forward(300)
+    assert _state(skipped) == _state(stepped)
@@ -0,0 +1,32 @@
+from aquarium import Aqua, config, heatmap
+from aquarium.events import EventBus
+from aquarium.viewport import Viewport, Window
+
+
+def test_density_counts_sprite_centres_per_cell():
+    # Two animals centred in screen cell (1, 0), one in (2, 1); zoom 2 over an 8 x 6 board.
+    census = heatmap.Census([2, 3, 5], [1, 0, 3], [0, 1, 1], [5, 1, 1])
+    lines = heatmap.density_lines(census, Window(0, 0, 10, 10, zoom=2), 8, 6)
+    shades = config.HEATMAP_SHADES
+    assert len(lines) == 3 and len(lines[0]) == 8
+    assert lines[0][2:4] == shades[-1] * 2
+    assert lines[1][4:6] == shades[-(-(len(shades) - 1) // 2)] * 2
+    assert lines[1][0] == "|" and lines[2][2] == "_"
+    coloured = heatmap.density_lines(census, Window(0, 0, 10, 10, zoom=2), 8, 6, colour="hunger")
+    assert "\033[" in coloured[0] and coloured[0].replace("\033[33m", "").replace("\033[0m", "") == lines[0]
+
+
+def test_view_switches_to_density_when_zoomed_out_or_crowded(monkeypatch):
+    aq = Aqua(120, 30, events=EventBus())
+    aq.add_many({"type": ["sc", "mo", "oc", "sh"] * 6, "x": list(range(3, 99, 4)),
+                 "y": [4 + 3 * (i % 6) for i in range(24)]})
+    view = Viewport(60, 40)
+    assert aq.get_view_lines(view) == aq.get_display_lines(view)[0]
+    view.handle_key("-", aq)
+    zoomed = aq.get_view_lines(view)
+    assert view.zoom == config.HEATMAP_ZOOM and len(zoomed) == 15
+    assert aq.publish().view_lines(view) == zoomed
+    monkeypatch.setattr(config, "HEATMAP_POPULATION", 10)
+    frame = aq.publish()
+    assert frame.board is None and len(frame.census.x) == len(aq.animals) > 10
+    assert frame.view_lines() == aq.get_view_lines()
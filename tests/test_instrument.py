@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from aquarium import Aqua
+from aquarium.events import EventBus
+
+
+def _tank(**options):
+    aq = Aqua(60, 30, events=EventBus(), **options)
+    aq.add_many({"type": ["sc", "mo", "oc", "sh"] * 3})
+    return aq
+
+
+def test_instruments_time_phases_and_count_events():
+    plain, measured = _tank(), _tank()
+    instruments = measured.instrument()
+    for _ in range(60):
+        plain.next_turn()
+        measured.next_turn()
+    assert measured.get_board() == plain.get_board()
+    snap = json.loads(instruments.to_json())
+    assert snap["ticks"] == 60
+    assert {"hunger", "vertical", "horizontal", "collisions", "redraw"} <= set(snap["phases"])
+    assert snap["phases"]["redraw"]["calls"] == 1   # composited once, when the board was read
+    counters = snap["counters"]
+    assert counters["bounces"] > 0 and counters["deaths"] == 12 and counters["cell_writes"] > 0
+    assert 0 < instruments.percentile(50) <= instruments.percentile(99) <= snap["tick_max_seconds"]
+    text = instruments.to_prometheus()
+    assert 'aquarium_tick_seconds_bucket{le="+Inf"} 60' in text
+    assert "aquarium_deaths_total 12" in text
+
+    instruments.detach()
+    assert "next_turn" not in vars(measured) and measured.instruments is None
+    measured.next_turn()
+    assert instruments.ticks == 60
+
+
+def test_instruments_on_the_vectorized_engine():
+    pytest.importorskip("numpy")
+    aq = _tank(vectorized=True)
+    instruments = aq.instrument()
+    for _ in range(5):
+        aq.next_turn()
+    aq.get_board()
+    assert {"fish", "crabs", "redraw"} <= set(instruments.phases)
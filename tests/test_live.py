@@ -0,0 +1,33 @@
+import asyncio
+import io
+
+from aquarium.live import LiveRun
+from aquarium.renderer import DiffRenderer
+
+
+def _run(steps, keys=(), steps_per_second=2000.0, fps=50.0):
+    played = []
+
+    async def go():
+        queue = asyncio.Queue()
+        for key in keys:
+            queue.put_nowait(key)
+        live = LiveRun(steps, played.append, lambda done, paused: [f"{done} {paused}"], steps_per_second, fps,
+                       renderer=DiffRenderer(io.StringIO()), keys=queue)
+        return live, await live.run()
+
+    live, completed = asyncio.run(go())
+    return live, completed, played
+
+
+def test_simulation_rate_is_independent_of_frame_rate():
+    live, completed, played = _run(200)
+    assert completed
+    assert played == list(range(200))
+    assert 1 <= live.frames < 20   # ~0.1 s of turns at 50 frames per second
+
+
+def test_quit_and_pause_stop_the_simulation():
+    live, completed, played = _run(200, keys="pq")
+    assert not completed
+    assert played == [] and live.paused
@@ -0,0 +1,37 @@
+import contextlib
+import io
+import random
+
+from aquarium import Aqua
+
+
+def _board_is_free(aquarium, x, y, w, h):
+    """The original glyph scan that check_if_free used to do."""
+    for row_idx in range(max(0, y), min(aquarium.aqua_height, y + h)):
+        if '*' in aquarium.board[row_idx][max(0, x):min(aquarium.aqua_width, x + w)]:
+            return False
+    return True
+
+
+def test_occupancy_matches_board_glyphs():
+    rng = random.Random(7)
+    aquarium = Aqua(80, 30)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(30):
+            code = rng.choice(["sc", "mo", "oc", "sh"])
+            aquarium.add_animal(f"a{i}", 1, rng.randint(1, 70), rng.randint(3, 20), rng.randint(0, 1),
+                                rng.randint(0, 1), code)
+        for _ in range(25):
+            aquarium.next_turn()
+    for _ in range(500):
+        w, h = rng.randint(4, 9), rng.randint(1, 6)
+        x, y = rng.randint(-3, 80), rng.randint(-3, 30)
+        assert aquarium.check_if_free(x, y, w, h) == _board_is_free(aquarium, x, y, w, h)
+
+
+def test_find_blocker_reports_animal():
+    aquarium = Aqua(50, 30)
+    aquarium.add_animal("Nemo", 5, 10, 10, 1, 0, "sc")
+    assert aquarium.find_blocker(12, 11, 3, 3).name == "Nemo"
+    assert aquarium.find_blocker(30, 11, 3, 3) is None
+    assert aquarium.add_animal("Dory", 5, 12, 11, 1, 0, "mo") is False
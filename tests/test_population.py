@@ -0,0 +1,52 @@
+import json
+import random
+
+from aquarium import Aqua
+from aquarium.events import EventBus
+
+
+def _spec(seed, n):
+    rng = random.Random(seed)
+    columns = {"type": [], "name": [], "age": [], "x": [], "y": [], "directionH": [], "directionV": []}
+    for i in range(n):
+        code = rng.choice(["sc", "mo", "oc", "sh", "xx"])
+        columns["type"].append(code)
+        columns["name"].append(f"a{i}")
+        columns["age"].append(rng.randint(1, 20))
+        columns["x"].append(rng.randint(1, 70))
+        columns["y"].append(rng.randint(3, 20) if code in ("sc", "mo") else 21)
+        columns["directionH"].append(rng.randint(0, 1))
+        columns["directionV"].append(rng.randint(0, 1))
+    return columns
+
+
+def _state(aq):
+    return aq.get_board(), [(a.animal_id, a.name, a.x, a.y) for a in aq.get_all_animal()]
+
+
+def test_add_many_accepts_exactly_what_add_animal_would():
+    spec = _spec(4, 120)
+    one_by_one, bulk = Aqua(80, 30, events=EventBus()), Aqua(80, 30, events=EventBus())
+    accepted = [i for i, row in enumerate(zip(*(spec[k] for k in ("name", "age", "x", "y", "directionH",
+                                                                    "directionV", "type"))))
+                if one_by_one.add_animal(*row)]
+    result = bulk.add_many(spec)
+    assert _state(bulk) == _state(one_by_one)
+    assert sorted(result.rejected) == sorted(set(range(120)) - set(accepted))
+    assert result.rejected[next(i for i, code in enumerate(spec["type"]) if code == "xx")] == "unknown type 'xx'"
+    for _ in range(20):
+        one_by_one.next_turn()
+        bulk.next_turn()
+    assert _state(bulk) == _state(one_by_one)
+
+
+def test_packing_fills_free_spots_from_a_file(tmp_path):
+    path = tmp_path / "tank.jsonl"
+    path.write_text("".join(json.dumps({"type": code}) + "\n" for code in ["sc"] * 500 + ["oc"] * 50))
+    aq = Aqua(60, 30, events=EventBus())
+    result = aq.populate(path)
+    assert len(result.added) == len(aq.animals) and result.rejected
+    for a in aq.get_all_animal():   # nobody overlaps: each one still fits where it stands
+        aq.delete_animal_from_board(a)
+        assert aq.check_if_free(a.x, a.y if a.is_fish else aq.aqua_height - 4, width=a.width, height=a.height)
+        aq.print_animal_on_board(a)
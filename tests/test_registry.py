@@ -0,0 +1,33 @@
+from aquarium import Aqua, config, moly
+from aquarium.registry import AnimalRegistry
+
+
+def test_removal_during_iteration_and_stable_ids():
+    reg = AnimalRegistry()
+    fishes = [moly.Moly(f"m{i % 3}", 1, 1, 5, config.DIR_RIGHT, 0) for i in range(10)]
+    for a in fishes:
+        reg.add(a)
+    seen = []
+    for a in reg:
+        seen.append(a.animal_id)
+        if a.animal_id % 2:
+            reg.remove(a)
+        reg.remove(fishes[9])
+    assert seen == list(range(1, 10))
+    assert [a.animal_id for a in reg] == [2, 4, 6, 8]
+    reg.compact()
+    assert reg.get(6) is fishes[5] and reg.get(5) is None and len(reg) == 4
+    assert [a.animal_id for a in reg.by_name("m0")] == [4]
+    assert reg.add(moly.Moly("new", 1, 1, 5, 0, 0)) == 11
+
+
+def test_aqua_lookups_and_mass_starvation():
+    aq = Aqua(200, 30)
+    for i in range(20):
+        aq.add_animal(f"f{i}", 1, 1 + 9 * i, 5, 1, 0, "mo")
+    assert aq.get_animal_by_name("f3") is aq.get_animal_by_id(4)
+    for a in aq.get_all_animal()[::2]:
+        a.food = 1
+    aq.next_turn()
+    assert [a.name for a in aq.get_all_animal()] == [f"f{i}" for i in range(1, 20, 2)]
+    assert aq.get_animal_by_name("f0") is None
@@ -0,0 +1,45 @@
+import io
+import re
+
+from aquarium.renderer import DiffRenderer
+
+_MOVE = re.compile(r"\x1b\[(\d+);(\d+)H")
+
+
+def _apply(screen, output):
+    """Replay the cursor-move/write/clear-line sequences of a partial frame onto a list of lines."""
+    row = col = 0
+    pos = 0
+    while pos < len(output):
+        m = _MOVE.match(output, pos)
+        if m:
+            row, col = int(m.group(1)) - 1, int(m.group(2)) - 1
+            pos = m.end()
+        elif output.startswith("\x1b[K", pos):
+            screen[row] = screen[row][:col]
+            pos += 3
+        else:
+            line = screen[row] if row < len(screen) else ""
+            line = line.ljust(col)
+            screen[row] = line[:col] + output[pos] + line[col + 1:]
+            col += 1
+            pos += 1
+
+
+def test_diff_frames_reproduce_new_frame():
+    stream = io.StringIO()
+    renderer = DiffRenderer(stream)
+    first = ["|  ***   ~~~~  |", "|              |", "status: one"]
+    renderer.render(first)
+    assert stream.getvalue().startswith("\x1b[2J")
+
+    second = ["|   ***  ~~~~  |", "|              |", "status: two words"]
+    stream.seek(0)
+    stream.truncate()
+    renderer.render(second)
+    output = stream.getvalue()
+    assert "\x1b[2J" not in output
+    assert len(output) < len("\n".join(second))
+    screen = list(first) + [""]
+    _apply(screen, output)
+    assert screen[:3] == second
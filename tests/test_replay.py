@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from aquarium import Aqua
+from aquarium.events import EventBus
+from aquarium.replay import ReplayLog, ReplayRecorder
+
+
+def _state(aquarium):
+    return [(a.animal_id, a.name, a.x, a.y, a.directionH, getattr(a, "directionV", None), a.food, a.age)
+            for a in aquarium.get_all_animal()]
+
+
+def test_seek_reproduces_every_recorded_turn(tmp_path):
+    rng = random.Random(3)
+    aq = Aqua(100, 30, events=EventBus())
+    path = tmp_path / "run.aqlog"
+    expected = {}
+    with ReplayRecorder(aq, path, keyframe_every=25):
+        for turn in range(130):
+            if turn % 17 == 0:
+                code = rng.choice(["sc", "mo", "oc", "sh"])
+                aq.add_animal(f"n{turn}", rng.choice([1, 119]), rng.randint(1, 90), rng.randint(3, 18),
+                              rng.randint(0, 1), rng.randint(0, 1), code)
+            if turn % 40 == 39:
+                aq.feed_all()
+            expected[aq.turn] = (_state(aq), [row[:] for row in aq.get_board()], aq.get_display_lines()[0])
+            aq.next_turn()
+    expected[aq.turn] = (_state(aq), [row[:] for row in aq.get_board()], aq.get_display_lines()[0])
+
+    with ReplayLog(path) as log:
+        assert (log.first_turn, log.last_turn) == (0, 130)
+        for turn in range(131):
+            state, board, lines = expected[turn]
+            tank = log.seek(turn)
+            assert _state(tank) == state
+            assert tank.get_board() == board
+            assert log.render(turn) == lines
+
+
+def test_recording_keeps_the_vectorized_engine_columns(tmp_path):
+    pytest.importorskip("numpy")
+    aq = Aqua(100, 30, vectorized=True, events=EventBus())
+    aq.add_many({"type": ["sc", "mo", "oc", "sh"] * 5})
+    plain = Aqua(100, 30, events=EventBus())
+    plain.add_many({"type": ["sc", "mo", "oc", "sh"] * 5})
+    gathers = []
+    gather = aq.engine.gather
+    aq.engine.gather = lambda: gathers.append(aq.turn) or gather()
+    path = tmp_path / "run.aqlog"
+    with ReplayRecorder(aq, path, keyframe_every=1000):
+        for _ in range(30):
+            aq.next_turn()
+            plain.next_turn()
+    assert gathers == [0]
+    with ReplayLog(path) as log:
+        assert _state(log.seek(30)) == _state(plain)
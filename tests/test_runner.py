@@ -0,0 +1,24 @@
+import pytest
+
+from aquarium import config
+from aquarium.runner import TankConfig, run_tanks, seeded, sweep
+
+
+def _outcome(result):
+    s = result.summary
+    return result.index, result.settings, s.seed, s.placed, s.survivors, s.deaths
+
+
+def test_results_do_not_depend_on_worker_count():
+    base = TankConfig(60, 30, {"sc": 4, "sh": 2}, 150, feed_every=40)
+    configs = seeded(sweep(base, replicates=2, FEED_AMOUNT=[10, 1]), base_seed=7)
+    assert [c.settings for c in configs] == [(("FEED_AMOUNT", 10),)] * 2 + [(("FEED_AMOUNT", 1),)] * 2
+    inline = sorted(map(_outcome, run_tanks(configs, workers=1)))
+    pooled = sorted(map(_outcome, run_tanks(configs, workers=2)))
+    assert inline == pooled
+    assert config.FEED_AMOUNT == 10  # overrides are undone after each tank
+
+
+def test_sweep_rejects_unknown_constants():
+    with pytest.raises(ValueError):
+        sweep(TankConfig(60, 30, {}, 10), WATERLINE_ROW=[2])
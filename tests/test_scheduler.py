@@ -0,0 +1,44 @@
+from aquarium import Aqua, config
+from aquarium.events import EventBus, RingBufferSink
+
+
+def test_food_and_age_follow_the_turn_rules():
+    log = RingBufferSink()
+    aq = Aqua(60, 30, events=EventBus([log]))
+    aq.add_animal("young", 5, 5, 5, 1, 0, "sc")
+    aq.add_animal("old", config.MAX_AGE - 1, 20, 5, 1, 0, "mo")
+    aq.add_animal("hungry", 3, 35, 5, 1, 0, "sc")
+    aq.get_animal_by_name("hungry").food = 1   # edits to handed-out objects are picked up
+    aq.next_turn()                              # turn 0: hunger and aging turn
+    assert [(e.kind.value, e.name, e.age) for e in log.events if e.kind.value != "bounced"] == [
+        ("born", "young", 5), ("born", "old", config.MAX_AGE - 1), ("born", "hungry", 3),
+        ("aged", "young", 6), ("died_of_age", "old", config.MAX_AGE), ("starved", "hungry", 3)]
+    young = aq.get_animal_by_name("young")
+    assert (young.food, young.age) == (config.STARTING_FOOD - 1, 6)
+    for _ in range(19):
+        aq.next_turn()
+    aq.feed_all()
+    assert aq.get_animal_by_name("young").food == config.STARTING_FOOD - 2 + config.FEED_AMOUNT
+
+
+def test_handed_out_animals_stay_current_through_turns_and_feeding():
+    aq = Aqua(60, 30, events=EventBus())
+    aq.add_animal("nemo", 1, 5, 5, 1, 0, "sc")
+    nemo = aq.get_animal_by_name("nemo")
+    for _ in range(25):
+        aq.next_turn()
+    assert nemo.food == config.STARTING_FOOD - 3 and nemo.get_age() == 2
+    aq.feed_all()
+    assert nemo.get_food() == config.STARTING_FOOD - 3 + config.FEED_AMOUNT
+    nemo.food = 1                               # edits re-key the animal: it starves on the next hunger turn
+    for _ in range(config.TURNS_PER_FOOD_DECREMENT):
+        aq.next_turn()
+    assert not nemo.get_alive() and aq.get_all_animal() == []
+
+
+def test_drop_food_menu_reports_the_new_food(capsys):
+    import main
+    aq = Aqua(60, 30, events=EventBus())
+    aq.add_animal("nemo", 1, 5, 5, 1, 0, "sc")
+    main.do_feed(aq)
+    assert f"nemo: {config.STARTING_FOOD} → {config.STARTING_FOOD + config.FEED_AMOUNT} food" in capsys.readouterr().out
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from aquarium import Aqua
+from aquarium.events import EventBus
+from aquarium.snapshot import SnapshotError, load, open_snapshot, save
+
+
+def _state(aquarium):
+    return [(a.animal_id, type(a), a.name, a.x, a.y, a.directionH, getattr(a, "directionV", None), a.food, a.age)
+            for a in aquarium.get_all_animal()]
+
+
+def test_snapshot_round_trip_continues_identically(tmp_path):
+    rng = random.Random(8)
+    original = Aqua(120, 30, events=EventBus())
+    for i in range(40):
+        code = rng.choice(["sc", "mo", "oc", "sh"])
+        original.add_animal(f"ä{i}", rng.randint(1, 100), rng.randint(1, 110), rng.randint(3, 18),
+                            rng.randint(0, 1), rng.randint(0, 1), code)
+    for _ in range(35):
+        original.next_turn()
+    path = tmp_path / "tank.aqs"
+    save(original, path)
+
+    with open_snapshot(path) as snap:
+        assert (snap.width, snap.height, snap.turn, len(snap)) == (120, 30, 35, len(original.get_all_animal()))
+        assert snap[-1].name == original.get_all_animal()[-1].name
+
+    restored = load(path, events=EventBus())
+    assert restored.get_board() == original.get_board()
+    assert _state(restored) == _state(original)
+    assert all(restored.check_if_free(x, y, 8, 5) == original.check_if_free(x, y, 8, 5)
+               for x in range(0, 120, 3) for y in range(0, 30, 2))
+    assert restored.occupancy.masks == original.occupancy.masks
+    for tank in (original, restored):
+        tank.add_animal("late", 1, 50, 5, 1, 0, "mo")
+        for _ in range(60):
+            tank.next_turn()
+    assert restored.get_board() == original.get_board()
+    assert _state(restored) == _state(original)
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "junk.aqs"
+    path.write_bytes(b"not a snapshot at all" * 10)
+    with pytest.raises(SnapshotError):
+        open_snapshot(path)
+
+
+def test_rejects_empty_and_truncated_files(tmp_path):
+    aq = Aqua(60, 20, events=EventBus())
+    aq.add_animal("nemo", 1, 5, 5, 1, 0, "sc")
+    aq.add_animal("bob", 1, 20, 5, 1, 0, "oc")
+    path = tmp_path / "tank.aqs"
+    save(aq, path)
+    data = path.read_bytes()
+    for size in (0, 10, len(data) // 2, len(data) - 30, len(data) - 1):
+        path.write_bytes(data[:size])
+        with pytest.raises(SnapshotError):
+            with open_snapshot(path) as snap:
+                list(snap)
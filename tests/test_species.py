@@ -0,0 +1,36 @@
+from aquarium import Aqua, config, fish, species, sprites
+from aquarium.events import EventBus
+from aquarium.snapshot import Snapshot, dumps
+
+
+class Guppy(fish.Fish):
+    __slots__ = ()
+
+    code = "gu"
+    width = 4
+    height = 2
+
+
+def test_builtin_species_follow_the_menu_order():
+    assert [kind.code for kind in species.SPECIES.values()] == [info.code for info in config.ANIMAL_TYPES]
+    scalar = species.get("sc")
+    assert (scalar.width, scalar.height, scalar.zone) == (config.SCALAR_WIDTH, config.SCALAR_HEIGHT, "water")
+    assert species.get("sh").placement_bounds(50, 25) == (1, 42, 21, 21)
+
+
+def test_species_registered_at_runtime_can_live_in_a_tank():
+    species.register(Guppy, "Guppy", art=("*** ", " ***"))
+    try:
+        aq = Aqua(50, 25, events=EventBus())
+        assert aq.add_animal("g", 3, 10, 100, 1, 0, "gu")
+        guppy = aq.get_animal_by_name("g")
+        assert guppy.y == config.fish_lowest_y(25) - Guppy.height
+        for _ in range(5):
+            aq.next_turn()
+        restored = Snapshot(dumps(aq)).restore(events=EventBus())
+        assert restored.get_board() == aq.get_board()
+        assert type(restored.get_animal_by_name("g")) is Guppy
+    finally:
+        del species.SPECIES["gu"]
+        for direction in (config.DIR_LEFT, config.DIR_RIGHT):
+            del sprites.SPRITES["gu", direction]
@@ -0,0 +1,25 @@
+from aquarium import config, moly, ocypode, scalar, shrimp
+from aquarium.sprites import SPRITES, get_sprite
+
+
+def test_sprites_are_mirrored_and_match_species_sizes():
+    for cls, args in ((scalar.Scalar, (0,)), (moly.Moly, (0,)), (ocypode.Ocypode, ()), (shrimp.Shrimp, ())):
+        right = cls("a", 1, 1, 1, config.DIR_RIGHT, *args)
+        left = cls("b", 1, 1, 1, config.DIR_LEFT, *args)
+        assert (right.get_sprite().height, right.get_sprite().width) == right.get_size()
+        assert list(left.get_animal()) == [line[::-1] for line in right.get_animal()]
+        # Looked up, not rebuilt.
+        assert right.get_animal() is SPRITES[cls.code, config.DIR_RIGHT].lines
+
+
+def test_masks_mark_star_cells():
+    sprite = get_sprite("mo", config.DIR_LEFT)
+    for line, mask in zip(sprite.lines, sprite.masks):
+        assert [c == "*" for c in line] == [bool(b) for b in mask]
+
+
+def test_animals_are_slotted_with_class_level_sizes():
+    a = shrimp.Shrimp("s", 1, 1, 1, config.DIR_LEFT)
+    assert not hasattr(a, "__dict__")
+    assert "width" not in shrimp.Shrimp.__slots__ and a.get_size() == (config.SHRIMP_HEIGHT, config.SHRIMP_WIDTH)
+    assert scalar.Scalar.is_fish and not a.is_fish
@@ -0,0 +1,72 @@
+import gc
+import os
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from aquarium import Aqua
+from aquarium.events import EventBus, RingBufferSink
+
+
+def _populate(aquarium, seed, count):
+    rng = random.Random(seed)
+    for i in range(count):
+        code = rng.choice(["sc", "mo", "oc", "sh", "oc", "sh", "oc", "sh"])
+        y = rng.randint(3, aquarium.aqua_height - 10) if code in ("sc", "mo") else aquarium.aqua_height - 4
+        aquarium.add_animal(f"a{i}", rng.choice([1, 50, 119]), rng.randint(0, aquarium.aqua_width - 9), y,
+                            rng.randint(0, 1), rng.randint(0, 1), code)
+
+
+def _state(aquarium):
+    return [(a.animal_id, a.x, a.y, a.directionH, a.food, a.age) for a in aquarium.get_all_animal()]
+
+
+@pytest.mark.parametrize("seed", [4, 5])
+def test_striped_tank_matches_single_process(seed):
+    single_log, striped_log = RingBufferSink(10 ** 6), RingBufferSink(10 ** 6)
+    plain = Aqua(400, 30, events=EventBus())
+    single = Aqua(400, 30, events=EventBus([single_log]), vectorized=True)
+    striped = Aqua(400, 30, events=EventBus([striped_log]), stripes=3)
+    tanks = (plain, single, striped)
+    try:
+        for tank in tanks:
+            _populate(tank, seed, 150)
+        for turn in range(120):
+            for tank in tanks:
+                if turn % 45 == 0:
+                    tank.feed_all()
+                tank.next_turn()
+            if turn % 20 == 0:
+                assert striped.get_board() == plain.get_board()
+        assert striped.get_board() == plain.get_board()
+        assert _state(striped) == _state(plain)
+        assert list(striped_log.events) == list(single_log.events)
+    finally:
+        striped.engine.close()
+
+
+def test_striped_engines_back_to_back_keep_their_shared_memory():
+    kept = []
+    for seed in range(9):
+        tank = Aqua(200, 30, events=EventBus(), stripes=2)
+        _populate(tank, seed, 40)
+        for _ in range(3):
+            tank.next_turn()
+        assert len(_state(tank)) == len(tank.animals)
+        if seed % 3 == 0:
+            tank.close()
+        elif seed % 3 == 1:
+            kept.append(tank)   # still running while the next engines start and stop
+        gc.collect()            # the others are freed by their finalizers
+    if hasattr(os, "fork"):
+        # A finalizer run in a forked copy of the process must leave the blocks alone.
+        pid = os.fork()
+        if pid == 0:
+            kept[0].engine._finalizer()
+            os._exit(0)
+        os.waitpid(pid, 0)
+    for tank in kept:
+        tank.next_turn()
+        tank.close()
@@ -0,0 +1,56 @@
+from aquarium import Aqua
+from aquarium.events import EventBus
+from aquarium.viewport import Viewport
+
+
+def _tank():
+    aq = Aqua(300, 40, events=EventBus())
+    aq.add_many({"type": ["sc", "mo", "oc", "sh"] * 10, "x": list(range(5, 285, 7)),
+                 "y": [4 + 3 * (i % 8) for i in range(40)]})
+    for _ in range(3):
+        aq.next_turn()
+    return aq
+
+
+def test_viewport_lays_out_only_the_window():
+    aq = _tank()
+    full, full_rows = aq.get_display_lines()
+    view = Viewport(30, 20, x=100, y=10)
+    lines, rows = aq.get_display_lines(view)
+    assert len(lines) <= 20 and rows[-1] >= 10 + len(lines) // 2
+    for line, row in zip(lines, rows):
+        if row >= 0:
+            assert line == full[full_rows.index(row)][200:259]
+    assert aq.publish().display_lines(view) == (lines, rows)
+    labels = [line for line, row in zip(lines, rows) if row < 0]
+    assert labels and all(len(line) == 59 for line in labels)
+
+
+def test_scrolling_is_clamped_and_following_centres_the_animal():
+    aq = _tank()
+    view = Viewport(40, 30)
+    view.scroll(-50, -50)
+    lines, rows = aq.get_display_lines(view)
+    assert (view.x, view.y) == (0, 0) and lines[0].startswith("|")
+    view.scroll(10 ** 6, 0)
+    aq.get_display_lines(view)
+    assert view.x == 300 - 40
+    target = aq.get_all_animal()[20]
+    view.follow(target.animal_id)
+    aq.get_display_lines(view)
+    assert view.x <= target.x < view.x + 40 and view.following == target.animal_id
+
+
+def test_labels_of_covered_and_far_left_animals_are_laid_out():
+    aq = Aqua(120, 30, events=EventBus())
+    aq.add_animal("under", 2, 39, 10, 1, 0, "mo")
+    aq.add_animal("over", 3, 60, 9, 1, 0, "sc")
+    aq.add_animal("a_fish_with_a_really_quite_remarkably_long_name", 4, 5, 20, 1, 0, "mo")
+    aq.get_animal_by_name("over").x = 39                    # swims over the moly
+    aq.reindex()
+    under = aq.get_animal_by_name("under").animal_id
+    assert not any(under in row for row in aq.occupancy.owners)
+    assert aq.get_display_lines(Viewport(120, 10 ** 6)) == aq.get_display_lines()
+    lines, rows = aq.get_display_lines(Viewport(20, 30, x=25, y=0))
+    assert any("name (4)" in line for line, row in zip(lines, rows) if row < 0)
+    assert aq.publish().display_lines(Viewport(20, 30, x=25, y=0)) == (lines, rows)